@@ -7,6 +7,8 @@ from pathlib import Path
 
 import pydantic as pdt
 
+_PREDICTION_SUFFIXES = (".pkl", ".parquet")
+
 
 class ArtifactLayout(pdt.BaseModel):
     """Return standard artifact paths under a caller-supplied root."""
@@ -39,10 +41,16 @@ class ArtifactLayout(pdt.BaseModel):
         split_name = _validate_path_segment(split, field_name="split")
         return self.models_dir() / f"fold_{fold_id}" / "dmatrix" / f"{split_name}.parquet"
 
-    def prediction_path(self, *, model_name: str, split: str, fold_id: int = 0) -> Path:
-        """Return a model prediction artifact path."""
+    def prediction_path(self, *, model_name: str, split: str, fold_id: int = 0, suffix: str = ".pkl") -> Path:
+        """Return a model prediction artifact path.
+
+        Use ``suffix=".parquet"`` for prediction frames that are read back chunk by chunk.
+        """
         split_name = _validate_path_segment(split, field_name="split")
-        return self._model_fold_dir(model_name=model_name, fold_id=fold_id) / "preds" / f"{split_name}.pkl"
+        if suffix not in _PREDICTION_SUFFIXES:
+            msg = f"Unsupported prediction artifact suffix: {suffix}. Supported suffixes: {list(_PREDICTION_SUFFIXES)}."
+            raise ValueError(msg)
+        return self._model_fold_dir(model_name=model_name, fold_id=fold_id) / "preds" / f"{split_name}{suffix}"
 
     def stack_matrix_path(self, *, ensemble_name: str, split: str) -> Path:
         """Return a stack matrix artifact path."""
@@ -8,7 +8,7 @@ from mltools.data.transformers.base import BaseTransformer
 class Blender(BaseTransformer):
     """Blend multiple columns using configured weights."""
 
-    def __init__(self, weights: list[float], cols: list[float], out_col: str = "blend", *, normalize: bool = True):
+    def __init__(self, weights: list[float], cols: list[str], out_col: str = "blend", *, normalize: bool = True):
         self._validate_weights(weights)
         sum_weights = sum(weights)
         self.weights = [w / sum_weights for w in weights] if normalize else weights
@@ -4,23 +4,37 @@ import numpy as np
 import pandas as pd
 
 import mltools.data.utils.validation.schema as mts
-
-_FLOAT_DTYPES = [f"float{x}" for x in [8, 16, 32, 64]]
-_INT_DTYPES = [f"int{x}" for x in [8, 16, 32, 64]]
+from mltools.data.utils.validation.compiled import (
+    ColumnReport,
+    CompiledColumn,
+    CompiledSchema,
+    DtypeCheck,
+    ValidationReport,
+    check_dtype,
+    compile_schema,
+    dtype_matches,
+)
+from mltools.data.utils.validation.inference import ColumnProfile, infer_schema
+from mltools.data.utils.validation.streaming import validate_parquet
+
+__all__ = [
+    "ColumnProfile",
+    "ColumnReport",
+    "CompiledColumn",
+    "CompiledSchema",
+    "DtypeCheck",
+    "ValidationReport",
+    "check_dtype",
+    "compile_schema",
+    "dtype_matches",
+    "infer_schema",
+    "validate_data",
+    "validate_parquet",
+]
 
 
 def _validate_dtype(col: pd.Series, s: mts.SchemaObj) -> bool:
-    if col.dtype != s.dtype and s.dtype not in _FLOAT_DTYPES:
-        return False
-    if col.dtype != s.dtype and s.dtype in _FLOAT_DTYPES and col.dtype not in _INT_DTYPES:
-        if col.dtype == "object":
-            try:
-                col.astype("float64")
-            except ValueError:
-                return False
-        else:
-            return False
-    return True
+    return dtype_matches(col, s.dtype)
 
 
 def _illegal_values_idx(col: pd.Series, s: mts.SchemaObj) -> pd.Series:
@@ -37,13 +51,10 @@ def _illegal_values_idx(col: pd.Series, s: mts.SchemaObj) -> pd.Series:
     pd.Series
         A series of indices with illegal values.
     """
-    sers = []
-    if len(s.valid_vals) == 0:
+    mask = CompiledColumn(s).valid_mask(col, check_dtype(col, s.dtype).values)
+    if mask is None:
         return pd.Series([], dtype="float64")
-    for chk in s.valid_vals:
-        sers.append(pd.Series(chk.contains(col)))
-    cond_df = pd.concat(sers, axis=1).sum(axis=1)
-    return pd.Series(cond_df[cond_df == 0].index)
+    return pd.Series(np.flatnonzero(~mask))
 
 
 def _illegal_values(col: pd.Series, s: mts.SchemaObj) -> pd.Series:
@@ -54,7 +65,7 @@ def _illegal_values(col: pd.Series, s: mts.SchemaObj) -> pd.Series:
     return illegal_vals
 
 
-def validate_data(data: pd.DataFrame, schema: list[mts.SchemaObj]) -> list[str]:
+def validate_data(data: pd.DataFrame, schema: list[mts.SchemaObj], *, max_workers: int | None = None) -> list[str]:
     """
     Validate that all columns are in their valid ranges.
 
@@ -65,6 +76,8 @@ def validate_data(data: pd.DataFrame, schema: list[mts.SchemaObj]) -> list[str]:
     schema: List[SchemaObj]
         The schema to validate the data against. Columns not found in this list will
         be ignored.
+    max_workers: int, optional
+        Validate columns on a thread pool with this many threads.
 
     Returns
     -------
@@ -72,22 +85,4 @@ def validate_data(data: pd.DataFrame, schema: list[mts.SchemaObj]) -> list[str]:
         A list of all errors found during validation. If the length is 0, then
         there are no errors.
     """
-    messages = []
-    for s in schema:
-        col = s.column
-        if col not in data.columns:
-            messages.append(f"Required column {col} not found.")
-            continue
-        if not _validate_dtype(data[col], s):
-            messages.append(f"Invalid datatype for {col}: {data[col].dtype}, expected: {s.dtype}.")
-            continue
-
-        illegal_vals = _illegal_values(data[col], s).tolist()
-        if len(illegal_vals) != 0:
-            messages.append(
-                f"Found illegal values {illegal_vals} in {col}, "
-                f"expected value in [{', '.join([str(x) for x in s.valid_vals])}].",
-            )
-        if not s.nullable and data[col].isna().sum() > 0:
-            messages.append(f"Found null values in non-nullable column {col}.")
-    return messages
+    return compile_schema(schema).validate(data, max_workers=max_workers).messages
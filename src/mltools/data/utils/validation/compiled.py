@@ -0,0 +1,280 @@
+"""Compiled, vectorized column validation."""
+
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pydantic as pdt
+
+import mltools.data.utils.validation.schema as mts
+
+_FLOAT_DTYPES = [f"float{x}" for x in [8, 16, 32, 64]]
+_INT_DTYPES = [f"int{x}" for x in [8, 16, 32, 64]]
+
+
+class DtypeCheck(pdt.BaseModel):
+    """Result of checking a column against a schema dtype."""
+
+    model_config = pdt.ConfigDict(arbitrary_types_allowed=True)
+
+    matches: bool
+    # ``float64`` values of coerced object and nullable numeric columns, nulls as NaN.
+    values: np.ndarray | None = None
+    non_coercible_rows: np.ndarray = pdt.Field(default_factory=lambda: np.empty(0, dtype=np.intp))
+
+
+def check_dtype(col: pd.Series, dtype: str) -> DtypeCheck:
+    """Check a column against a schema dtype.
+
+    Integer and nullable numeric extension columns are accepted for float schemas, as are
+    object columns whose values all coerce to ``float64``. Object columns are coerced in
+    one vectorized pass; the coerced values are returned for range checks together with
+    the positions of non-null values that do not coerce.
+    """
+    if col.dtype == dtype:
+        return DtypeCheck(matches=True, values=_extension_values(col))
+    if dtype not in _FLOAT_DTYPES:
+        return DtypeCheck(matches=False)
+    if col.dtype in _INT_DTYPES:
+        return DtypeCheck(matches=True)
+    extension_values = _extension_values(col)
+    if extension_values is not None:
+        return DtypeCheck(matches=True, values=extension_values)
+    if col.dtype == "object":
+        values = pd.to_numeric(col, errors="coerce").to_numpy(dtype="float64", na_value=np.nan, copy=True)
+        candidate_rows = np.flatnonzero(np.isnan(values) & col.notna().to_numpy())
+        non_coercible_rows = _coerce_rows(col, candidate_rows, values)
+        return DtypeCheck(matches=len(non_coercible_rows) == 0, values=values, non_coercible_rows=non_coercible_rows)
+    return DtypeCheck(matches=False)
+
+
+def dtype_matches(col: pd.Series, dtype: str) -> bool:
+    """Return whether a column satisfies a schema dtype, see :func:`check_dtype`."""
+    return check_dtype(col, dtype).matches
+
+
+def missing_column_message(column: str) -> str:
+    """Return the missing-column message."""
+    return f"Required column {column} not found."
+
+
+class ColumnReport(pdt.BaseModel):
+    """Validation findings for one schema column."""
+
+    model_config = pdt.ConfigDict(arbitrary_types_allowed=True)
+
+    column: str
+    messages: list[str] = pdt.Field(default_factory=list)
+    illegal_rows: np.ndarray = pdt.Field(default_factory=lambda: np.empty(0, dtype=np.intp))
+    null_count: int = 0
+    non_coercible_rows: np.ndarray = pdt.Field(default_factory=lambda: np.empty(0, dtype=np.intp))
+
+    @property
+    def non_coercible_count(self) -> int:
+        """Return the number of values that could not be coerced to the schema dtype."""
+        return len(self.non_coercible_rows)
+
+
+class ValidationReport(pdt.BaseModel):
+    """Validation findings for every schema column, in schema order."""
+
+    columns: list[ColumnReport]
+
+    @property
+    def messages(self) -> list[str]:
+        """Return all error messages in the format of :func:`validate_data`."""
+        return [message for column in self.columns for message in column.messages]
+
+    @property
+    def is_valid(self) -> bool:
+        """Return whether no errors were found."""
+        return not self.messages
+
+    def illegal_rows(self) -> dict[str, np.ndarray]:
+        """Return the positions of rows with illegal values for every failing column."""
+        return {column.column: column.illegal_rows for column in self.columns if len(column.illegal_rows) > 0}
+
+
+class CompiledColumn:
+    """Vectorized value checks compiled from one :class:`SchemaObj`.
+
+    All ``SchemaRange`` bounds are stored as arrays and every ``SchemaList`` is merged
+    into one hashed membership index, so a column is checked in a single pass per rule
+    kind.
+    """
+
+    def __init__(self, s: mts.SchemaObj):
+        self.schema = s
+        ranges = [chk for chk in s.valid_vals if isinstance(chk, mts.SchemaRange)]
+        lists = [chk for chk in s.valid_vals if isinstance(chk, mts.SchemaList)]
+        self._ranges = ranges
+        self._lower = np.array([-np.inf if r.minval is None else r.minval for r in ranges], dtype="float64")
+        self._upper = np.array([np.inf if r.maxval is None else r.maxval for r in ranges], dtype="float64")
+        self._include_lower = [r.include_lb for r in ranges]
+        self._include_upper = [r.include_ub for r in ranges]
+        self._allowed = _allowed_values(s, lists)
+        self.expected = ", ".join([str(x) for x in s.valid_vals])
+
+    def valid_mask(self, col: pd.Series, values: np.ndarray | None = None) -> np.ndarray | None:
+        """Return a mask of values accepted by at least one rule, or ``None`` without rules.
+
+        ``values`` are numeric values of the column from :func:`check_dtype`, used by
+        range checks instead of the column itself.
+        """
+        if not self.schema.valid_vals:
+            return None
+        valid = np.zeros(len(col), dtype=bool)
+        if self._ranges:
+            values = np.asarray(col) if values is None else values
+            if not pd.api.types.is_numeric_dtype(values.dtype):
+                # Delegate so unsupported dtypes raise exactly like SchemaRange.contains.
+                return self._ranges[0].contains(col)
+            for lower, upper, include_lower, include_upper in zip(
+                self._lower,
+                self._upper,
+                self._include_lower,
+                self._include_upper,
+                strict=True,
+            ):
+                lower_ok = values >= lower if include_lower else values > lower
+                upper_ok = values <= upper if include_upper else values < upper
+                valid |= lower_ok & upper_ok
+        if self._allowed is not None:
+            valid |= self._allowed.contains(col)
+        return valid
+
+    def findings(self, col: pd.Series, values: np.ndarray | None = None) -> tuple[pd.Series, np.ndarray, int]:
+        """Return illegal values, illegal row positions and the null count of a column.
+
+        Nulls are not reported as illegal in nullable columns.
+        """
+        null_mask = col.isna().to_numpy()
+        valid = self.valid_mask(col, values)
+        illegal_rows = np.flatnonzero(~valid) if valid is not None else np.empty(0, dtype=np.intp)
+        illegal_vals = pd.Series(col.iloc[illegal_rows].unique())
+        if self.schema.nullable:
+            illegal_vals = illegal_vals[~pd.isna(illegal_vals)]
+            illegal_rows = illegal_rows[~null_mask[illegal_rows]]
+        return illegal_vals, illegal_rows, int(null_mask.sum())
+
+    def dtype_message(self, dtype: object) -> str:
+        """Return the invalid-datatype message for this column."""
+        return f"Invalid datatype for {self.schema.column}: {dtype}, expected: {self.schema.dtype}."
+
+    def illegal_values_message(self, illegal_vals: list) -> str:
+        """Return the illegal-values message for this column."""
+        return f"Found illegal values {illegal_vals} in {self.schema.column}, expected value in [{self.expected}]."
+
+    def null_message(self) -> str:
+        """Return the null-values message for this column."""
+        return f"Found null values in non-nullable column {self.schema.column}."
+
+    def validate(self, data: pd.DataFrame) -> ColumnReport:
+        """Validate the compiled column of a dataframe."""
+        s = self.schema
+        if s.column not in data.columns:
+            return ColumnReport(column=s.column, messages=[missing_column_message(s.column)])
+        col = data[s.column]
+        dtype_check = check_dtype(col, s.dtype)
+        if not dtype_check.matches:
+            return ColumnReport(
+                column=s.column,
+                messages=[self.dtype_message(col.dtype)],
+                non_coercible_rows=dtype_check.non_coercible_rows,
+            )
+
+        messages = []
+        illegal_vals, illegal_rows, null_count = self.findings(col, dtype_check.values)
+        if len(illegal_vals) != 0:
+            messages.append(self.illegal_values_message(illegal_vals.tolist()))
+        if not s.nullable and null_count > 0:
+            messages.append(self.null_message())
+        return ColumnReport(column=s.column, messages=messages, illegal_rows=illegal_rows, null_count=null_count)
+
+
+class CompiledSchema:
+    """A schema compiled once into vectorized per-column validators."""
+
+    def __init__(self, schema: list[mts.SchemaObj]):
+        self.columns = [CompiledColumn(s) for s in schema]
+
+    def validate(self, data: pd.DataFrame, *, max_workers: int | None = None) -> ValidationReport:
+        """
+        Validate a dataframe against the compiled schema.
+
+        Parameters
+        ----------
+        data: pd.DataFrame
+            Data to validate.
+        max_workers: int, optional
+            Validate columns on a thread pool with this many threads. Columns are
+            validated sequentially when not set.
+
+        Returns
+        -------
+        ValidationReport
+            Per-column messages, illegal row positions and null counts.
+        """
+        if max_workers is None or len(self.columns) <= 1:
+            reports = [column.validate(data) for column in self.columns]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                reports = list(executor.map(lambda column: column.validate(data), self.columns))
+        return ValidationReport(columns=reports)
+
+
+def compile_schema(schema: list[mts.SchemaObj]) -> CompiledSchema:
+    """Compile schema objects into vectorized validators."""
+    return CompiledSchema(schema)
+
+
+def _extension_values(col: pd.Series) -> np.ndarray | None:
+    """Return ``float64`` values of nullable numeric extension columns, nulls as NaN."""
+    dtype = col.dtype
+    if (
+        isinstance(dtype, pd.api.extensions.ExtensionDtype)
+        and pd.api.types.is_numeric_dtype(dtype)
+        and not pd.api.types.is_bool_dtype(dtype)
+    ):
+        return col.to_numpy(dtype="float64", na_value=np.nan)
+    return None
+
+
+def _coerce_rows(col: pd.Series, rows: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Coerce rows ``pd.to_numeric`` left as NaN like ``astype("float64")`` and return those that fail.
+
+    This accepts spellings such as ``"nan"`` or ``"1_000"`` that ``float`` parses, so the
+    result matches a plain ``astype`` while only the non-numeric rows take the slow path.
+    """
+    objects = col.to_numpy()
+    failed = []
+    for row in rows.tolist():
+        try:
+            value = float(objects[row])
+        except (TypeError, ValueError):
+            failed.append(row)
+        else:
+            values[row] = value
+    return np.asarray(failed, dtype=np.intp)
+
+
+def _allowed_values(s: mts.SchemaObj, lists: list[mts.SchemaList]) -> mts.SchemaList | None:
+    """Return one list of every allowed value, reusing hashed indexes across compilations."""
+    if not lists:
+        return None
+    if len(lists) == 1:
+        # The list's own hashed index is built once and kept on the schema object.
+        return lists[0]
+    signature = tuple((id(chk), id(chk.vals), len(chk.vals)) for chk in lists)
+    cached = _MERGED_LISTS.get(s)
+    if cached is None or cached[0] != signature:
+        cached = (signature, mts.SchemaList([val for chk in lists for val in chk.vals]))
+        _MERGED_LISTS[s] = cached
+    return cached[1]
+
+
+# Keyed weakly by schema object; the merged lists do not refer back to it.
+_MERGED_LISTS: "weakref.WeakKeyDictionary[mts.SchemaObj, tuple[tuple[tuple[int, int, int], ...], mts.SchemaList]]" = (
+    weakref.WeakKeyDictionary()
+)
@@ -0,0 +1,218 @@
+"""Schema inference from dataframes and parquet files."""
+
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+import mltools.data.utils.validation.schema as mts
+
+
+class ColumnProfile:
+    """Mergeable summary of one column: dtype, nulls, numeric bounds and distinct values."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        column: str,
+        dtype: str,
+        *,
+        null_count: int,
+        minval: Any = None,
+        maxval: Any = None,
+        distinct: dict[Any, None] | None = None,
+    ):
+        self.column = column
+        self.dtype = dtype
+        self.null_count = null_count
+        self.minval = minval
+        self.maxval = maxval
+        # ``None`` once the column has more distinct values than are kept.
+        self.distinct = distinct
+
+    @classmethod
+    def from_series(cls, col: pd.Series, *, max_list_values: int) -> "ColumnProfile":
+        """Profile a column in one pass over its non-null values."""
+        non_null = col.dropna()
+        minval = maxval = None
+        if _has_range(col.dtype) and len(non_null) > 0:
+            minval, maxval = _python_scalar(non_null.min()), _python_scalar(non_null.max())
+        uniques = non_null.unique()
+        distinct = dict.fromkeys(pd.Series(uniques).tolist()) if len(uniques) <= max_list_values else None
+        return cls(
+            str(col.name),
+            str(col.dtype),
+            null_count=len(col) - len(non_null),
+            minval=minval,
+            maxval=maxval,
+            distinct=distinct,
+        )
+
+    def merge(self, other: "ColumnProfile", *, max_list_values: int) -> "ColumnProfile":
+        """Combine with the profile of another part of the same column."""
+        distinct = None
+        if self.distinct is not None and other.distinct is not None:
+            distinct = self.distinct | other.distinct
+            if len(distinct) > max_list_values:
+                distinct = None
+        return ColumnProfile(
+            self.column,
+            _merge_dtypes(self.dtype, other.dtype),
+            null_count=self.null_count + other.null_count,
+            minval=_merge_bound(self.minval, other.minval, min),
+            maxval=_merge_bound(self.maxval, other.maxval, max),
+            distinct=distinct,
+        )
+
+    def to_schema_obj(self) -> mts.SchemaObj:
+        """Propose a schema object for the profiled column.
+
+        Low-cardinality non-float columns get a ``SchemaList``, numeric columns get a
+        ``SchemaRange`` of the observed bounds, and other columns get no value rules.
+        """
+        valid_vals: list[mts.SchemaList | mts.SchemaRange] = []
+        is_float = self.dtype.startswith("float")
+        if self.distinct and (not is_float or self.minval == self.maxval):
+            valid_vals.append(mts.SchemaList(_sorted_values(self.distinct)))
+        elif self.minval is not None and self.minval != self.maxval:
+            valid_vals.append(mts.SchemaRange(self.minval, self.maxval))
+        return mts.SchemaObj(
+            column=self.column,
+            dtype=self.dtype,
+            valid_vals=valid_vals,
+            nullable=self.null_count > 0,
+        )
+
+
+def infer_schema(
+    data: pd.DataFrame | str | Path,
+    *,
+    columns: list[str] | None = None,
+    sample_size: int | None = None,
+    max_list_values: int = 20,
+    random_state: int | None = None,
+) -> list[mts.SchemaObj]:
+    """
+    Infer a validation schema from a dataframe or parquet file.
+
+    Parameters
+    ----------
+    data: pd.DataFrame, str or Path
+        Dataframe, or path to a parquet file that is read one row group at a time.
+    columns: List[str], optional
+        Columns to profile. Defaults to every column.
+    sample_size: int, optional
+        Profile a uniform random sample of this many rows instead of the full table.
+        Parquet files are sampled with a reservoir, so only the sample is kept in memory.
+    max_list_values: int
+        Columns with at most this many distinct values get a ``SchemaList``.
+    random_state: int, optional
+        Seed for sampling.
+
+    Returns
+    -------
+    List[SchemaObj]
+        Proposed schema objects. Serialize them with ``SchemaObj.to_dict`` and load them
+        back with ``dict_to_schema``.
+    """
+    if sample_size is not None and sample_size < 1:
+        msg = f"sample_size must be at least 1, got {sample_size}."
+        raise ValueError(msg)
+    rng = np.random.default_rng(random_state)
+    if isinstance(data, pd.DataFrame):
+        frame = data if columns is None else data.loc[:, columns]
+        if sample_size is not None and sample_size < len(frame):
+            frame = frame.iloc[np.sort(rng.choice(len(frame), size=sample_size, replace=False))]
+        profiles = _profile_frame(frame, max_list_values=max_list_values)
+    elif sample_size is not None:
+        frame = _reservoir_sample(Path(data), columns=columns, sample_size=sample_size, rng=rng)
+        profiles = _profile_frame(frame, max_list_values=max_list_values)
+    else:
+        profiles = _profile_parquet(Path(data), columns=columns, max_list_values=max_list_values)
+    return [profile.to_schema_obj() for profile in profiles]
+
+
+def _profile_frame(frame: pd.DataFrame, *, max_list_values: int) -> list[ColumnProfile]:
+    return [ColumnProfile.from_series(frame[col], max_list_values=max_list_values) for col in frame.columns]
+
+
+def _profile_parquet(path: Path, *, columns: list[str] | None, max_list_values: int) -> list[ColumnProfile]:
+    profiles: list[ColumnProfile] | None = None
+    with pq.ParquetFile(path) as parquet_file:
+        for row_group in range(parquet_file.num_row_groups):
+            frame = parquet_file.read_row_group(row_group, columns=columns).to_pandas()
+            group_profiles = _profile_frame(frame, max_list_values=max_list_values)
+            profiles = (
+                group_profiles
+                if profiles is None
+                else [
+                    profile.merge(group_profile, max_list_values=max_list_values)
+                    for profile, group_profile in zip(profiles, group_profiles, strict=True)
+                ]
+            )
+        if profiles is None:
+            empty = parquet_file.schema_arrow.empty_table().to_pandas()
+            profiles = _profile_frame(empty if columns is None else empty.loc[:, columns], max_list_values=0)
+    return profiles
+
+
+def _reservoir_sample(
+    path: Path,
+    *,
+    columns: list[str] | None,
+    sample_size: int,
+    rng: np.random.Generator,
+) -> pd.DataFrame:
+    """Return a uniform sample of rows, keeping the rows with the smallest random keys."""
+    reservoir: pa.Table | None = None
+    keys = np.empty(0)
+    with pq.ParquetFile(path) as parquet_file:
+        for batch in parquet_file.iter_batches(columns=columns):
+            batch_table = pa.Table.from_batches([batch])
+            batch_keys = rng.random(batch.num_rows)
+            candidates = batch_table if reservoir is None else pa.concat_tables([reservoir, batch_table])
+            candidate_keys = np.concatenate([keys, batch_keys])
+            if len(candidate_keys) > sample_size:
+                keep = np.sort(np.argpartition(candidate_keys, sample_size - 1)[:sample_size])
+                candidates = candidates.take(keep)
+                candidate_keys = candidate_keys[keep]
+            reservoir, keys = candidates, candidate_keys
+        if reservoir is None:
+            reservoir = parquet_file.schema_arrow.empty_table()
+            if columns is not None:
+                reservoir = reservoir.select(columns)
+    return reservoir.to_pandas()
+
+
+def _has_range(dtype: Any) -> bool:
+    return pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+
+
+def _python_scalar(value: Any) -> Any:
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _merge_dtypes(left: str, right: str) -> str:
+    if left == right:
+        return left
+    # Integer row groups read as float64 when they contain nulls.
+    if _has_range(left) and _has_range(right):
+        return "float64"
+    return "object"
+
+
+def _merge_bound(left: Any, right: Any, pick: Any) -> Any:
+    if left is None:
+        return right
+    if right is None:
+        return left
+    return pick(left, right)
+
+
+def _sorted_values(values: dict[Any, None]) -> list[Any]:
+    try:
+        return sorted(values)
+    except TypeError:
+        return list(values)
@@ -73,15 +73,48 @@ class SchemaRange:
 
 
 class SchemaList:
-    """Validate that values are included in an explicit list."""
+    """Validate that values are included in an explicit list.
+
+    The allowed values are hashed once into a :class:`pandas.Index` on first use and
+    reused by later calls. Assigning ``vals`` resets it; lists mutated in place must be
+    reassigned.
+    """
 
     def __init__(self, vals: list[Any]):
         self.vals = vals
 
+    @property
+    def vals(self) -> list[Any]:
+        """Allowed values."""
+        return self._vals
+
+    @vals.setter
+    def vals(self, vals: list[Any]) -> None:
+        self._vals = vals
+        self._index: pd.Index | None = None
+
+    @property
+    def index(self) -> pd.Index:
+        """Return the unique allowed values as a hashed index, built on first use."""
+        if self._index is None:
+            self._index = pd.Index(self._vals).unique()
+        return self._index
+
     def contains(self, ser: Sequence) -> np.ndarray:
         """Return a mask indicating which values are present in the list."""
         series = ser if isinstance(ser, pd.Series) else pd.Series(ser)
-        return np.array(series.isin(self.vals))
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Look up each category once and map the codes; code -1 marks nulls.
+            lookup = np.append(self._isin(series.cat.categories), self.index.hasnans)
+            return lookup[series.cat.codes.to_numpy()]
+        return self._isin(series)
+
+    def _isin(self, values: pd.Series | pd.Index) -> np.ndarray:
+        index = self.index
+        if _lookup_kind(values.dtype) != _lookup_kind(index.dtype):
+            # Index lookups match nulls and booleans across kinds differently from isin.
+            return np.asarray(values.isin(self._vals))
+        return index.get_indexer(values) >= 0
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize the list validator to a dictionary."""
@@ -124,6 +157,14 @@ class SchemaObj:
         }
 
 
+def _lookup_kind(dtype: Any) -> str:
+    if pd.api.types.is_bool_dtype(dtype):
+        return "bool"
+    if pd.api.types.is_numeric_dtype(dtype):
+        return "numeric"
+    return "other"
+
+
 def dict_to_valid_vals(input_dict: dict[str, Any]) -> SchemaRange | SchemaList:
     """Convert a serialized value validator into a schema validator."""
     input_dict = input_dict.copy()
@@ -0,0 +1,213 @@
+"""Streaming validation of parquet files, one row group at a time."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+import mltools.data.utils.validation.schema as mts
+from mltools.data.utils.validation.compiled import (
+    ColumnReport,
+    CompiledColumn,
+    CompiledSchema,
+    ValidationReport,
+    check_dtype,
+    compile_schema,
+    missing_column_message,
+)
+
+
+class ColumnFindings:
+    """Partial validation findings for one column over a run of row groups.
+
+    Findings from consecutive row-group runs are combined with :meth:`merge`, keeping
+    illegal values in first-seen order.
+    """
+
+    def __init__(self, max_illegal_values: int | None = None):
+        self.max_illegal_values = max_illegal_values
+        self.dtype: Any = None
+        self.illegal_values: dict[Any, Any] = {}
+        self.illegal_rows: list[np.ndarray] = []
+        self.non_coercible_rows: list[np.ndarray] = []
+        self.null_count = 0
+
+    def add(self, illegal_vals: pd.Series, illegal_rows: np.ndarray, null_count: int) -> None:
+        """Add the findings of one row group."""
+        for val in illegal_vals.tolist():
+            if self.max_illegal_values is not None and len(self.illegal_values) >= self.max_illegal_values:
+                break
+            # NaN values are not equal to each other, so they share one key.
+            self.illegal_values.setdefault(_NULL_KEY if pd.isna(val) else val, val)
+        if len(illegal_rows) != 0:
+            self.illegal_rows.append(illegal_rows)
+        self.null_count += null_count
+
+    def merge(self, later: "ColumnFindings") -> None:
+        """Merge findings from row groups that follow the ones already seen."""
+        if self.dtype is None:
+            self.dtype = later.dtype
+        self.add(pd.Series(list(later.illegal_values.values()), dtype="object"), np.empty(0, dtype=np.intp), 0)
+        self.illegal_rows.extend(later.illegal_rows)
+        self.non_coercible_rows.extend(later.non_coercible_rows)
+        self.null_count += later.null_count
+
+    def has_error(self, s: mts.SchemaObj) -> bool:
+        """Return whether the findings already contain an error."""
+        return self.dtype is not None or bool(self.illegal_values) or (not s.nullable and self.null_count > 0)
+
+    def report(self, compiled: CompiledColumn) -> ColumnReport:
+        """Return the column report in the format of :func:`validate_data`."""
+        column = compiled.schema.column
+        if self.dtype is not None:
+            non_coercible_rows = _concatenate_rows(self.non_coercible_rows)
+            return ColumnReport(
+                column=column,
+                messages=[compiled.dtype_message(self.dtype)],
+                non_coercible_rows=non_coercible_rows,
+            )
+        messages = []
+        if self.illegal_values:
+            messages.append(compiled.illegal_values_message(list(self.illegal_values.values())))
+        if not compiled.schema.nullable and self.null_count > 0:
+            messages.append(compiled.null_message())
+        illegal_rows = _concatenate_rows(self.illegal_rows)
+        return ColumnReport(column=column, messages=messages, illegal_rows=illegal_rows, null_count=self.null_count)
+
+
+def validate_parquet(
+    path: str | Path,
+    schema: list[mts.SchemaObj] | CompiledSchema,
+    *,
+    fail_fast: bool = False,
+    max_workers: int | None = None,
+    max_illegal_values: int | None = None,
+) -> ValidationReport:
+    """
+    Validate a parquet file row group by row group.
+
+    Only schema columns are read, and only one row group per worker is held in memory.
+    Without ``max_illegal_values`` and ``fail_fast`` the messages match
+    :func:`validate_data` on the fully loaded file.
+
+    Parameters
+    ----------
+    path: str or Path
+        Parquet file to validate.
+    schema: List[SchemaObj] or CompiledSchema
+        The schema to validate the data against.
+    fail_fast: bool
+        Stop reading row groups once any error has been found.
+    max_workers: int, optional
+        Validate contiguous runs of row groups on a thread pool with this many threads.
+    max_illegal_values: int, optional
+        Maximum number of distinct illegal values kept per column.
+
+    Returns
+    -------
+    ValidationReport
+        Per-column messages, illegal row positions in the file and null counts.
+    """
+    compiled = schema if isinstance(schema, CompiledSchema) else compile_schema(schema)
+    file_path = Path(path)
+    with pq.ParquetFile(file_path) as parquet_file:
+        available = set(parquet_file.schema_arrow.names)
+        row_counts = [parquet_file.metadata.row_group(i).num_rows for i in range(parquet_file.num_row_groups)]
+
+    present = [position for position, c in enumerate(compiled.columns) if c.schema.column in available]
+    if fail_fast and len(present) < len(compiled.columns):
+        first_missing = next(c for c in compiled.columns if c.schema.column not in available)
+        column = first_missing.schema.column
+        return ValidationReport(columns=[ColumnReport(column=column, messages=[missing_column_message(column)])])
+
+    offsets = np.concatenate([[0], np.cumsum(row_counts)]).astype(np.intp)
+    scanner = _RowGroupScanner(
+        file_path,
+        compiled,
+        present=present,
+        offsets=offsets,
+        fail_fast=fail_fast,
+        max_illegal_values=max_illegal_values,
+    )
+    row_groups = list(range(len(row_counts)))
+    if max_workers is None or len(row_groups) <= 1:
+        partials = [scanner.scan(row_groups)]
+    else:
+        runs = [run.tolist() for run in np.array_split(row_groups, min(max_workers, len(row_groups)))]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            partials = list(executor.map(scanner.scan, runs))
+
+    merged = partials[0]
+    for partial in partials[1:]:
+        for position, column_findings in partial.items():
+            merged[position].merge(column_findings)
+
+    reports = []
+    for position, c in enumerate(compiled.columns):
+        if position in merged:
+            reports.append(merged[position].report(c))
+        else:
+            reports.append(ColumnReport(column=c.schema.column, messages=[missing_column_message(c.schema.column)]))
+    return ValidationReport(columns=reports)
+
+
+class _RowGroupScanner:
+    """Collect column findings over runs of row groups, stopping all runs on fail-fast."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        path: Path,
+        compiled: CompiledSchema,
+        *,
+        present: list[int],
+        offsets: np.ndarray,
+        fail_fast: bool,
+        max_illegal_values: int | None,
+    ):
+        self.path = path
+        self.compiled = compiled
+        self.present = present
+        self.offsets = offsets
+        self.fail_fast = fail_fast
+        self.max_illegal_values = max_illegal_values
+        self.columns = list(dict.fromkeys(compiled.columns[position].schema.column for position in present))
+        self._stop = threading.Event()
+
+    def scan(self, row_groups: list[int]) -> dict[int, ColumnFindings]:
+        findings = {position: ColumnFindings(self.max_illegal_values) for position in self.present}
+        with pq.ParquetFile(self.path) as parquet_file:
+            for row_group in row_groups:
+                if self._stop.is_set():
+                    break
+                frame = parquet_file.read_row_group(row_group, columns=self.columns).to_pandas()
+                for position in self.present:
+                    self._scan_column(frame, row_group, self.compiled.columns[position], findings[position])
+                if self.fail_fast and any(
+                    findings[position].has_error(self.compiled.columns[position].schema) for position in self.present
+                ):
+                    self._stop.set()
+        return findings
+
+    def _scan_column(self, frame: pd.DataFrame, row_group: int, c: CompiledColumn, findings: ColumnFindings) -> None:
+        col = frame[c.schema.column]
+        dtype_check = check_dtype(col, c.schema.dtype)
+        if len(dtype_check.non_coercible_rows) != 0:
+            findings.non_coercible_rows.append(dtype_check.non_coercible_rows + self.offsets[row_group])
+        if findings.dtype is not None:
+            return
+        if not dtype_check.matches:
+            findings.dtype = col.dtype
+            return
+        illegal_vals, illegal_rows, null_count = c.findings(col, dtype_check.values)
+        findings.add(illegal_vals, illegal_rows + self.offsets[row_group], null_count)
+
+
+def _concatenate_rows(rows: list[np.ndarray]) -> np.ndarray:
+    return np.concatenate(rows) if rows else np.empty(0, dtype=np.intp)
+
+
+_NULL_KEY = object()
@@ -2,27 +2,80 @@
 
 from __future__ import annotations
 
+import io
 import json
+import mmap
 import pickle
+import struct
+import threading
+import time
+import zipfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, NoReturn
+from typing import TYPE_CHECKING, Any, BinaryIO, Literal, NoReturn, TypeAlias
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import pydantic as pdt
+from pyarrow import feather
+
+from mltools.storage import resolve_uri
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping
+
+    from mltools.storage import RemoteFileSystem
 
 _OBJECT_FORMATS_BY_SUFFIX = {
     ".pkl": "pickle",
     ".pickle": "pickle",
+    ".pkl5": "pickle5",
     ".json": "json",
     ".txt": "text",
+    ".npy": "npy",
+    ".npz": "npz",
 }
 
 _DATAFRAME_FORMATS_BY_SUFFIX = {
     ".parquet": "parquet",
     ".csv": "csv",
+    ".arrow": "arrow",
+    ".feather": "arrow",
 }
 
+# Read-only and copy-on-write maps never modify the artifact; "r+" would corrupt npz
+# checksums and "w+" truncates the file.
+MmapMode = Literal["r", "c"]
+_MMAP_MODES = frozenset(("r", "c"))
+DataFrameFilters: TypeAlias = pc.Expression | list[tuple[str, str, Any]] | list[list[tuple[str, str, Any]]]
+
+_DATASET_FORMATS = {"parquet": "parquet", "csv": "csv", "arrow": "ipc"}
+_GLOB_CHARACTERS = frozenset("*?[")
+
+# Layout of pickle5 artifacts: magic, blob sections aligned to _PICKLE5_ALIGNMENT, a JSON
+# footer with the section table, then the footer length and the magic again.
+_PICKLE5_MAGIC = b"MLTPKL5\x00"
+_PICKLE5_TRAILER = struct.Struct(f"<Q{len(_PICKLE5_MAGIC)}s")
+_PICKLE5_ALIGNMENT = 64
+_PICKLE5_COMPRESSION = ("zstd", "lz4")
+_PICKLE5_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Size of the fixed part of a zip local file header, before the file name and extra field.
+_ZIP_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+
 
-def write_file(obj: Any, path: str | Path, *, format: str | None = None) -> Path:  # noqa: A002
+def write_file(
+    obj: Any,
+    path: str | Path,
+    *,
+    format: str | None = None,  # noqa: A002
+    compression: str | None = None,
+) -> Path:
     """Write a generic artifact object to an explicit path.
 
     Parameters
@@ -30,16 +83,31 @@ def write_file(obj: Any, path: str | Path, *, format: str | None = None) -> Path
     obj
         Object to persist.
     path
-        Destination file path.
+        Destination file path, or a URI under a prefix registered with
+        :func:`mltools.storage.register_filesystem`. Remote artifacts are written to
+        a local staging file and uploaded, in concurrent parts when large.
     format
         Optional object format override. Supported values are ``pickle``,
-        ``json``, and ``text``.
+        ``pickle5``, ``json``, ``text``, ``npy`` for one array and ``npz`` for a
+        mapping of names to arrays. NumPy archives are written uncompressed so they
+        can be memory-mapped. ``pickle5`` pickles with protocol 5 and stores large
+        buffers such as NumPy arrays out of band as separate aligned blobs, so they
+        are not copied into the pickle stream and can be memory-mapped on read.
+    compression
+        Optional ``zstd`` or ``lz4`` compression of every ``pickle5`` blob.
 
     Returns
     -------
     Path
-        Normalized path that was written.
+        Normalized path that was written. For remote artifacts, the local cached
+        copy of the uploaded object.
     """
+    remote = resolve_uri(path)
+    if remote is not None:
+        filesystem, key = remote
+        staged_path = write_file(obj, filesystem.staging_path(key), format=format, compression=compression)
+        return filesystem.commit(staged_path, key)
+
     output_path = _normalize_path(path)
     object_format = _resolve_format(
         output_path,
@@ -47,11 +115,16 @@ def write_file(obj: Any, path: str | Path, *, format: str | None = None) -> Path
         suffix_formats=_OBJECT_FORMATS_BY_SUFFIX,
         artifact_kind="object artifact",
     )
+    if compression is not None and object_format != "pickle5":
+        msg = f"compression is only supported for pickle5 artifacts, got {object_format}."
+        raise ValueError(msg)
     _ensure_parent_dir(output_path)
 
     if object_format == "pickle":
         with output_path.open("wb") as file:
             pickle.dump(obj, file)
+    elif object_format == "pickle5":
+        _write_pickle5(obj, output_path, compression=compression)
     elif object_format == "json":
         with output_path.open("w", encoding="utf-8") as file:
             json.dump(obj, file, indent=2, sort_keys=True)
@@ -59,28 +132,58 @@ def write_file(obj: Any, path: str | Path, *, format: str | None = None) -> Path
     elif object_format == "text":
         with output_path.open("w", encoding="utf-8") as file:
             file.write(str(obj))
+    elif object_format == "npy":
+        with output_path.open("wb") as file:
+            np.save(file, np.asarray(obj), allow_pickle=False)
+    elif object_format == "npz":
+        arrays: dict[str, Any] = {name: np.asarray(array) for name, array in obj.items()}
+        with output_path.open("wb") as file:
+            np.savez(file, **arrays)
     else:  # pragma: no cover
         _raise_unsupported_format(object_format, "object artifact")
 
+    _READ_CACHE.invalidate(output_path)
     return output_path
 
 
-def read_file(path: str | Path, *, format: str | None = None) -> Any:  # noqa: A002
+def read_file(
+    path: str | Path,
+    *,
+    format: str | None = None,  # noqa: A002
+    mmap_mode: MmapMode | None = None,
+) -> Any:
     """Read a generic artifact object from an explicit path.
 
     Parameters
     ----------
     path
-        Source file path.
+        Source file path, or a URI under a registered object store prefix. Remote
+        objects are downloaded once per ETag into the filesystem's local cache.
     format
         Optional object format override. Supported values are ``pickle``,
-        ``json``, and ``text``.
+        ``pickle5``, ``json``, ``text``, ``npy``, and ``npz``. ``pickle5`` files
+        are also recognized when read as ``pickle``.
+    mmap_mode
+        Memory-map NumPy arrays instead of reading them, with ``"r"`` for
+        read-only and ``"c"`` for copy-on-write buffers. Mapped arrays are shared
+        between processes through the page cache and never modify the artifact.
+        Only supported for ``npy``, ``npz``, and uncompressed ``pickle5``
+        artifacts.
 
     Returns
     -------
     Any
-        Loaded artifact object.
+        Loaded artifact object. ``npz`` archives are returned as a dictionary of
+        arrays.
     """
+    if mmap_mode is not None and mmap_mode not in _MMAP_MODES:
+        msg = f"mmap_mode must be 'r' or 'c', got {mmap_mode!r}."
+        raise ValueError(msg)
+    remote = resolve_uri(path)
+    if remote is not None:
+        filesystem, key = remote
+        return read_file(filesystem.download(key), format=format, mmap_mode=mmap_mode)
+
     input_path = _normalize_path(path)
     _ensure_file_exists(input_path)
     object_format = _resolve_format(
@@ -89,18 +192,19 @@ def read_file(path: str | Path, *, format: str | None = None) -> Any:  # noqa: A
         suffix_formats=_OBJECT_FORMATS_BY_SUFFIX,
         artifact_kind="object artifact",
     )
-
-    if object_format == "pickle":
-        with input_path.open("rb") as file:
-            return pickle.load(file)  # noqa: S301
-    if object_format == "json":
-        with input_path.open(encoding="utf-8") as file:
-            return json.load(file)
-    if object_format == "text":
-        with input_path.open(encoding="utf-8") as file:
-            return file.read()
-
-    return _raise_unsupported_format(object_format, "object artifact")
+    if object_format == "pickle" and _is_pickle5(input_path):
+        object_format = "pickle5"
+    if mmap_mode is not None and object_format not in {"npy", "npz", "pickle5"}:
+        msg = f"mmap_mode is only supported for npy, npz and pickle5 artifacts, got {object_format}."
+        raise ValueError(msg)
+    if mmap_mode is not None:
+        # Mapped reads are already served from the page cache.
+        return _load_object(input_path, object_format=object_format, mmap_mode=mmap_mode)
+    return _READ_CACHE.get_or_load(
+        input_path,
+        ("object", object_format),
+        lambda: _load_object(input_path, object_format=object_format, mmap_mode=None),
+    )
 
 
 def write_dataframe(
@@ -117,17 +221,28 @@ def write_dataframe(
     df
         Dataframe to persist.
     path
-        Destination file path. Supported suffixes are ``.parquet`` and ``.csv``.
+        Destination file path. Supported suffixes are ``.parquet``, ``.csv``, and
+        ``.arrow``/``.feather`` for the Arrow IPC file format. URIs under a registered
+        object store prefix are written locally and uploaded.
     index
         Whether to include the dataframe index.
     **kwargs
-        Additional keyword arguments passed to the pandas writer.
+        Additional keyword arguments passed to the pandas writer, or to
+        :func:`pyarrow.feather.write_feather` for Arrow files. Arrow files are written
+        uncompressed by default so they can be memory-mapped.
 
     Returns
     -------
     Path
-        Normalized path that was written.
+        Normalized path that was written. For remote artifacts, the local cached
+        copy of the uploaded object.
     """
+    remote = resolve_uri(path)
+    if remote is not None:
+        filesystem, key = remote
+        staged_path = write_dataframe(df, filesystem.staging_path(key), index=index, **kwargs)
+        return filesystem.commit(staged_path, key)
+
     output_path = _normalize_path(path)
     dataframe_format = _resolve_format(
         output_path,
@@ -141,28 +256,70 @@ def write_dataframe(
         df.to_parquet(output_path, index=index, **kwargs)
     elif dataframe_format == "csv":
         df.to_csv(output_path, index=index, **kwargs)
+    elif dataframe_format == "arrow":
+        kwargs.setdefault("compression", "uncompressed")
+        feather.write_feather(pa.Table.from_pandas(df, preserve_index=index), output_path, **kwargs)
     else:  # pragma: no cover
         _raise_unsupported_format(dataframe_format, "dataframe artifact")
 
+    _READ_CACHE.invalidate(output_path)
     return output_path
 
 
-def read_dataframe(path: str | Path, **kwargs: Any) -> pd.DataFrame:
+def read_dataframe(
+    path: str | Path,
+    *,
+    columns: list[str] | None = None,
+    filters: DataFrameFilters | None = None,
+    **kwargs: Any,
+) -> pd.DataFrame:
     """Read a pandas dataframe from an explicit path.
 
     Parameters
     ----------
     path
-        Source file path. Supported suffixes are ``.parquet`` and ``.csv``.
+        Source file path. Supported suffixes are ``.parquet``, ``.csv``,
+        ``.arrow``, and ``.feather``. A directory or glob pattern of files with one
+        of these suffixes is read as a single dataset; directories may use hive
+        partitioning. URIs under a registered object store prefix name single remote
+        files; projected or filtered parquet reads fetch only the footer and the
+        needed column chunks with ranged requests, other reads download the object
+        into the local ETag cache.
+    columns
+        Optional columns to read. Other columns are not decoded.
+    filters
+        Optional row filter, as a pyarrow expression or a list of
+        ``(column, op, value)`` tuples in the format of
+        :func:`pyarrow.parquet.filters_to_expression`. Parquet row groups that
+        cannot match are skipped. Not supported for single CSV files.
     **kwargs
-        Additional keyword arguments passed to the pandas reader.
+        Additional keyword arguments passed to the pandas reader, or to
+        :func:`pyarrow.feather.read_table` for Arrow files. Arrow files are
+        memory-mapped unless ``memory_map=False`` is passed. Not supported for
+        directories and glob patterns.
 
     Returns
     -------
     pandas.DataFrame
         Loaded dataframe.
+
+    Raises
+    ------
+    TypeError
+        If keyword arguments are passed for a directory or glob pattern.
     """
+    remote = resolve_uri(path)
+    if remote is not None:
+        return _read_remote_dataframe(*remote, columns=columns, filters=filters, **kwargs)
+
     input_path = _normalize_path(path)
+    if _is_dataset_path(input_path):
+        if kwargs:
+            msg = f"read_dataframe does not accept {sorted(kwargs)} for multi-file datasets: {input_path}"
+            raise TypeError(msg)
+        dataset = _open_dataset(input_path)
+        return dataset.to_table(columns=columns, filter=_filter_expression(filters)).to_pandas(split_blocks=True)
+
     _ensure_file_exists(input_path)
     dataframe_format = _resolve_format(
         input_path,
@@ -170,15 +327,359 @@ def read_dataframe(path: str | Path, **kwargs: Any) -> pd.DataFrame:
         suffix_formats=_DATAFRAME_FORMATS_BY_SUFFIX,
         artifact_kind="dataframe artifact",
     )
+    read_args = repr((columns, filters, sorted(kwargs.items())))
+    return _READ_CACHE.get_or_load(
+        input_path,
+        ("dataframe", dataframe_format, read_args),
+        lambda: _load_dataframe(
+            input_path,
+            dataframe_format=dataframe_format,
+            columns=columns,
+            filters=filters,
+            **kwargs,
+        ),
+    )
+
+
+def _read_remote_dataframe(
+    filesystem: RemoteFileSystem,
+    key: str,
+    *,
+    columns: list[str] | None,
+    filters: DataFrameFilters | None,
+    **kwargs: Any,
+) -> pd.DataFrame:
+    """Read one remote dataframe, with ranged requests for partial parquet reads."""
+    dataframe_format = _resolve_format(
+        Path(key),
+        supplied_format=None,
+        suffix_formats=_DATAFRAME_FORMATS_BY_SUFFIX,
+        artifact_kind="dataframe artifact",
+    )
+    if dataframe_format == "parquet" and (columns is not None or filters is not None):
+        arrow_filesystem = filesystem.arrow_filesystem()
+        return pd.read_parquet(key, columns=columns, filters=filters, filesystem=arrow_filesystem, **kwargs)
+    return read_dataframe(filesystem.download(key), columns=columns, filters=filters, **kwargs)
+
 
+def _load_dataframe(
+    input_path: Path,
+    *,
+    dataframe_format: str,
+    columns: list[str] | None,
+    filters: DataFrameFilters | None,
+    **kwargs: Any,
+) -> pd.DataFrame:
+    """Read one dataframe file in a resolved format."""
     if dataframe_format == "parquet":
-        return pd.read_parquet(input_path, **kwargs)
+        return pd.read_parquet(input_path, columns=columns, filters=filters, **kwargs)
     if dataframe_format == "csv":
-        return pd.read_csv(input_path, **kwargs)
+        if filters is not None:
+            msg = f"filters are not supported for CSV artifacts: {input_path}"
+            raise ValueError(msg)
+        df = pd.read_csv(input_path, usecols=columns, **kwargs)
+        # usecols keeps file order; project in the requested order like the other formats.
+        return df if columns is None else df[columns]
+    if dataframe_format == "arrow":
+        kwargs.setdefault("memory_map", True)
+        if filters is None:
+            return feather.read_table(input_path, columns=columns, **kwargs).to_pandas(split_blocks=True)
+        # Filter columns may be outside the projection; mapped columns that are not kept cost nothing.
+        table = feather.read_table(input_path, **kwargs).filter(_filter_expression(filters))
+        return (table if columns is None else table.select(columns)).to_pandas(split_blocks=True)
 
     return _raise_unsupported_format(dataframe_format, "dataframe artifact")
 
 
+def _load_object(input_path: Path, *, object_format: str, mmap_mode: MmapMode | None) -> Any:
+    """Read one object file in a resolved format."""
+    if object_format == "pickle":
+        with input_path.open("rb") as file:
+            return pickle.load(file)  # noqa: S301
+    if object_format == "pickle5":
+        return _read_pickle5(input_path, mmap_mode=mmap_mode)
+    if object_format == "json":
+        with input_path.open(encoding="utf-8") as file:
+            return json.load(file)
+    if object_format == "text":
+        with input_path.open(encoding="utf-8") as file:
+            return file.read()
+    if object_format in {"npy", "npz"}:
+        return _read_numpy(input_path, object_format=object_format, mmap_mode=mmap_mode)
+
+    return _raise_unsupported_format(object_format, "object artifact")
+
+
+def iter_dataframe(
+    path: str | Path,
+    *,
+    batch_rows: int = 65_536,
+    columns: list[str] | None = None,
+    filters: DataFrameFilters | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Yield a dataframe artifact in batches of rows with bounded memory.
+
+    Parameters
+    ----------
+    path
+        Source file, directory, or glob pattern, as for :func:`read_dataframe`.
+        Remote parquet files are scanned with ranged requests.
+    batch_rows
+        Number of rows per yielded batch; only the last batch may be smaller.
+    columns
+        Optional columns to read.
+    filters
+        Optional row filter, as for :func:`read_dataframe`. Not supported for single
+        CSV files.
+
+    Yields
+    ------
+    pandas.DataFrame
+        Consecutive row batches with a default index.
+    """
+    if batch_rows < 1:
+        msg = f"batch_rows must be at least 1, got {batch_rows}."
+        raise ValueError(msg)
+    dataset = _open_iter_dataset(path, filters=filters)
+    record_batches = dataset.to_batches(columns=columns, filter=_filter_expression(filters), batch_size=batch_rows)
+
+    pending: list[pa.RecordBatch] = []
+    pending_rows = 0
+    for record_batch in record_batches:
+        if record_batch.num_rows == 0:
+            continue
+        pending.append(record_batch)
+        pending_rows += record_batch.num_rows
+        while pending_rows >= batch_rows:
+            table = pa.Table.from_batches(pending)
+            yield _batch_to_pandas(table.slice(0, batch_rows))
+            rest = table.slice(batch_rows)
+            pending, pending_rows = rest.to_batches(), rest.num_rows
+    if pending_rows > 0:
+        yield _batch_to_pandas(pa.Table.from_batches(pending))
+
+
+def _open_iter_dataset(path: str | Path, *, filters: DataFrameFilters | None) -> ds.Dataset:
+    """Open the dataset scanned by :func:`iter_dataframe`."""
+    remote = resolve_uri(path)
+    if remote is not None:
+        filesystem, key = remote
+        if Path(key).suffix.lower() == ".parquet":
+            return ds.dataset(key, filesystem=filesystem.arrow_filesystem(), format="parquet")
+        path = filesystem.download(key)
+
+    input_path = _normalize_path(path)
+    if not _is_dataset_path(input_path):
+        _ensure_file_exists(input_path)
+        dataframe_format = _resolve_format(
+            input_path,
+            supplied_format=None,
+            suffix_formats=_DATAFRAME_FORMATS_BY_SUFFIX,
+            artifact_kind="dataframe artifact",
+        )
+        if dataframe_format == "csv" and filters is not None:
+            msg = f"filters are not supported for CSV artifacts: {input_path}"
+            raise ValueError(msg)
+    return _open_dataset(input_path)
+
+
+class ReadCacheStats(pdt.BaseModel):
+    """Counters and size of the in-process read cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    entries: int
+    current_bytes: int
+    max_bytes: int
+
+
+def enable_read_cache(max_bytes: int) -> None:
+    """Cache objects and dataframes returned by :func:`read_file` and :func:`read_dataframe`.
+
+    Entries are keyed by the normalized path and the read arguments, and are only
+    reused while the file's modification time and size are unchanged. The least
+    recently used entries are evicted to keep their estimated in-memory size within
+    ``max_bytes``. Writes through :func:`write_file` and :func:`write_dataframe`
+    invalidate the written path. Cached objects are shared between callers and must
+    not be mutated; dataframes are returned as copy-on-write shallow copies, and
+    arrays, including the arrays of ``npz`` mappings, are returned read-only.
+    Memory-mapped reads and multi-file datasets are not cached.
+
+    Parameters
+    ----------
+    max_bytes
+        Byte budget of the cache. Objects larger than the budget are not cached.
+    """
+    if max_bytes < 1:
+        msg = f"max_bytes must be at least 1, got {max_bytes}."
+        raise ValueError(msg)
+    _READ_CACHE.configure(max_bytes)
+
+
+def disable_read_cache() -> None:
+    """Disable the read cache and drop its entries."""
+    _READ_CACHE.configure(0)
+
+
+def clear_read_cache() -> None:
+    """Drop every cached entry and reset the statistics, keeping the cache enabled."""
+    _READ_CACHE.clear()
+
+
+def read_cache_stats() -> ReadCacheStats:
+    """Return hit, miss, eviction and size statistics of the read cache."""
+    return _READ_CACHE.stats()
+
+
+class FileTiming(pdt.BaseModel):
+    """Wall-clock time spent reading or writing one file."""
+
+    # Normalized local path, or the object-store URI as given.
+    path: Path | str
+    seconds: float
+
+
+class BatchIOResult(pdt.BaseModel):
+    """Results of a batched read or write, keyed by the caller's paths."""
+
+    model_config = pdt.ConfigDict(arbitrary_types_allowed=True)
+
+    results: dict[str | Path, Any]
+    timings: list[FileTiming]
+    seconds: float
+
+
+def write_many(
+    objects: Mapping[str | Path, Any],
+    *,
+    max_workers: int = 8,
+    format: str | None = None,  # noqa: A002
+) -> BatchIOResult:
+    """Write many artifacts concurrently on a bounded thread pool.
+
+    Paths with a dataframe suffix are written with :func:`write_dataframe` and every
+    other path with :func:`write_file`, so formats resolve exactly as for single writes.
+
+    Parameters
+    ----------
+    objects
+        Mapping from destination path to the object to persist.
+    max_workers
+        Maximum number of files written at the same time.
+    format
+        Optional object format override passed to :func:`write_file`.
+
+    Returns
+    -------
+    BatchIOResult
+        Normalized written paths keyed by the supplied paths, with per-file timings in
+        the order of ``objects``.
+    """
+    normalized = [_normalize_path(path) for path in objects]
+    if len(set(normalized)) != len(normalized):
+        msg = "write_many received several objects for the same path."
+        raise ValueError(msg)
+
+    def write(path: str | Path, obj: Any) -> Path:
+        if _normalize_path(path).suffix.lower() in _DATAFRAME_FORMATS_BY_SUFFIX:
+            return write_dataframe(obj, path)
+        return write_file(obj, path, format=format)
+
+    return _run_many(list(objects.items()), write, max_workers=max_workers)
+
+
+def read_many(
+    paths: Iterable[str | Path],
+    *,
+    max_workers: int = 8,
+    format: str | None = None,  # noqa: A002
+) -> BatchIOResult:
+    """Read many artifacts concurrently on a bounded thread pool.
+
+    Paths with a dataframe suffix are read with :func:`read_dataframe` and every other
+    path with :func:`read_file`.
+
+    Parameters
+    ----------
+    paths
+        Source file paths.
+    max_workers
+        Maximum number of files read at the same time.
+    format
+        Optional object format override passed to :func:`read_file`.
+
+    Returns
+    -------
+    BatchIOResult
+        Loaded objects keyed by the supplied paths, with per-file timings in input order.
+    """
+
+    def read(path: str | Path, _: None) -> Any:
+        if _normalize_path(path).suffix.lower() in _DATAFRAME_FORMATS_BY_SUFFIX:
+            return read_dataframe(path)
+        return read_file(path, format=format)
+
+    return _run_many([(path, None) for path in dict.fromkeys(paths)], read, max_workers=max_workers)
+
+
+def _is_dataset_path(path: Path) -> bool:
+    """Return whether a path names a multi-file dataset rather than one file.
+
+    Existing files are never globs, so names such as ``preds[v1].parquet`` read as files.
+    """
+    if path.is_dir():
+        return True
+    return not path.is_file() and any(char in _GLOB_CHARACTERS for char in str(path))
+
+
+def _open_dataset(path: Path) -> ds.Dataset:
+    """Open a file, directory, or glob pattern of dataframe artifacts as a pyarrow dataset."""
+    if path.is_dir():
+        files = sorted(
+            file
+            for file in path.rglob("*")
+            if file.is_file() and not any(part.startswith((".", "_")) for part in file.relative_to(path).parts)
+        )
+    elif _is_dataset_path(path):
+        files = sorted(match for match in Path(path.anchor).glob(str(path.relative_to(path.anchor))) if match.is_file())
+    else:
+        files = [path]
+    if not files:
+        msg = f"No dataframe artifact files found for {path}"
+        raise FileNotFoundError(msg)
+
+    formats = {
+        _resolve_format(
+            file,
+            supplied_format=None,
+            suffix_formats=_DATAFRAME_FORMATS_BY_SUFFIX,
+            artifact_kind="dataframe artifact",
+        )
+        for file in files
+    }
+    if len(formats) > 1:
+        msg = f"Dataframe dataset {path} mixes formats: {sorted(formats)}."
+        raise ValueError(msg)
+    dataset_format = _DATASET_FORMATS[formats.pop()]
+    if path.is_dir():
+        return ds.dataset(path, format=dataset_format, partitioning="hive", exclude_invalid_files=False)
+    return ds.dataset([str(file) for file in files], format=dataset_format)
+
+
+def _filter_expression(filters: DataFrameFilters | None) -> pc.Expression | None:
+    """Convert DNF filter tuples into a pyarrow expression."""
+    if filters is None or isinstance(filters, pc.Expression):
+        return filters
+    return pq.filters_to_expression(filters)
+
+
+def _batch_to_pandas(table: pa.Table) -> pd.DataFrame:
+    """Convert one row batch, dropping any stored index so batches share a default index."""
+    return table.to_pandas(split_blocks=True, ignore_metadata=True)
+
+
 def _normalize_path(path: str | Path) -> Path:
     """Return a normalized absolute path without requiring the file to exist."""
     return Path(path).expanduser().resolve(strict=False)
@@ -228,6 +729,305 @@ def _resolve_format(
     raise ValueError(msg)
 
 
+def _run_many(
+    items: list[tuple[str | Path, Any]],
+    operation: Callable[[str | Path, Any], Any],
+    *,
+    max_workers: int,
+) -> BatchIOResult:
+    """Run one I/O operation per item on a thread pool and time each call."""
+    if max_workers < 1:
+        msg = f"max_workers must be at least 1, got {max_workers}."
+        raise ValueError(msg)
+
+    def timed(item: tuple[str | Path, Any]) -> tuple[Any, FileTiming]:
+        path, obj = item
+        start = time.perf_counter()
+        result = operation(path, obj)
+        timed_path = path if resolve_uri(path) is not None else _normalize_path(path)
+        return result, FileTiming(path=timed_path, seconds=time.perf_counter() - start)
+
+    start = time.perf_counter()
+    if len(items) <= 1:
+        outcomes = [timed(item) for item in items]
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            outcomes = list(executor.map(timed, items))
+    return BatchIOResult(
+        results={path: result for (path, _), (result, _) in zip(items, outcomes, strict=True)},
+        timings=[timing for _, timing in outcomes],
+        seconds=time.perf_counter() - start,
+    )
+
+
+def _write_pickle5(obj: Any, path: Path, *, compression: str | None) -> None:
+    """Pickle with protocol 5, writing the stream and each out-of-band buffer as a blob.
+
+    Compressed blobs are streamed through the codec in chunks, so only the pickled
+    object and a small compression buffer are held in memory.
+    """
+    _check_pickle5_compression(compression)
+    buffers: list[pickle.PickleBuffer] = []
+    payload = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    sections = []
+    with path.open("wb") as file:
+        file.write(_PICKLE5_MAGIC)
+        for blob in [memoryview(payload), *(buffer.raw() for buffer in buffers)]:
+            file.write(b"\x00" * (-file.tell() % _PICKLE5_ALIGNMENT))
+            offset = file.tell()
+            if compression is None:
+                file.write(blob)
+            else:
+                with pa.CompressedOutputStream(pa.PythonFile(_SectionWriter(file), mode="w"), compression) as stream:
+                    for start in range(0, blob.nbytes, _PICKLE5_CHUNK_SIZE):
+                        stream.write(blob[start : start + _PICKLE5_CHUNK_SIZE])
+            sections.append([offset, file.tell() - offset, blob.nbytes])
+        footer = json.dumps({"compression": compression, "sections": sections}).encode()
+        file.write(footer)
+        file.write(_PICKLE5_TRAILER.pack(len(footer), _PICKLE5_MAGIC))
+
+
+def _read_pickle5(path: Path, *, mmap_mode: MmapMode | None) -> Any:
+    """Unpickle a pickle5 artifact, mapping or reading each blob exactly once."""
+    with path.open("rb") as file:
+        file.seek(-_PICKLE5_TRAILER.size, 2)
+        footer_size, _ = _PICKLE5_TRAILER.unpack(file.read(_PICKLE5_TRAILER.size))
+        file.seek(-_PICKLE5_TRAILER.size - footer_size, 2)
+        footer = json.loads(file.read(footer_size))
+        compression = footer["compression"]
+        _check_pickle5_compression(compression)
+        if mmap_mode is not None:
+            if compression is not None:
+                msg = f"Cannot memory-map compressed pickle5 artifact: {path}"
+                raise ValueError(msg)
+            access = mmap.ACCESS_READ if mmap_mode == "r" else mmap.ACCESS_COPY
+            mapped = memoryview(mmap.mmap(file.fileno(), 0, access=access))
+            blobs: list[Any] = [mapped[offset : offset + size] for offset, size, _ in footer["sections"]]
+        elif compression is None:
+            blobs = []
+            for offset, size, _ in footer["sections"]:
+                file.seek(offset)
+                stored = bytearray(size)
+                file.readinto(stored)
+                blobs.append(stored)
+        else:
+            blobs = _decompress_pickle5_sections(path, footer["sections"], compression)
+    payload, *buffers = blobs
+    return pickle.loads(payload, buffers=buffers)  # noqa: S301
+
+
+def _decompress_pickle5_sections(path: Path, sections: list[list[int]], compression: str) -> list[bytearray]:
+    """Stream each compressed section from a file mapping into its own decompressed buffer.
+
+    The compressed bytes stay in the page cache, so only the decompressed buffers are
+    allocated. They are mutable, so arrays stay writeable without another copy.
+    """
+    blobs = []
+    with pa.memory_map(str(path)) as source:
+        for offset, size, raw_size in sections:
+            blob = bytearray(raw_size)
+            stream = pa.CompressedInputStream(pa.BufferReader(source.read_at(size, offset)), compression)
+            view = memoryview(blob)
+            filled = 0
+            while filled < raw_size:
+                read = stream.readinto(view[filled:])
+                if read == 0:
+                    msg = f"Truncated compressed pickle5 section in {path}."
+                    raise ValueError(msg)
+                filled += read
+            blobs.append(blob)
+    return blobs
+
+
+def _check_pickle5_compression(compression: str | None) -> None:
+    """Reject pickle5 compression codecs that are unknown or not built into pyarrow."""
+    if compression is None:
+        return
+    if compression not in _PICKLE5_COMPRESSION or not pa.Codec.is_available(compression):
+        msg = f"Unsupported pickle5 compression: {compression}. Supported: {list(_PICKLE5_COMPRESSION)}."
+        raise ValueError(msg)
+
+
+class _SectionWriter(io.RawIOBase):
+    """Writable wrapper that leaves the underlying file open when a compressed stream closes."""
+
+    def __init__(self, file: BinaryIO) -> None:
+        super().__init__()
+        self._file = file
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        return self._file.write(data)
+
+
+def _is_pickle5(path: Path) -> bool:
+    """Return whether a file starts with the pickle5 artifact magic."""
+    with path.open("rb") as file:
+        return file.read(len(_PICKLE5_MAGIC)) == _PICKLE5_MAGIC
+
+
+def _read_numpy(path: Path, *, object_format: str, mmap_mode: MmapMode | None) -> Any:
+    """Read an ``npy`` array or every array of an ``npz`` archive."""
+    if object_format == "npy":
+        return np.load(path, mmap_mode=mmap_mode, allow_pickle=False)
+    return _read_npz(path, mmap_mode=mmap_mode)
+
+
+def _read_npz(path: Path, *, mmap_mode: MmapMode | None) -> dict[str, np.ndarray]:
+    """Read every array of an ``npz`` archive, memory-mapping them when requested."""
+    if mmap_mode is None:
+        with np.load(path, allow_pickle=False) as archive:
+            return {name: archive[name] for name in archive.files}
+
+    arrays: dict[str, np.ndarray] = {}
+    with zipfile.ZipFile(path) as archive, path.open("rb") as file:
+        for info in archive.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                msg = f"Cannot memory-map compressed npz member {info.filename} in {path}."
+                raise ValueError(msg)
+            with archive.open(info) as member:
+                version = np.lib.format.read_magic(member)
+                read_header = (
+                    np.lib.format.read_array_header_1_0 if version == (1, 0) else np.lib.format.read_array_header_2_0
+                )
+                shape, fortran_order, dtype = read_header(member)
+                header_size = member.tell()
+            file.seek(info.header_offset)
+            local_header = _ZIP_LOCAL_HEADER.unpack(file.read(_ZIP_LOCAL_HEADER.size))
+            name_size, extra_size = local_header[-2:]
+            data_offset = info.header_offset + _ZIP_LOCAL_HEADER.size + name_size + extra_size + header_size
+            arrays[info.filename.removesuffix(".npy")] = np.memmap(
+                path,
+                dtype=dtype,
+                mode=mmap_mode,
+                shape=shape,
+                order="F" if fortran_order else "C",
+                offset=data_offset,
+            )
+    return arrays
+
+
+class _ReadCache:
+    """Thread-safe, byte-budgeted LRU of loaded artifacts, disabled until configured."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[Path, Hashable], tuple[tuple[int, int], Any, int]] = OrderedDict()
+        self._max_bytes = 0
+        self._current_bytes = 0
+        self._reset_counters()
+
+    def _reset_counters(self) -> None:
+        self._hits = self._misses = self._evictions = self._invalidations = 0
+
+    def configure(self, max_bytes: int) -> None:
+        with self._lock:
+            self._max_bytes = max_bytes
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+            self._reset_counters()
+
+    def stats(self) -> ReadCacheStats:
+        with self._lock:
+            return ReadCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                entries=len(self._entries),
+                current_bytes=self._current_bytes,
+                max_bytes=self._max_bytes,
+            )
+
+    def get_or_load(self, path: Path, read_key: Hashable, load: Callable[[], Any]) -> Any:
+        if self._max_bytes == 0:
+            return load()
+        stat = path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        key = (path, read_key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == signature:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return _shared_copy(entry[1])
+            self._misses += 1
+        obj = load()
+        nbytes = _estimate_nbytes(obj, file_size=stat.st_size)
+        if nbytes > self._max_bytes:
+            return obj
+        _freeze_arrays(obj)
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = (signature, obj, nbytes)
+            self._current_bytes += nbytes
+            self._evict()
+        return _shared_copy(obj)
+
+    def invalidate(self, path: Path) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == path]:
+                self._discard(key)
+                self._invalidations += 1
+
+    def _discard(self, key: tuple[Path, Hashable]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._current_bytes -= entry[2]
+
+    def _evict(self) -> None:
+        while self._entries and self._current_bytes > self._max_bytes:
+            _, (_, _, nbytes) = self._entries.popitem(last=False)
+            self._current_bytes -= nbytes
+            self._evictions += 1
+
+
+def _shared_copy(obj: Any) -> Any:
+    """Return a cached object without exposing the cache entry to in-place edits.
+
+    Dataframes are returned as copy-on-write shallow copies and arrays as read-only
+    views. Other objects are returned as they are.
+    """
+    if isinstance(obj, pd.DataFrame):
+        return obj.copy(deep=False)
+    if isinstance(obj, np.ndarray):
+        return obj.view()
+    if _is_array_dict(obj):
+        return {name: value.view() for name, value in obj.items()}
+    return obj
+
+
+def _freeze_arrays(obj: Any) -> None:
+    """Mark a loaded array, or every array of an ``npz`` mapping, read-only."""
+    arrays = obj.values() if _is_array_dict(obj) else [obj] if isinstance(obj, np.ndarray) else []
+    for array in arrays:
+        array.flags.writeable = False
+
+
+def _is_array_dict(obj: Any) -> bool:
+    return isinstance(obj, dict) and bool(obj) and all(isinstance(value, np.ndarray) for value in obj.values())
+
+
+def _estimate_nbytes(obj: Any, *, file_size: int) -> int:
+    """Estimate the in-memory size of a loaded artifact, falling back to its file size."""
+    if isinstance(obj, pd.DataFrame):
+        return int(obj.memory_usage(index=True, deep=True).sum())
+    if isinstance(obj, np.ndarray):
+        return int(obj.nbytes)
+    if _is_array_dict(obj):
+        return int(sum(value.nbytes for value in obj.values()))
+    return file_size
+
+
+_READ_CACHE = _ReadCache()
+
+
 def _raise_unsupported_format(format_name: str, artifact_kind: str) -> NoReturn:
     """Raise a consistent unsupported-format error."""
     msg = f"Unsupported {artifact_kind} format: {format_name}."
@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+import contextlib
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Any, Protocol, Self
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Protocol, Self
 
 import numpy as np
 import pandas as pd
 
 from mltools.data.schema import feature_columns as schema_feature_columns
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
 BINARY_CLASS_COUNT = 2
 TWO_DIMENSIONS = 2
 
@@ -72,7 +77,111 @@ class BaseModelWrapper(ABC):
 
     @abstractmethod
     def predict(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Predict on a model-ready design matrix."""
+        """Predict on a model-ready design matrix.
+
+        Parameters
+        ----------
+        df
+            Dataframe containing the id column and every recorded feature column.
+
+        Returns
+        -------
+        pd.DataFrame
+            Prediction frame with the id column followed by :meth:`output_columns`,
+            in ``df`` row order.
+        """
+
+    def predict_arrays(
+        self,
+        x: np.ndarray[Any, Any],
+        ids: Any,
+        *,
+        columns: Sequence[str] | None = None,
+    ) -> tuple[np.ndarray[Any, Any], np.ndarray[Any, Any]]:
+        """Predict on a feature array without building dataframes.
+
+        Parameters
+        ----------
+        x
+            Two-dimensional feature array. Columns follow ``feature_names_`` unless
+            ``columns`` is given.
+        ids
+            Row ids returned alongside the outputs.
+        columns
+            Optional column names of ``x``; recorded features are selected by name.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            Row ids and a two-dimensional output array ordered like :meth:`output_columns`.
+        """
+        features = self._recorded_features()
+        values = np.asarray(x)
+        if columns is not None:
+            positions = {column: position for position, column in enumerate(columns)}
+            missing = [feature for feature in features if feature not in positions]
+            if missing:
+                msg = f"Missing feature columns for {self.name}: {missing}."
+                raise ValueError(msg)
+            values = values[:, [positions[feature] for feature in features]]
+        if values.ndim != TWO_DIMENSIONS or values.shape[1] != len(features):
+            msg = f"Expected a 2-D feature array with {len(features)} columns for {self.name}; got {values.shape}."
+            raise ValueError(msg)
+        id_values = np.asarray(ids)
+        if len(id_values) != len(values):
+            msg = f"Expected {len(values)} ids for {self.name}; got {len(id_values)}."
+            raise ValueError(msg)
+        return id_values, self._output_values(self._predict_values(values))
+
+    def predict_records(
+        self,
+        records: Sequence[Mapping[str, Any]],
+    ) -> tuple[np.ndarray[Any, Any], np.ndarray[Any, Any]]:
+        """Predict on a list of feature records without building dataframes.
+
+        Parameters
+        ----------
+        records
+            Mappings containing the id column and every recorded feature.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            Row ids and a two-dimensional output array ordered like :meth:`output_columns`.
+        """
+        features = self._recorded_features()
+        getter = itemgetter(*features)
+        id_col = self._id_col
+        try:
+            ids = [record[id_col] for record in records]
+            rows = [getter(record) for record in records]
+        except KeyError as exc:
+            msg = f"Prediction record for {self.name} is missing column {exc.args[0]!r}."
+            raise ValueError(msg) from exc
+
+        values = np.array(rows, dtype=object).reshape(len(rows), len(features))
+        with contextlib.suppress(TypeError, ValueError):
+            values = values.astype(np.float64)
+        return self.predict_arrays(values, np.array(ids))
+
+    def output_columns(self) -> list[str]:
+        """Return the prediction output column names.
+
+        Returns
+        -------
+        list[str]
+            ``score_1`` for binary classification, ``score_<i>`` per class position for
+            multiclass classification, and ``prediction`` for regression.
+        """
+        if self.task is not Task.CLASSIFICATION:
+            return ["prediction"]
+        class_order = self.class_order_
+        if class_order is None:
+            msg = f"{self.name} has no recorded class order."
+            raise RuntimeError(msg)
+        if len(class_order) == BINARY_CLASS_COUNT:
+            return ["score_1"]
+        return [f"score_{class_index}" for class_index in range(len(class_order))]
 
     def feature_importance(self) -> pd.DataFrame:
         """Return standardized feature importance values.
@@ -85,35 +194,61 @@ class BaseModelWrapper(ABC):
         msg = f"{self.__class__.__name__} does not support feature importance."
         raise NotImplementedError(msg)
 
+    def _predict_values(self, x: pd.DataFrame | np.ndarray[Any, Any]) -> Any:
+        """Return raw backend outputs for selected feature values.
+
+        Backends override this with a direct estimator call. The default scores the
+        values through the frame-based :meth:`predict`.
+        """
+        frame = x if isinstance(x, pd.DataFrame) else self._feature_frame(x)
+        frame = frame.assign(**{self._id_col: np.arange(len(frame))})
+        outputs = self.predict(frame).loc[:, self.output_columns()].to_numpy()
+        return outputs[:, 0] if outputs.shape[1] == 1 else outputs
+
+    def _predict_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Return the prediction frame of backends that implement :meth:`_predict_values`."""
+        x_pred = self._select_recorded_features(df)
+        return self._prediction_frame(df, self._predict_values(x_pred))
+
+    def _feature_frame(self, values: np.ndarray[Any, Any]) -> pd.DataFrame:
+        """Return a feature array as a frame with the recorded feature names."""
+        frame = pd.DataFrame(values, columns=self._recorded_features(), copy=False)
+        # Mixed-type arrays are object arrays; restore per-column dtypes for the backend.
+        return frame.infer_objects() if values.dtype == object else frame
+
     def _record_fit_context(self, fold: FoldDesignMatrix) -> list[str]:
         features = _feature_columns(fold.train, fold.schema)
         self.feature_names_ = features
         self.schema_ = fold.schema
         return features
 
+    def _recorded_features(self) -> list[str]:
+        self._require_fit()
+        if self.feature_names_ is None:
+            msg = f"{self.name} has no recorded feature columns."
+            raise RuntimeError(msg)
+        return self.feature_names_
+
     def _require_fit(self) -> None:
         if not self.is_fit:
             msg = f"{self.name} must be fit before calling predict or feature_importance."
             raise RuntimeError(msg)
 
     def _select_recorded_features(self, df: pd.DataFrame) -> pd.DataFrame:
-        self._require_fit()
-        if self.feature_names_ is None:
-            msg = f"{self.name} has no recorded feature columns."
-            raise RuntimeError(msg)
-        missing = [feature for feature in self.feature_names_ if feature not in df.columns]
+        features = self._recorded_features()
+        missing = [feature for feature in features if feature not in df.columns]
         if missing:
             msg = f"Missing feature columns for {self.name}: {missing}."
             raise ValueError(msg)
-        return df.loc[:, self.feature_names_]
+        return df.loc[:, features]
 
-    def _id_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _id_values(self, df: pd.DataFrame) -> np.ndarray[Any, Any]:
         self._require_fit()
         id_col = self._id_col
         if id_col not in df.columns:
             msg = f"Prediction input for {self.name} is missing id column {id_col!r}."
             raise ValueError(msg)
-        return pd.DataFrame({id_col: df[id_col].to_numpy()})
+        return df[id_col].to_numpy()
 
     @property
     def _id_col(self) -> str:
@@ -136,32 +271,33 @@ class BaseModelWrapper(ABC):
             raise RuntimeError(msg)
         return self.schema_.weight_col
 
-    def _classification_prediction_frame(self, df: pd.DataFrame, probabilities: Any) -> pd.DataFrame:
-        frame = self._id_frame(df)
+    def _output_values(self, predictions: Any) -> np.ndarray[Any, Any]:
+        """Return raw backend outputs as a 2-D array ordered like ``output_columns``."""
+        values = np.asarray(predictions)
+        if self.task is not Task.CLASSIFICATION:
+            return values.reshape(len(values), 1)
         class_order = self.class_order_
         if class_order is None:
             msg = f"{self.name} has no recorded class order."
             raise RuntimeError(msg)
-
-        probs = np.asarray(probabilities)
         if len(class_order) == BINARY_CLASS_COUNT:
-            if probs.ndim == 1:
-                frame["score_1"] = probs
-            else:
-                frame["score_1"] = probs[:, 1]
-            return frame
-
-        if probs.ndim != TWO_DIMENSIONS or probs.shape[1] != len(class_order):
-            msg = f"Expected probabilities with {len(class_order)} columns for {self.name}; got shape {probs.shape}."
+            return (values if values.ndim == 1 else values[:, 1]).reshape(len(values), 1)
+        if values.ndim != TWO_DIMENSIONS or values.shape[1] != len(class_order):
+            msg = f"Expected probabilities with {len(class_order)} columns for {self.name}; got shape {values.shape}."
             raise ValueError(msg)
-        for class_index in range(len(class_order)):
-            frame[f"score_{class_index}"] = probs[:, class_index]
-        return frame
+        return values
+
+    def _prediction_frame(self, df: pd.DataFrame, predictions: Any) -> pd.DataFrame:
+        ids = self._id_values(df)
+        outputs = self._output_values(predictions)
+        columns = dict(zip(self.output_columns(), outputs.T, strict=True))
+        return pd.DataFrame({self._id_col: ids, **columns})
+
+    def _classification_prediction_frame(self, df: pd.DataFrame, probabilities: Any) -> pd.DataFrame:
+        return self._prediction_frame(df, probabilities)
 
     def _regression_prediction_frame(self, df: pd.DataFrame, predictions: Any) -> pd.DataFrame:
-        frame = self._id_frame(df)
-        frame["prediction"] = np.asarray(predictions)
-        return frame
+        return self._prediction_frame(df, predictions)
 
     def _feature_importance_frame(
         self,
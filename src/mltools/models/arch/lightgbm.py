@@ -2,25 +2,22 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Self
+from typing import Any, Self
 
 import lightgbm as lgb
 import numpy as np
-from sklearn.metrics import balanced_accuracy_score
+import pandas as pd
 from sklearn.preprocessing import LabelEncoder
 
+from mltools.data.schema import feature_columns
 from mltools.models.arch.base import BINARY_CLASS_COUNT, BaseModelWrapper, FoldDesignMatrix, Task
-
-if TYPE_CHECKING:
-    import pandas as pd
-
-PROBABILITY_THRESHOLD = 0.5
-
+from mltools.models.metrics import LightGBMEval
 
 _TRAINING_CONTROL_KEYS = {
     "balanced_accuracy_metric_only",
     "diagnostic_metric",
     "early_stopping_rounds",
+    "eval_metrics",
     "log_evaluation_period",
     "n_iter",
     "num_boost_round",
@@ -36,74 +33,180 @@ class LightGBMModel(BaseModelWrapper):
         super().__init__(name=name, task=task, params=params)
         self.booster_: lgb.Booster | None = None
         self._label_encoder: LabelEncoder | None = None
+        self.categories_: dict[str, list[Any]] = {}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore a pickled wrapper, including ones saved before category levels were recorded."""
+        state.setdefault("categories_", {})
+        self.__dict__.update(state)
 
     def fit(self, fold: FoldDesignMatrix) -> Self:
         """Fit a LightGBM booster on fold training data."""
         features = self._record_fit_context(fold)
-        model_params, control = _split_params(self.params)
-        model_params = _with_task_defaults(model_params, self.task, fold.train[self._target_col])
-
-        x_train = fold.train.loc[:, features]
-        x_val = fold.val.loc[:, features]
-        y_train = fold.train[self._target_col]
-        y_val = fold.val[self._target_col]
-
+        self.categories_ = _category_levels(fold.train.loc[:, features])
         if self.task is Task.CLASSIFICATION:
-            self._label_encoder = LabelEncoder()
-            y_train_values = self._label_encoder.fit_transform(y_train)
-            y_val_values = self._label_encoder.transform(y_val)
+            self._label_encoder = LabelEncoder().fit(fold.train[self._target_col])
             self.class_order_ = list(self._label_encoder.classes_)
-            if len(self.class_order_) > BINARY_CLASS_COUNT:
-                model_params.setdefault("num_class", len(self.class_order_))
         else:
-            y_train_values = y_train.to_numpy()
-            y_val_values = y_val.to_numpy()
+            self._label_encoder = None
             self.class_order_ = None
 
+        self.booster_ = self._train(fold, features)
+        self.is_fit = True
+        return self
+
+    def continue_fit(
+        self,
+        fold: FoldDesignMatrix,
+        *,
+        num_boost_round: int | None = None,
+        refit: bool = False,
+        decay_rate: float = 0.9,
+    ) -> Self:
+        """Update the fitted booster on new fold data instead of retraining from scratch.
+
+        Parameters
+        ----------
+        fold
+            Fold design matrix with the same feature columns as the original fit.
+        num_boost_round
+            Additional boosting rounds. Defaults to the configured ``num_boost_round``.
+            Ignored when ``refit`` is true.
+        refit
+            Refit the leaf values of the existing trees with ``Booster.refit`` instead
+            of boosting additional rounds from the existing booster.
+        decay_rate
+            Weight of the existing leaf values when ``refit`` is true.
+
+        Returns
+        -------
+        Self
+            The updated model wrapper.
+
+        Raises
+        ------
+        ValueError
+            If the fold features differ from ``feature_names_`` or the fold contains
+            classes outside ``class_order_``.
+        """
+        booster = self._require_booster()
+        features = feature_columns(fold.train, fold.schema)
+        if features != self.feature_names_:
+            msg = f"{self.name} was fit on features {self.feature_names_}; continue_fit received {features}."
+            raise ValueError(msg)
+        self.schema_ = fold.schema
+
+        if refit:
+            self.booster_ = booster.refit(
+                self._design_matrix(fold.train.loc[:, features]),
+                self._encode_labels(fold.train[self._target_col]),
+                decay_rate=decay_rate,
+                weight=_weight_values(fold.train, self._weight_col),
+            )
+        else:
+            self.booster_ = self._train(fold, features, num_boost_round=num_boost_round, init_model=booster)
+        return self
+
+    def _train(
+        self,
+        fold: FoldDesignMatrix,
+        features: list[str],
+        *,
+        num_boost_round: int | None = None,
+        init_model: lgb.Booster | None = None,
+    ) -> lgb.Booster:
+        model_params, control = _split_params(self.params)
+        model_params = _with_task_defaults(model_params, self.task, len(self.class_order_ or []))
+
         train_weight = _weight_values(fold.train, self._weight_col)
         val_weight = _weight_values(fold.val, self._weight_col)
-        train_set = lgb.Dataset(x_train, label=y_train_values, weight=train_weight, feature_name=features)
-        val_set = lgb.Dataset(x_val, label=y_val_values, weight=val_weight, reference=train_set, feature_name=features)
+        train_set = lgb.Dataset(
+            self._design_matrix(fold.train.loc[:, features]),
+            label=self._encode_labels(fold.train[self._target_col]),
+            weight=train_weight,
+            feature_name=features,
+            categorical_feature=list(self.categories_) or "auto",
+        )
+        val_set = lgb.Dataset(
+            self._design_matrix(fold.val.loc[:, features]),
+            label=self._encode_labels(fold.val[self._target_col]),
+            weight=val_weight,
+            reference=train_set,
+            feature_name=features,
+        )
 
         callbacks = _callbacks(control)
-        feval = _balanced_accuracy_eval if control["use_balanced_accuracy_eval"] else None
+        eval_metrics = control["eval_metrics"]
+        if control["use_balanced_accuracy_eval"]:
+            eval_metrics = ["balanced_accuracy", *eval_metrics]
+        feval = LightGBMEval(eval_metrics) if eval_metrics else None
         if control["balanced_accuracy_metric_only"]:
             model_params["metric"] = "None"
         if control["diagnostic_metric"] and "metric" not in model_params:
             model_params["metric"] = control["diagnostic_metric"]
 
-        self.booster_ = lgb.train(
+        return lgb.train(
             model_params,
             train_set,
-            num_boost_round=control["num_boost_round"],
+            num_boost_round=control["num_boost_round"] if num_boost_round is None else num_boost_round,
             valid_sets=[val_set],
             valid_names=["valid"],
             feval=feval,
+            init_model=init_model,
             callbacks=callbacks,
         )
-        self.is_fit = True
-        return self
 
-    def predict(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Return a prediction frame for a model-ready dataframe."""
+    def _encode_labels(self, y: pd.Series) -> np.ndarray[Any, Any]:
+        if self.task is not Task.CLASSIFICATION:
+            return y.to_numpy()
+        if self._label_encoder is None or self.class_order_ is None:
+            msg = f"{self.name} has no fitted label encoder."
+            raise RuntimeError(msg)
+        unknown = [label for label in y.unique().tolist() if label not in self.class_order_]
+        if unknown:
+            msg = f"Labels for {self.name} contain classes not seen during fit: {unknown}."
+            raise ValueError(msg)
+        return self._label_encoder.transform(y)
+
+    def _design_matrix(self, x: pd.DataFrame) -> pd.DataFrame:
+        """Replace categorical feature values with the integer codes recorded at fit time."""
+        if not self.categories_:
+            return x
+        codes = {col: _category_codes(x[col], levels) for col, levels in self.categories_.items()}
+        return x.assign(**codes)
+
+    def _design_array(self, x: np.ndarray[Any, Any]) -> np.ndarray[Any, Any]:
+        """Return a float feature array with categorical features replaced by their codes."""
+        if not self.categories_:
+            return x
+        features = self.feature_names_ or []
+        values = np.empty(x.shape, dtype=np.float64)
+        for position, feature in enumerate(features):
+            levels = self.categories_.get(feature)
+            values[:, position] = x[:, position] if levels is None else _category_codes(x[:, position], levels)
+        return values
+
+    def _require_booster(self) -> lgb.Booster:
         self._require_fit()
         if self.booster_ is None:
             msg = f"{self.name} has no fitted LightGBM booster."
             raise RuntimeError(msg)
-        x_pred = self._select_recorded_features(df)
-        predictions = self.booster_.predict(x_pred, num_iteration=self.booster_.best_iteration or None)
-        if self.task is Task.CLASSIFICATION:
-            return self._classification_prediction_frame(df, predictions)
-        return self._regression_prediction_frame(df, predictions)
+        return self.booster_
+
+    def predict(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Return a prediction frame for a model-ready dataframe."""
+        return self._predict_frame(df)
+
+    def _predict_values(self, x: pd.DataFrame | np.ndarray[Any, Any]) -> Any:
+        booster = self._require_booster()
+        x_pred = self._design_matrix(x) if isinstance(x, pd.DataFrame) else self._design_array(x)
+        return booster.predict(x_pred, num_iteration=booster.best_iteration or None)
 
     def feature_importance(self) -> pd.DataFrame:
         """Return standardized native LightGBM gain importance values."""
-        self._require_fit()
-        if self.booster_ is None:
-            msg = f"{self.name} has no fitted LightGBM booster."
-            raise RuntimeError(msg)
-        features = list(self.booster_.feature_name())
-        gains = self.booster_.feature_importance(importance_type="gain")
+        booster = self._require_booster()
+        features = list(booster.feature_name())
+        gains = booster.feature_importance(importance_type="gain")
         return self._feature_importance_frame(features, gains, importance_type="gain")
 
 
@@ -113,6 +216,7 @@ def _split_params(params: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any
         "balanced_accuracy_metric_only": bool(params.get("balanced_accuracy_metric_only", False)),
         "diagnostic_metric": params.get("diagnostic_metric"),
         "early_stopping_rounds": params.get("early_stopping_rounds"),
+        "eval_metrics": list(params.get("eval_metrics") or []),
         "log_evaluation_period": params.get("log_evaluation_period", 0),
         "num_boost_round": int(params.get("num_boost_round", params.get("n_iter", 100))),
         "use_balanced_accuracy_eval": bool(params.get("use_balanced_accuracy_eval", False)),
@@ -120,13 +224,14 @@ def _split_params(params: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any
     return model_params, control
 
 
-def _with_task_defaults(params: dict[str, Any], task: Task, y_train: pd.Series) -> dict[str, Any]:
+def _with_task_defaults(params: dict[str, Any], task: Task, n_classes: int) -> dict[str, Any]:
     model_params = dict(params)
     model_params.setdefault("verbosity", -1)
     if task is Task.CLASSIFICATION:
-        n_classes = int(y_train.nunique())
         model_params.setdefault("objective", "binary" if n_classes == BINARY_CLASS_COUNT else "multiclass")
         model_params.setdefault("metric", "binary_logloss" if n_classes == BINARY_CLASS_COUNT else "multi_logloss")
+        if n_classes > BINARY_CLASS_COUNT:
+            model_params.setdefault("num_class", n_classes)
     else:
         model_params.setdefault("objective", "regression")
         model_params.setdefault("metric", "rmse")
@@ -154,11 +259,20 @@ def _weight_values(df: pd.DataFrame, weight_col: str | None) -> np.ndarray[Any,
     return df[weight_col].to_numpy()
 
 
-def _balanced_accuracy_eval(preds: np.ndarray[Any, Any], data: lgb.Dataset) -> tuple[str, float, bool]:
-    labels = data.get_label()
-    if labels is None:
-        msg = "LightGBM evaluation data is missing labels."
-        raise ValueError(msg)
-    predicted_labels = (preds >= PROBABILITY_THRESHOLD).astype(int) if preds.ndim == 1 else np.argmax(preds, axis=1)
-    score = balanced_accuracy_score(labels, predicted_labels)
-    return "balanced_accuracy", float(score), True
+def _category_levels(x: pd.DataFrame) -> dict[str, list[Any]]:
+    """Return the category levels of every ``category`` dtype column in column order."""
+    return {
+        str(col): x[col].cat.categories.tolist() for col in x.columns if isinstance(x[col].dtype, pd.CategoricalDtype)
+    }
+
+
+def _category_codes(values: pd.Series | np.ndarray[Any, Any], levels: list[Any]) -> np.ndarray[Any, Any]:
+    """Map values onto fitted category codes, using NaN for missing and unseen levels."""
+    if isinstance(values, pd.Series) and isinstance(values.dtype, pd.CategoricalDtype):
+        # Recode through the (small) category index rather than hashing every row.
+        # A trailing -1 sentinel keeps missing values (code -1) missing after the lookup.
+        level_codes = np.append(pd.Index(levels).get_indexer(values.cat.categories), -1)
+        codes = level_codes[values.cat.codes.to_numpy()]
+    else:
+        codes = pd.Index(levels).get_indexer(values)
+    return np.where(codes >= 0, codes, np.nan)
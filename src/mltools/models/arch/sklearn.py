@@ -2,13 +2,24 @@
 
 from __future__ import annotations
 
-from typing import Any, Self
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Self
 
 import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
 
+from mltools.data.schema import feature_columns
 from mltools.models.arch.base import BaseModelWrapper, FoldDesignMatrix, Task
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from mltools.data.schema import DatasetSchema
+
 
 class SklearnModel(BaseModelWrapper):
     """Wrap an existing sklearn estimator or pipeline."""
@@ -43,32 +54,194 @@ class SklearnModel(BaseModelWrapper):
         y_train = fold.train[self._target_col]
         self.estimator.fit(x_train, y_train)
 
-        if self.task is Task.CLASSIFICATION:
-            classes = getattr(self.estimator, "classes_", None)
-            if classes is None:
-                classes = getattr(_final_estimator(self.estimator), "classes_", None)
-            if classes is None:
-                msg = f"{self.name} fitted classifier does not expose classes_."
-                raise RuntimeError(msg)
-            self.class_order_ = list(classes)
-        else:
-            self.class_order_ = None
+        self.class_order_ = list(self._fitted_classes()) if self.task is Task.CLASSIFICATION else None
 
         self.is_fit = True
         return self
 
+    def fit_stream(  # noqa: PLR0913
+        self,
+        chunks: Sequence[pd.DataFrame] | str | Path,
+        *,
+        schema: DatasetSchema,
+        classes: Sequence[Any] | None = None,
+        epochs: int = 1,
+        shuffle: bool = True,
+        random_state: int | None = None,
+    ) -> Self:
+        """Fit the wrapped estimator incrementally with ``partial_fit``.
+
+        Parameters
+        ----------
+        chunks
+            Model-ready row chunks, or a parquet file whose row groups are used as chunks.
+        schema
+            Dataset schema identifying the id, target, and optional weight columns.
+        classes
+            All class labels for classification. Defaults to the labels in the first chunk.
+        epochs
+            Number of passes over all chunks.
+        shuffle
+            Whether to shuffle the chunk order in every epoch.
+        random_state
+            Seed for the chunk order.
+
+        Returns
+        -------
+        Self
+            The fitted model wrapper.
+
+        Raises
+        ------
+        NotImplementedError
+            If the estimator does not implement ``partial_fit``.
+        """
+        if not hasattr(self.estimator, "partial_fit"):
+            msg = f"{self.name} requires partial_fit for streaming training."
+            raise NotImplementedError(msg)
+        if epochs < 1:
+            msg = f"epochs must be at least 1, got {epochs}."
+            raise ValueError(msg)
+        source = _ChunkSource(chunks)
+        if len(source) == 0:
+            msg = "chunks must contain at least one chunk."
+            raise ValueError(msg)
+
+        rng = np.random.default_rng(random_state)
+        fit_kwargs: dict[str, Any] = {}
+        for epoch in range(epochs):
+            order = rng.permutation(len(source)) if shuffle else np.arange(len(source))
+            for position, chunk_index in enumerate(order):
+                chunk = source.load(int(chunk_index))
+                if epoch == 0 and position == 0:
+                    fit_kwargs = self._start_stream(chunk, schema, classes)
+                x_chunk = self._select_stream_features(chunk)
+                y_chunk = chunk[schema.target_col]
+                if schema.weight_col is not None:
+                    fit_kwargs["sample_weight"] = chunk[schema.weight_col].to_numpy()
+                self.estimator.partial_fit(x_chunk, y_chunk, **fit_kwargs)
+                fit_kwargs.pop("classes", None)
+
+        if self.task is Task.CLASSIFICATION:
+            # partial_fit sorts the given classes; predict_proba columns follow classes_.
+            self.class_order_ = np.asarray(self._fitted_classes()).tolist()
+        self.is_fit = True
+        return self
+
+    def _start_stream(
+        self,
+        chunk: pd.DataFrame,
+        schema: DatasetSchema,
+        classes: Sequence[Any] | None,
+    ) -> dict[str, Any]:
+        self.feature_names_ = feature_columns(chunk, schema)
+        self.schema_ = schema
+        self.class_order_ = None
+        if self.task is not Task.CLASSIFICATION:
+            return {}
+        class_values = np.asarray(classes) if classes is not None else np.unique(chunk[schema.target_col])
+        return {"classes": class_values}
+
+    def _fitted_classes(self) -> Any:
+        classes = getattr(self.estimator, "classes_", None)
+        if classes is None:
+            classes = getattr(_final_estimator(self.estimator), "classes_", None)
+        if classes is None:
+            msg = f"{self.name} fitted classifier does not expose classes_."
+            raise RuntimeError(msg)
+        return classes
+
+    def _select_stream_features(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        features = self.feature_names_ or []
+        missing = [feature for feature in features if feature not in chunk.columns]
+        if missing:
+            msg = f"Missing feature columns for {self.name}: {missing}."
+            raise ValueError(msg)
+        return chunk.loc[:, features]
+
     def predict(self, df: pd.DataFrame) -> pd.DataFrame:
         """Return a prediction frame for a model-ready dataframe."""
+        return self._predict_frame(df)
+
+    def _predict_values(self, x: pd.DataFrame | np.ndarray[Any, Any]) -> Any:
+        predict = getattr(self.estimator, self._prediction_method())
+        if not isinstance(x, pd.DataFrame):
+            # The estimator was fitted on a frame; name-based steps such as ColumnTransformer need the columns.
+            x = self._feature_frame(x)
+        return predict(x)
+
+    def predict_sharded(
+        self,
+        df: pd.DataFrame,
+        *,
+        n_jobs: int | None = None,
+        block_rows: int = 100_000,
+    ) -> pd.DataFrame:
+        """Return a prediction frame scored in row blocks across a process pool.
+
+        The fitted estimator is sent once to each worker. Numeric feature blocks are
+        shared with the workers through shared memory instead of being pickled.
+
+        Parameters
+        ----------
+        df
+            Model-ready dataframe.
+        n_jobs
+            Number of worker processes. Defaults to the CPU count.
+        block_rows
+            Maximum number of rows scored per task.
+
+        Returns
+        -------
+        pd.DataFrame
+            Prediction frame identical to :meth:`predict`.
+        """
+        if block_rows < 1:
+            msg = f"block_rows must be at least 1, got {block_rows}."
+            raise ValueError(msg)
         x_pred = self._select_recorded_features(df)
-        if self.task is Task.CLASSIFICATION:
-            if not hasattr(self.estimator, "predict_proba"):
-                msg = f"{self.name} requires predict_proba for classification predictions."
-                raise NotImplementedError(msg)
-            probabilities = self.estimator.predict_proba(x_pred)
-            return self._classification_prediction_frame(df, probabilities)
+        method = self._prediction_method()
+        workers = min(n_jobs or os.cpu_count() or 1, -(-len(x_pred) // block_rows))
+        if workers <= 1:
+            return self.predict(df)
 
-        predictions = self.estimator.predict(x_pred)
-        return self._regression_prediction_frame(df, predictions)
+        bounds = [(start, min(start + block_rows, len(x_pred))) for start in range(0, len(x_pred), block_rows)]
+        numeric = all(pd.api.types.is_numeric_dtype(dtype) for dtype in x_pred.dtypes)
+        shm = None
+        try:
+            if numeric:
+                values = x_pred.to_numpy(dtype=np.float64)
+                shm = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+                np.ndarray(values.shape, dtype=values.dtype, buffer=shm.buf)[:] = values
+                shared = (shm.name, values.shape, values.dtype.str)
+            else:
+                shared = None
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_predict_worker,
+                initargs=(self.estimator, method, list(x_pred.columns), shared),
+            ) as executor:
+                if numeric:
+                    futures = [executor.submit(_predict_block, start, stop) for start, stop in bounds]
+                else:
+                    futures = [
+                        executor.submit(_predict_block, start, stop, x_pred.iloc[start:stop]) for start, stop in bounds
+                    ]
+                predictions = np.concatenate([future.result() for future in futures])
+        finally:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+
+        return self._prediction_frame(df, predictions)
+
+    def _prediction_method(self) -> str:
+        if self.task is not Task.CLASSIFICATION:
+            return "predict"
+        if not hasattr(self.estimator, "predict_proba"):
+            msg = f"{self.name} requires predict_proba for classification predictions."
+            raise NotImplementedError(msg)
+        return "predict_proba"
 
     def feature_importance(self) -> pd.DataFrame:
         """Return standardized sklearn feature importance values."""
@@ -120,6 +293,53 @@ class SklearnModel(BaseModelWrapper):
         raise NotImplementedError(msg)
 
 
+class _ChunkSource:
+    """Random access to in-memory frames or parquet row groups."""
+
+    def __init__(self, chunks: Sequence[pd.DataFrame] | str | Path) -> None:
+        self._frames: Sequence[pd.DataFrame] | None = None
+        self._parquet: pq.ParquetFile | None = None
+        if isinstance(chunks, str | Path):
+            self._parquet = pq.ParquetFile(Path(chunks))
+        else:
+            self._frames = chunks
+
+    def __len__(self) -> int:
+        if self._parquet is not None:
+            return self._parquet.num_row_groups
+        return len(self._frames or [])
+
+    def load(self, index: int) -> pd.DataFrame:
+        if self._parquet is not None:
+            return self._parquet.read_row_group(index).to_pandas()
+        return (self._frames or [])[index]
+
+
+_WORKER_STATE: dict[str, Any] = {}
+
+
+def _init_predict_worker(
+    estimator: Any,
+    method: str,
+    features: list[str],
+    shared: tuple[str, tuple[int, ...], str] | None,
+) -> None:
+    """Store the estimator and attach the shared feature block once per worker process."""
+    _WORKER_STATE.update(predict=getattr(estimator, method), features=features, values=None)
+    if shared is not None:
+        name, shape, dtype = shared
+        # Workers share the parent's resource tracker, so the parent's unlink releases the segment.
+        shm = shared_memory.SharedMemory(name=name)
+        _WORKER_STATE.update(shm=shm, values=np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf))
+
+
+def _predict_block(start: int, stop: int, block: pd.DataFrame | None = None) -> np.ndarray[Any, Any]:
+    """Score one row block inside a worker process."""
+    if block is None:
+        block = pd.DataFrame(_WORKER_STATE["values"][start:stop], columns=_WORKER_STATE["features"], copy=False)
+    return np.asarray(_WORKER_STATE["predict"](block))
+
+
 def _final_estimator(estimator: Any) -> Any:
     if hasattr(estimator, "steps") and estimator.steps:
         return estimator.steps[-1][1]
@@ -5,9 +5,12 @@ from __future__ import annotations
 from collections import Counter
 from typing import TYPE_CHECKING, Any, TypeAlias
 
+import numpy as np
 import pandas as pd
 from pydantic import BaseModel, ConfigDict
 
+from mltools.models.metrics import EvalLabels, evaluate
+
 if TYPE_CHECKING:
     from collections.abc import Callable, Sequence
 
@@ -59,6 +62,112 @@ class CVTrainingResult(BaseModel):
         frames = [fold_result.train_predictions for fold_result in self.fold_results]
         return _concat_prediction_frames(frames, id_col=self.id_col, validate_duplicate_ids=False)
 
+    def fold_scores(
+        self,
+        *,
+        labels: pd.DataFrame,
+        target_col: str,
+        metrics: Sequence[str],
+        weight_col: str | None = None,
+    ) -> pd.DataFrame:
+        """Score each fold's validation predictions.
+
+        Parameters
+        ----------
+        labels
+            Frame with the id, target, and optional weight column for every validation id.
+        target_col
+            Name of the target column in ``labels``.
+        metrics
+            Metric names supported by :func:`mltools.models.metrics.evaluate`.
+        weight_col
+            Optional weight column in ``labels``.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per fold with a ``fold_id`` column and one column per metric.
+        """
+        if self.id_col is None:
+            msg = "fold_scores requires an id column."
+            raise ValueError(msg)
+        label_index = pd.Index(labels[self.id_col])
+        rows = []
+        for fold_result in self.fold_results:
+            preds = fold_result.val_predictions
+            positions = label_index.get_indexer(preds[self.id_col])
+            if (positions < 0).any():
+                missing_ids = preds.loc[positions < 0, self.id_col].tolist()
+                msg = f"labels are missing fold {fold_result.fold_id} validation ids: {missing_ids}."
+                raise ValueError(msg)
+            fold_labels = labels.iloc[positions]
+            y_true = fold_labels[target_col].to_numpy()
+            class_order = getattr(fold_result.model, "class_order_", None)
+            if class_order is not None:
+                y_true = pd.Index(class_order).get_indexer(y_true)
+            weights = fold_labels[weight_col].to_numpy() if weight_col is not None else None
+
+            output_cols = [col for col in preds.columns if col != self.id_col]
+            y_pred = preds[output_cols].to_numpy(dtype=float)
+            if len(output_cols) == 1:
+                y_pred = y_pred[:, 0]
+            scores = evaluate(EvalLabels(y_true, weights), y_pred, metrics)
+            rows.append({"fold_id": fold_result.fold_id, **scores})
+        return pd.DataFrame(rows, columns=["fold_id", *metrics])
+
+    def predict_averaged(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Average the fold models' predictions on one dataframe.
+
+        The feature block is extracted once and every fold model adds its outputs to a
+        preallocated accumulator, so no per-fold prediction frames are built or realigned.
+        Fold models are scored through :meth:`BaseModelWrapper.predict_arrays`, which
+        hands sklearn pipelines named frames and falls back to ``predict`` for wrappers
+        without a direct array path.
+
+        Parameters
+        ----------
+        df
+            Model-ready dataframe with the id column and every fold model feature.
+
+        Returns
+        -------
+        pd.DataFrame
+            Prediction frame with the id column and the averaged output columns in
+            ``df`` row order.
+        """
+        models = self.models()
+        if not models:
+            msg = "predict_averaged requires at least one fold model."
+            raise ValueError(msg)
+        schema = models[0].schema_
+        id_col = self.id_col or (str(schema.id_col) if schema is not None else None)
+        if id_col is None or id_col not in df.columns:
+            msg = f"predict_averaged input is missing id column {id_col!r}."
+            raise ValueError(msg)
+
+        features = list(dict.fromkeys(feature for model in models for feature in model.feature_names_ or []))
+        missing = [feature for feature in features if feature not in df.columns]
+        if missing:
+            msg = f"predict_averaged input is missing feature columns: {missing}."
+            raise ValueError(msg)
+        values = df.loc[:, features].to_numpy()
+        ids = df[id_col].to_numpy()
+
+        output_cols = models[0].output_columns()
+        totals = np.zeros((len(df), len(output_cols)))
+        for fold_result in self.fold_results:
+            model = fold_result.model
+            if model.output_columns() != output_cols:
+                msg = (
+                    f"fold {fold_result.fold_id} outputs {model.output_columns()} do not match fold "
+                    f"{self.fold_results[0].fold_id} outputs {output_cols}."
+                )
+                raise ValueError(msg)
+            columns = None if model.feature_names_ == features else features
+            totals += model.predict_arrays(values, ids, columns=columns)[1]
+        totals /= len(models)
+        return pd.DataFrame({id_col: ids, **dict(zip(output_cols, totals.T, strict=True))})
+
     def models(self) -> list[BaseModelWrapper]:
         """Return fitted fold model wrappers in fold order.
 
@@ -2,17 +2,26 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal, NoReturn
 
 import numpy as np
 import pandas as pd
-from pydantic import BaseModel, Field
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from pydantic import BaseModel, ConfigDict, Field
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping, Sequence
+    from collections.abc import Iterator, Mapping, Sequence
 
+    import numpy.typing as npt
+
+    from mltools.artifacts import ArtifactLayout
     from mltools.data.schema import DatasetSchema
 
+FoldAlignment = Literal["row_order", "sorted_id"]
+
 
 def validate_prediction_frame(
     preds: pd.DataFrame,
@@ -23,6 +32,8 @@ def validate_prediction_frame(
 ) -> None:
     """Validate the common prediction-frame contract.
 
+    Ids and output values are checked in a single pass over the required columns.
+
     Parameters
     ----------
     preds
@@ -40,25 +51,7 @@ def validate_prediction_frame(
         msg = f"{context} is missing required columns: {missing_cols}."
         raise ValueError(msg)
 
-    if preds[id_col].duplicated().any():
-        duplicate_ids = preds.loc[preds[id_col].duplicated(keep=False), id_col].unique().tolist()
-        msg = f"{context} contains duplicate ids in {id_col}: {duplicate_ids}."
-        raise ValueError(msg)
-
-    if not output_cols:
-        msg = f"{context} must include at least one output column."
-        raise ValueError(msg)
-
-    outputs = preds.loc[:, list(output_cols)]
-    try:
-        output_values = outputs.to_numpy(dtype=float)
-    except (TypeError, ValueError) as exc:
-        msg = f"{context} contains non-numeric output values in columns: {list(output_cols)}."
-        raise ValueError(msg) from exc
-
-    if not np.isfinite(output_values).all():
-        msg = f"{context} contains non-finite output values in columns: {list(output_cols)}."
-        raise ValueError(msg)
+    _check_prediction_values(preds, id_col=id_col, output_cols=output_cols, context=context)
 
 
 def stack_feature_names(model_name: str, score_cols: Sequence[str]) -> list[str]:
@@ -83,14 +76,30 @@ def stack_feature_names(model_name: str, score_cols: Sequence[str]) -> list[str]
     return [f"{model_name}_{score_col}" for score_col in score_cols]
 
 
-def build_oof_stack_matrix(
+class StackBlock(BaseModel):
+    """Level-2 stack features as one contiguous 2-D array.
+
+    ``matrix`` is row-major with one column per entry of ``feature_names``, so it can be
+    passed straight to a level-2 model without building a DataFrame.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    ids: np.ndarray[Any, Any]
+    matrix: np.ndarray[Any, Any]
+    feature_names: list[str]
+    target: np.ndarray[Any, Any] | None = None
+
+
+def build_oof_stack_block(
     *,
     schema: DatasetSchema,
     labels: pd.DataFrame,
     predictions: Mapping[str, pd.DataFrame],
     output_cols_by_model: Mapping[str, Sequence[str]] | None = None,
-) -> pd.DataFrame:
-    """Build a supervised out-of-fold level-2 stack matrix.
+    dtype: npt.DTypeLike = np.float64,
+) -> StackBlock:
+    """Build out-of-fold level-2 stack features and targets as raw arrays in label row order.
 
     Parameters
     ----------
@@ -102,47 +111,56 @@ def build_oof_stack_matrix(
         Mapping from base model name to OOF prediction frame.
     output_cols_by_model
         Optional explicit output columns for each base model.
+    dtype
+        Floating dtype of the block, typically ``float64`` or ``float32``.
     """
-    _validate_labels(labels, schema=schema)
-    if not predictions:
-        msg = "predictions must include at least one base model."
-        raise ValueError(msg)
-
-    output_cols = _resolve_output_cols_by_model(
+    ids, values, feature_names = _oof_stack_values(
+        schema=schema,
+        labels=labels,
         predictions=predictions,
         output_cols_by_model=output_cols_by_model,
-        id_col=schema.id_col,
-        target_col=schema.target_col,
+        dtype=dtype,
+    )
+    return StackBlock(
+        ids=ids.to_numpy(),
+        matrix=values,
+        feature_names=feature_names,
+        target=labels[schema.target_col].to_numpy(),
     )
-    _validate_stack_feature_collisions(output_cols)
 
-    stack_matrix = labels.loc[:, [schema.id_col, schema.target_col]].copy()
-    expected_ids = labels[schema.id_col]
 
-    for model_name, prediction_frame in predictions.items():
-        model_output_cols = output_cols[model_name]
-        validate_prediction_frame(
-            prediction_frame,
-            id_col=schema.id_col,
-            output_cols=model_output_cols,
-            context=f"{model_name} OOF predictions",
-        )
-        _raise_for_id_mismatch(
-            actual_ids=prediction_frame[schema.id_col],
-            expected_ids=expected_ids,
-            context=f"{model_name} OOF predictions",
-        )
-        aligned_predictions = _align_prediction_frame(
-            prediction_frame=prediction_frame,
-            id_col=schema.id_col,
-            output_cols=model_output_cols,
-            ordered_ids=expected_ids,
-        )
-        feature_names = stack_feature_names(model_name, model_output_cols)
-        for output_col, feature_name in zip(model_output_cols, feature_names, strict=True):
-            stack_matrix[feature_name] = aligned_predictions[output_col].to_numpy()
+def build_oof_stack_matrix(
+    *,
+    schema: DatasetSchema,
+    labels: pd.DataFrame,
+    predictions: Mapping[str, pd.DataFrame],
+    output_cols_by_model: Mapping[str, Sequence[str]] | None = None,
+    dtype: npt.DTypeLike = np.float64,
+) -> pd.DataFrame:
+    """Build a supervised out-of-fold level-2 stack matrix.
 
-    return stack_matrix
+    Parameters
+    ----------
+    schema
+        Dataset schema with id and target column names.
+    labels
+        Label frame containing exactly the ids and targets for OOF training.
+    predictions
+        Mapping from base model name to OOF prediction frame.
+    output_cols_by_model
+        Optional explicit output columns for each base model.
+    dtype
+        Floating dtype of the stack-feature columns.
+    """
+    _, values, feature_names = _oof_stack_values(
+        schema=schema,
+        labels=labels,
+        predictions=predictions,
+        output_cols_by_model=output_cols_by_model,
+        dtype=dtype,
+    )
+    stack_features = pd.DataFrame(values, index=labels.index, columns=feature_names, copy=False)
+    return pd.concat([labels.loc[:, [schema.id_col, schema.target_col]], stack_features], axis=1)
 
 
 def average_fold_predictions(
@@ -172,28 +190,47 @@ def average_fold_predictions(
     first_frame = prediction_frames[0]
     validate_prediction_frame(first_frame, id_col=schema.id_col, output_cols=output_cols, context="fold 0 predictions")
 
-    ordered_ids = first_frame[schema.id_col]
-    totals = _align_prediction_frame(
-        prediction_frame=first_frame,
-        id_col=schema.id_col,
-        output_cols=output_cols,
-        ordered_ids=ordered_ids,
-    ).loc[:, list(output_cols)]
+    ordered_ids = _IdIndex(first_frame[schema.id_col])
+    totals = first_frame.loc[:, list(output_cols)].to_numpy(dtype=float, copy=True)
 
     for fold_index, prediction_frame in enumerate(prediction_frames[1:], start=1):
         context = f"fold {fold_index} predictions"
         validate_prediction_frame(prediction_frame, id_col=schema.id_col, output_cols=output_cols, context=context)
-        _raise_for_id_mismatch(actual_ids=prediction_frame[schema.id_col], expected_ids=ordered_ids, context=context)
-        aligned_predictions = _align_prediction_frame(
-            prediction_frame=prediction_frame,
-            id_col=schema.id_col,
-            output_cols=output_cols,
-            ordered_ids=ordered_ids,
-        )
-        totals += aligned_predictions.loc[:, list(output_cols)]
+        positions = ordered_ids.positions(prediction_frame[schema.id_col], context=context)
+        totals += prediction_frame.loc[:, list(output_cols)].to_numpy(dtype=float)[positions]
+
+    totals /= len(prediction_frames)
+    averaged = pd.DataFrame(totals, columns=list(output_cols))
+    return pd.concat([ordered_ids.ids.reset_index(drop=True), averaged], axis=1)
+
 
-    averaged = totals / len(prediction_frames)
-    return pd.concat([ordered_ids.reset_index(drop=True), averaged.reset_index(drop=True)], axis=1)
+def build_serving_stack_block(
+    *,
+    schema: DatasetSchema,
+    base_predictions: Mapping[str, pd.DataFrame],
+    output_cols_by_model: Mapping[str, Sequence[str]] | None = None,
+    dtype: npt.DTypeLike = np.float64,
+) -> StackBlock:
+    """Build serving level-2 stack features as a raw block in first-model row order.
+
+    Parameters
+    ----------
+    schema
+        Dataset schema with id and target column names.
+    base_predictions
+        Mapping from base model name to serving prediction frame.
+    output_cols_by_model
+        Optional explicit output columns for each base model.
+    dtype
+        Floating dtype of the block, typically ``float64`` or ``float32``.
+    """
+    ids, values, feature_names = _serving_stack_values(
+        schema=schema,
+        base_predictions=base_predictions,
+        output_cols_by_model=output_cols_by_model,
+        dtype=dtype,
+    )
+    return StackBlock(ids=ids.to_numpy(), matrix=values, feature_names=feature_names)
 
 
 def build_serving_stack_matrix(
@@ -201,6 +238,7 @@ def build_serving_stack_matrix(
     schema: DatasetSchema,
     base_predictions: Mapping[str, pd.DataFrame],
     output_cols_by_model: Mapping[str, Sequence[str]] | None = None,
+    dtype: npt.DTypeLike = np.float64,
 ) -> pd.DataFrame:
     """Build an unsupervised serving level-2 stack matrix.
 
@@ -212,7 +250,206 @@ def build_serving_stack_matrix(
         Mapping from base model name to serving prediction frame.
     output_cols_by_model
         Optional explicit output columns for each base model.
+    dtype
+        Floating dtype of the stack-feature columns.
     """
+    ids, values, feature_names = _serving_stack_values(
+        schema=schema,
+        base_predictions=base_predictions,
+        output_cols_by_model=output_cols_by_model,
+        dtype=dtype,
+    )
+    stack_features = pd.DataFrame(values, columns=feature_names, copy=False)
+    return pd.concat([ids.reset_index(drop=True), stack_features], axis=1)
+
+
+def average_fold_prediction_artifacts(  # noqa: PLR0913
+    layout: ArtifactLayout,
+    *,
+    schema: DatasetSchema,
+    model_name: str,
+    split: str,
+    fold_ids: Sequence[int],
+    output_cols: Sequence[str],
+    output_path: str | Path,
+    batch_rows: int = 1_000_000,
+    alignment: FoldAlignment = "row_order",
+) -> Path:
+    """Average parquet fold prediction artifacts out of core.
+
+    Fold predictions are read from ``layout.prediction_path(..., suffix=".parquet")``
+    ``batch_rows`` rows at a time and summed into a NumPy buffer, so memory stays bounded
+    by one chunk per fold. Folds are aligned in one of two ways:
+
+    - ``"row_order"``: every fold is written in the same row order; each chunk's ids are
+      checked against the first fold. The first fold's ids are kept in memory to reject
+      duplicate ids.
+    - ``"sorted_id"``: every fold is sorted by strictly increasing id, in any chunking;
+      folds are merged by id and duplicates are rejected in constant memory.
+
+    Parameters
+    ----------
+    layout
+        Artifact layout containing the fold prediction artifacts.
+    schema
+        Dataset schema with the id column name.
+    model_name
+        Base model whose fold predictions are averaged.
+    split
+        Prediction split name, for example ``"test"``.
+    fold_ids
+        Folds to average.
+    output_cols
+        Output columns to average.
+    output_path
+        Parquet path for the averaged predictions. It is removed when averaging fails.
+    batch_rows
+        Number of rows read from every fold per chunk.
+    alignment
+        How fold rows are matched, ``"row_order"`` or ``"sorted_id"``.
+
+    Returns
+    -------
+    Path
+        Path that was written.
+    """
+    if not fold_ids:
+        msg = "fold_ids must include at least one fold."
+        raise ValueError(msg)
+    if not output_cols:
+        msg = "output_cols must include at least one output column."
+        raise ValueError(msg)
+    if batch_rows < 1:
+        msg = f"batch_rows must be at least 1, got {batch_rows}."
+        raise ValueError(msg)
+    if alignment not in ("row_order", "sorted_id"):
+        msg = f"alignment must be 'row_order' or 'sorted_id', got {alignment!r}."
+        raise ValueError(msg)
+
+    columns = [schema.id_col, *output_cols]
+    streams = [
+        _ParquetRowStream(
+            layout.prediction_path(model_name=model_name, split=split, fold_id=fold_id, suffix=".parquet"),
+            columns=columns,
+            batch_rows=batch_rows,
+            context=f"fold {fold_id} predictions",
+        )
+        for fold_id in fold_ids
+    ]
+    align = _align_by_row_order if alignment == "row_order" else _align_by_sorted_id
+
+    path = Path(output_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    output_schema = pa.schema(
+        [streams[0].schema.field(schema.id_col), *(pa.field(col, pa.float64()) for col in output_cols)],
+    )
+    writer = pq.ParquetWriter(path, output_schema)
+    try:
+        for ids, totals in align(streams, id_col=schema.id_col, output_cols=output_cols, batch_rows=batch_rows):
+            totals /= len(fold_ids)
+            writer.write_table(pa.table([ids, *totals], schema=output_schema))
+    except BaseException:
+        writer.close()
+        path.unlink(missing_ok=True)
+        raise
+    else:
+        writer.close()
+    finally:
+        for stream in streams:
+            stream.close()
+    return path
+
+
+class StackingEnsemble(BaseModel):
+    """Lineage metadata for a level-2 stack matrix."""
+
+    name: str
+    base_model_names: list[str]
+    stack_feature_columns: list[str]
+    class_order_by_model: dict[str, list[Any]] = Field(default_factory=dict)
+
+
+class _IdIndex:
+    """Hash index over reference ids, shared by every aligned prediction frame."""
+
+    def __init__(self, ids: pd.Series) -> None:
+        self.ids = ids
+        self._index = pd.Index(ids)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def positions(self, ids: pd.Series, *, context: str) -> np.ndarray[Any, Any]:
+        """Return the row in ``ids`` of every reference id, raising when id coverage differs.
+
+        ``ids`` must already be free of duplicates.
+        """
+        other = pd.Index(ids)
+        positions = other.get_indexer(self._index)
+        missing_mask = positions < 0
+        if missing_mask.any() or len(other) != len(self._index):
+            missing_ids = sorted(self._index[missing_mask].tolist())
+            extra_ids = sorted(other[~other.isin(self._index)].tolist())
+            msg = (
+                f"{context} id coverage does not match expected ids; "
+                f"missing ids: {missing_ids}; extra ids: {extra_ids}."
+            )
+            raise ValueError(msg)
+        return positions
+
+
+def _oof_stack_values(
+    *,
+    schema: DatasetSchema,
+    labels: pd.DataFrame,
+    predictions: Mapping[str, pd.DataFrame],
+    output_cols_by_model: Mapping[str, Sequence[str]] | None,
+    dtype: npt.DTypeLike,
+) -> tuple[pd.Series, np.ndarray[Any, Any], list[str]]:
+    """Fill one preallocated block with OOF stack features in label row order."""
+    _validate_labels(labels, schema=schema)
+    if not predictions:
+        msg = "predictions must include at least one base model."
+        raise ValueError(msg)
+
+    output_cols = _resolve_output_cols_by_model(
+        predictions=predictions,
+        output_cols_by_model=output_cols_by_model,
+        id_col=schema.id_col,
+        target_col=schema.target_col,
+    )
+    _validate_stack_feature_collisions(output_cols)
+
+    expected_ids = _IdIndex(labels[schema.id_col])
+    feature_names = _stack_feature_columns(output_cols)
+    stack_block = np.empty((len(expected_ids), len(feature_names)), dtype=_float_dtype(dtype))
+
+    start = 0
+    for model_name, prediction_frame in predictions.items():
+        model_output_cols = output_cols[model_name]
+        context = f"{model_name} OOF predictions"
+        validate_prediction_frame(
+            prediction_frame,
+            id_col=schema.id_col,
+            output_cols=model_output_cols,
+            context=context,
+        )
+        positions = expected_ids.positions(prediction_frame[schema.id_col], context=context)
+        stop = start + len(model_output_cols)
+        stack_block[:, start:stop] = prediction_frame.loc[:, model_output_cols].to_numpy(dtype=float)[positions]
+        start = stop
+
+    return expected_ids.ids, stack_block, feature_names
+
+
+def _serving_stack_values(
+    *,
+    schema: DatasetSchema,
+    base_predictions: Mapping[str, pd.DataFrame],
+    output_cols_by_model: Mapping[str, Sequence[str]] | None,
+    dtype: npt.DTypeLike,
+) -> tuple[pd.Series, np.ndarray[Any, Any], list[str]]:
+    """Fill one preallocated block with serving stack features in first-model row order."""
     if not base_predictions:
         msg = "base_predictions must include at least one base model."
         raise ValueError(msg)
@@ -234,39 +471,249 @@ def build_serving_stack_matrix(
         output_cols=first_output_cols,
         context=f"{first_model_name} serving predictions",
     )
-    ordered_ids = first_frame[schema.id_col]
-    stack_matrix = ordered_ids.reset_index(drop=True).to_frame()
+    ordered_ids = _IdIndex(first_frame[schema.id_col])
+    feature_names = _stack_feature_columns(output_cols)
+    stack_block = np.empty((len(ordered_ids), len(feature_names)), dtype=_float_dtype(dtype))
 
+    start = 0
     for model_name, prediction_frame in base_predictions.items():
         model_output_cols = output_cols[model_name]
         context = f"{model_name} serving predictions"
-        validate_prediction_frame(
-            prediction_frame,
-            id_col=schema.id_col,
-            output_cols=model_output_cols,
-            context=context,
-        )
-        _raise_for_id_mismatch(actual_ids=prediction_frame[schema.id_col], expected_ids=ordered_ids, context=context)
-        aligned_predictions = _align_prediction_frame(
-            prediction_frame=prediction_frame,
-            id_col=schema.id_col,
-            output_cols=model_output_cols,
-            ordered_ids=ordered_ids,
-        )
-        feature_names = stack_feature_names(model_name, model_output_cols)
-        for output_col, feature_name in zip(model_output_cols, feature_names, strict=True):
-            stack_matrix[feature_name] = aligned_predictions[output_col].to_numpy()
+        stop = start + len(model_output_cols)
+        outputs = prediction_frame.loc[:, model_output_cols].to_numpy(dtype=float)
+        if prediction_frame is first_frame:
+            stack_block[:, start:stop] = outputs
+        else:
+            validate_prediction_frame(
+                prediction_frame,
+                id_col=schema.id_col,
+                output_cols=model_output_cols,
+                context=context,
+            )
+            positions = ordered_ids.positions(prediction_frame[schema.id_col], context=context)
+            stack_block[:, start:stop] = outputs[positions]
+        start = stop
+
+    return ordered_ids.ids, stack_block, feature_names
+
+
+class _ParquetRowStream:
+    """Read consecutive row ranges of selected columns from one parquet file."""
+
+    def __init__(self, path: Path, *, columns: Sequence[str], batch_rows: int, context: str) -> None:
+        if not path.is_file():
+            msg = f"Artifact file does not exist: {path}"
+            raise FileNotFoundError(msg)
+        self.context = context
+        self._file = pq.ParquetFile(path)
+        file_schema = self._file.schema_arrow
+        missing_cols = [col for col in columns if col not in file_schema.names]
+        if missing_cols:
+            msg = f"{path} is missing required columns: {missing_cols}."
+            raise ValueError(msg)
+        self.schema = pa.schema([file_schema.field(col) for col in columns])
+        self.num_rows = self._file.metadata.num_rows
+        self._batches = self._file.iter_batches(batch_size=batch_rows, columns=list(columns))
+        self._pending = pa.Table.from_batches([], schema=self.schema)
+        self._last_id: pa.Scalar | None = None
+
+    def take(self, n_rows: int) -> pa.Table:
+        """Return the next ``n_rows`` rows, or fewer at the end of the file."""
+        buffered = [self._pending]
+        available = self._pending.num_rows
+        while available < n_rows and self._read_batch(buffered):
+            available += buffered[-1].num_rows
+        table = pa.concat_tables(buffered)
+        self._pending = table.slice(n_rows)
+        return table.slice(0, n_rows)
+
+    def take_through(self, column: str, value: pa.Scalar) -> pa.Table:
+        """Return the next rows whose ``column`` is at most ``value``.
+
+        Every row read is checked to be in strictly increasing ``column`` order.
+        """
+        buffered = [self._pending]
+        while True:
+            table = pa.concat_tables(buffered)
+            above = pc.greater(table.column(column), value).to_numpy(zero_copy_only=False)
+            if above.any() or not self._read_batch(buffered):
+                break
+        _check_increasing_ids(table.column(column), previous=self._last_id, id_col=column, context=self.context)
+        n_rows = int(np.argmax(above)) if above.any() else table.num_rows
+        if n_rows > 0:
+            self._last_id = table.column(column)[n_rows - 1]
+        self._pending = table.slice(n_rows)
+        return table.slice(0, n_rows)
+
+    def close(self) -> None:
+        self._file.close()
+
+    def _read_batch(self, buffered: list[pa.Table]) -> bool:
+        batch = next(self._batches, None)
+        if batch is None:
+            return False
+        buffered.append(pa.Table.from_batches([batch], schema=self.schema))
+        return True
+
+
+def _align_by_row_order(
+    streams: Sequence[_ParquetRowStream],
+    *,
+    id_col: str,
+    output_cols: Sequence[str],
+    batch_rows: int,
+) -> Iterator[tuple[pa.ChunkedArray, np.ndarray[Any, Any]]]:
+    """Yield ids and summed outputs of folds that share one row order."""
+    first_stream = streams[0]
+    num_rows = first_stream.num_rows
+    for stream in streams:
+        if stream.num_rows != num_rows:
+            msg = f"{stream.context} have {stream.num_rows} rows; expected {num_rows}."
+            raise ValueError(msg)
+
+    seen_ids: list[pa.ChunkedArray] = []
+    for start in range(0, max(num_rows, 1), batch_rows):
+        first = first_stream.take(batch_rows)
+        ids = first.column(id_col)
+        _check_unique_ids(ids, id_col=id_col, context=first_stream.context)
+        seen_ids.append(ids)
+        totals = _chunk_outputs(first, output_cols, context=first_stream.context)
+        for stream in streams[1:]:
+            chunk = stream.take(batch_rows)
+            if not chunk.column(id_col).equals(ids):
+                msg = (
+                    f"{stream.context} ids do not match {first_stream.context} in rows "
+                    f"{start}-{start + first.num_rows - 1}; fold prediction artifacts must share one row order."
+                )
+                raise ValueError(msg)
+            totals += _chunk_outputs(chunk, output_cols, context=stream.context)
+        yield ids, totals
+    # Chunks are unique on their own; duplicates across chunks need every id.
+    all_ids = pa.chunked_array(
+        [chunk for ids in seen_ids for chunk in ids.chunks],
+        first_stream.schema.field(id_col).type,
+    )
+    _check_unique_ids(all_ids, id_col=id_col, context=first_stream.context)
 
-    return stack_matrix
 
+def _align_by_sorted_id(
+    streams: Sequence[_ParquetRowStream],
+    *,
+    id_col: str,
+    output_cols: Sequence[str],
+    batch_rows: int,
+) -> Iterator[tuple[pa.ChunkedArray, np.ndarray[Any, Any]]]:
+    """Yield ids and summed outputs of folds merged by strictly increasing id."""
+    first_stream = streams[0]
+    previous = None
+    while (first := first_stream.take(batch_rows)).num_rows > 0:
+        ids = first.column(id_col)
+        _check_increasing_ids(ids, previous=previous, id_col=id_col, context=first_stream.context)
+        previous = ids[-1]
+        totals = _chunk_outputs(first, output_cols, context=first_stream.context)
+        for stream in streams[1:]:
+            chunk = stream.take_through(id_col, previous)
+            if not chunk.column(id_col).equals(ids):
+                _raise_id_mismatch(ids, chunk.column(id_col), context=stream.context, reference=first_stream.context)
+            totals += _chunk_outputs(chunk, output_cols, context=stream.context)
+        yield ids, totals
+
+    for stream in streams[1:]:
+        rest = stream.take(stream.num_rows)
+        if rest.num_rows > 0:
+            msg = (
+                f"{stream.context} id coverage does not match {first_stream.context}; "
+                f"extra ids: {rest.column(id_col).to_pylist()[:10]}."
+            )
+            raise ValueError(msg)
+
+
+def _check_unique_ids(ids: pa.ChunkedArray, *, id_col: str, context: str) -> None:
+    """Raise when ``ids`` contain duplicates, listing up to ten of them."""
+    if pc.count_distinct(ids, mode="all").as_py() == len(ids):
+        return
+    counts = pc.value_counts(ids)
+    duplicate_ids = counts.filter(pc.greater(counts.field("counts"), 1)).field("values")
+    msg = f"{context} contains duplicate ids in {id_col}: {duplicate_ids.to_pylist()[:10]}."
+    raise ValueError(msg)
+
+
+def _check_increasing_ids(ids: pa.ChunkedArray, *, previous: pa.Scalar | None, id_col: str, context: str) -> None:
+    """Raise unless ``ids`` are strictly increasing and follow ``previous``."""
+    if len(ids) == 0:
+        return
+    if ids.null_count:
+        msg = f"{context} contains null ids in {id_col}."
+        raise ValueError(msg)
+    values = ids if previous is None else pa.concat_arrays([pa.array([previous.as_py()], ids.type), *ids.chunks])
+    increasing = pc.less(values[:-1], values[1:])
+    if pc.all(increasing, min_count=0).as_py():
+        return
+    position = int(np.argmin(increasing.to_numpy(zero_copy_only=False)))
+    if values[position] == values[position + 1]:
+        msg = f"{context} contains duplicate ids in {id_col}: {[values[position].as_py()]}."
+    else:
+        msg = f"{context} ids in {id_col} are not sorted in increasing order at id {values[position + 1].as_py()!r}."
+    raise ValueError(msg)
+
+
+def _raise_id_mismatch(ids: pa.ChunkedArray, other: pa.ChunkedArray, *, context: str, reference: str) -> NoReturn:
+    """Raise with up to ten ids missing from and extra in ``other`` compared with ``ids``."""
+    other_ids = other.combine_chunks()
+    reference_ids = ids.combine_chunks()
+    missing_ids = pc.filter(reference_ids, pc.invert(pc.is_in(reference_ids, value_set=other_ids))).to_pylist()
+    extra_ids = pc.filter(other_ids, pc.invert(pc.is_in(other_ids, value_set=reference_ids))).to_pylist()
+    msg = (
+        f"{context} id coverage does not match {reference}; "
+        f"missing ids: {missing_ids[:10]}; extra ids: {extra_ids[:10]}."
+    )
+    raise ValueError(msg)
 
-class StackingEnsemble(BaseModel):
-    """Lineage metadata for a level-2 stack matrix."""
 
-    name: str
-    base_model_names: list[str]
-    stack_feature_columns: list[str]
-    class_order_by_model: dict[str, list[Any]] = Field(default_factory=dict)
+def _chunk_outputs(chunk: pa.Table, output_cols: Sequence[str], *, context: str) -> np.ndarray[Any, Any]:
+    """Return output columns of an arrow chunk as a ``(n_outputs, n_rows)`` float array."""
+    try:
+        values = np.vstack([chunk.column(col).to_numpy().astype(float) for col in output_cols])
+    except (TypeError, ValueError, pa.ArrowInvalid) as exc:
+        msg = f"{context} contains non-numeric output values in columns: {list(output_cols)}."
+        raise ValueError(msg) from exc
+    if not np.isfinite(values).all():
+        msg = f"{context} contains non-finite output values in columns: {list(output_cols)}."
+        raise ValueError(msg)
+    return values
+
+
+def _check_prediction_values(
+    preds: pd.DataFrame,
+    *,
+    id_col: str,
+    output_cols: Sequence[str],
+    context: str,
+) -> None:
+    """Check unique ids and finite outputs, scanning every column once."""
+    ids = preds[id_col]
+    if not pd.Index(ids).is_unique:
+        duplicate_ids = ids[ids.duplicated(keep=False)].unique().tolist()
+        msg = f"{context} contains duplicate ids in {id_col}: {duplicate_ids}."
+        raise ValueError(msg)
+
+    if not output_cols:
+        msg = f"{context} must include at least one output column."
+        raise ValueError(msg)
+
+    for col in output_cols:
+        values = preds[col].to_numpy()
+        if values.dtype.kind in "iub":
+            continue
+        if values.dtype.kind not in "fc":
+            try:
+                values = preds[col].to_numpy(dtype=float)
+            except (TypeError, ValueError) as exc:
+                msg = f"{context} contains non-numeric output values in columns: {list(output_cols)}."
+                raise ValueError(msg) from exc
+        if not np.isfinite(values).all():
+            msg = f"{context} contains non-finite output values in columns: {list(output_cols)}."
+            raise ValueError(msg)
 
 
 def _validate_labels(labels: pd.DataFrame, *, schema: DatasetSchema) -> None:
@@ -309,44 +756,30 @@ def _resolve_output_cols_by_model(
     return {model_name: list(output_cols_by_model[model_name]) for model_name in predictions}
 
 
-def _validate_stack_feature_collisions(output_cols_by_model: Mapping[str, Sequence[str]]) -> None:
-    """Raise when stack feature naming would produce duplicate columns."""
-    feature_names = [
+def _stack_feature_columns(output_cols_by_model: Mapping[str, Sequence[str]]) -> list[str]:
+    """Return stack feature names in model order."""
+    return [
         feature_name
         for model_name, output_cols in output_cols_by_model.items()
         for feature_name in stack_feature_names(model_name, output_cols)
     ]
+
+
+def _float_dtype(dtype: npt.DTypeLike) -> np.dtype[Any]:
+    """Return ``dtype`` as a NumPy floating dtype, raising for anything else."""
+    resolved = np.dtype(dtype)
+    if resolved.kind != "f":
+        msg = f"Stack matrix dtype must be a floating dtype, got {resolved}."
+        raise ValueError(msg)
+    return resolved
+
+
+def _validate_stack_feature_collisions(output_cols_by_model: Mapping[str, Sequence[str]]) -> None:
+    """Raise when stack feature naming would produce duplicate columns."""
+    feature_names = _stack_feature_columns(output_cols_by_model)
     if len(feature_names) != len(set(feature_names)):
         duplicate_features = sorted(
             {feature_name for feature_name in feature_names if feature_names.count(feature_name) > 1},
         )
         msg = f"Stack feature names must be unique, found duplicates: {duplicate_features}."
         raise ValueError(msg)
-
-
-def _align_prediction_frame(
-    *,
-    prediction_frame: pd.DataFrame,
-    id_col: str,
-    output_cols: Sequence[str],
-    ordered_ids: pd.Series,
-) -> pd.DataFrame:
-    """Return prediction outputs aligned to the requested id order."""
-    return (
-        prediction_frame.loc[:, [id_col, *output_cols]]
-        .set_index(id_col)
-        .loc[ordered_ids.tolist(), list(output_cols)]
-        .reset_index(drop=True)
-    )
-
-
-def _raise_for_id_mismatch(*, actual_ids: pd.Series, expected_ids: pd.Series, context: str) -> None:
-    """Raise when two prediction id sets do not match exactly."""
-    actual_set = set(actual_ids.tolist())
-    expected_set = set(expected_ids.tolist())
-
-    missing_ids = sorted(expected_set - actual_set)
-    extra_ids = sorted(actual_set - expected_set)
-    if missing_ids or extra_ids:
-        msg = f"{context} id coverage does not match expected ids; missing ids: {missing_ids}; extra ids: {extra_ids}."
-        raise ValueError(msg)
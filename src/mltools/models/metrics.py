@@ -0,0 +1,263 @@
+"""Vectorized, weight-aware evaluation metrics."""
+
+from __future__ import annotations
+
+import weakref
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    import lightgbm as lgb
+
+PROBABILITY_THRESHOLD = 0.5
+PROBABILITY_EPS = 1e-15
+
+
+class EvalLabels:
+    """Label-dependent quantities shared by every evaluation of one validation set.
+
+    Classification metrics expect labels encoded as class positions ``0..k-1``,
+    matching the column order of multiclass probabilities.
+    """
+
+    def __init__(self, y_true: Any, sample_weight: Any | None = None) -> None:
+        """Precompute label and weight arrays.
+
+        Parameters
+        ----------
+        y_true
+            True labels or regression targets.
+        sample_weight
+            Optional non-negative row weights.
+        """
+        self.y_true = np.asarray(y_true, dtype=float).ravel()
+        if sample_weight is None:
+            self.weight = np.ones(len(self.y_true))
+        else:
+            self.weight = np.asarray(sample_weight, dtype=float).ravel()
+        if len(self.weight) != len(self.y_true):
+            msg = f"sample_weight has {len(self.weight)} rows; expected {len(self.y_true)}."
+            raise ValueError(msg)
+        self.total_weight = float(self.weight.sum())
+        if self.total_weight <= 0:
+            msg = "Evaluation weights must sum to a positive value."
+            raise ValueError(msg)
+
+    def __len__(self) -> int:
+        """Return the number of evaluation rows."""
+        return len(self.y_true)
+
+    @cached_property
+    def class_index(self) -> np.ndarray[Any, Any]:
+        """Return labels as integer class positions."""
+        class_index = self.y_true.astype(np.intp)
+        if (class_index != self.y_true).any() or (class_index < 0).any():
+            msg = "Classification metrics require labels encoded as non-negative class positions."
+            raise ValueError(msg)
+        return class_index
+
+    @cached_property
+    def class_weight(self) -> np.ndarray[Any, Any]:
+        """Return the total weight of each class position."""
+        return np.bincount(self.class_index, weights=self.weight)
+
+    @cached_property
+    def positive_weight(self) -> np.ndarray[Any, Any]:
+        """Return row weights of positive binary labels, zero elsewhere."""
+        return np.where(self.class_index == 1, self.weight, 0.0)
+
+    @cached_property
+    def negative_weight(self) -> np.ndarray[Any, Any]:
+        """Return row weights of negative binary labels, zero elsewhere."""
+        return self.weight - self.positive_weight
+
+
+def roc_auc(y_true: Any, y_score: Any, *, sample_weight: Any | None = None) -> float:
+    """Return the weighted binary ROC AUC.
+
+    Parameters
+    ----------
+    y_true
+        Binary labels encoded as 0 and 1.
+    y_score
+        Positive-class scores.
+    sample_weight
+        Optional row weights.
+    """
+    return _roc_auc(EvalLabels(y_true, sample_weight), np.asarray(y_score, dtype=float))
+
+
+def log_loss(y_true: Any, y_prob: Any, *, sample_weight: Any | None = None) -> float:
+    """Return the weighted binary or multiclass log loss.
+
+    Parameters
+    ----------
+    y_true
+        Labels encoded as class positions.
+    y_prob
+        Positive-class probabilities, or one probability column per class.
+    sample_weight
+        Optional row weights.
+    """
+    return _log_loss(EvalLabels(y_true, sample_weight), np.asarray(y_prob, dtype=float))
+
+
+def balanced_accuracy(y_true: Any, y_prob: Any, *, sample_weight: Any | None = None) -> float:
+    """Return the weighted balanced accuracy of thresholded or arg-max predictions.
+
+    Parameters
+    ----------
+    y_true
+        Labels encoded as class positions.
+    y_prob
+        Positive-class probabilities, or one probability column per class.
+    sample_weight
+        Optional row weights.
+    """
+    return _balanced_accuracy(EvalLabels(y_true, sample_weight), np.asarray(y_prob, dtype=float))
+
+
+def rmse(y_true: Any, y_pred: Any, *, sample_weight: Any | None = None) -> float:
+    """Return the weighted root mean squared error.
+
+    Parameters
+    ----------
+    y_true
+        Regression targets.
+    y_pred
+        Predicted values.
+    sample_weight
+        Optional row weights.
+    """
+    return _rmse(EvalLabels(y_true, sample_weight), np.asarray(y_pred, dtype=float))
+
+
+def evaluate(labels: EvalLabels, y_pred: Any, metrics: Sequence[str]) -> dict[str, float]:
+    """Evaluate several metrics against precomputed labels.
+
+    Parameters
+    ----------
+    labels
+        Precomputed evaluation labels.
+    y_pred
+        Predictions, either one column or one column per class.
+    metrics
+        Metric names. Supported values are ``auc``, ``log_loss``,
+        ``balanced_accuracy``, and ``rmse``.
+
+    Returns
+    -------
+    dict[str, float]
+        Metric values in the requested order.
+    """
+    preds = np.asarray(y_pred, dtype=float)
+    if len(preds) != len(labels):
+        msg = f"Predictions have {len(preds)} rows; expected {len(labels)}."
+        raise ValueError(msg)
+    return {metric: _metric_fn(metric)(labels, preds) for metric in metrics}
+
+
+def higher_is_better(metric: str) -> bool:
+    """Return whether larger values of a metric are better."""
+    _metric_fn(metric)
+    return metric in _HIGHER_IS_BETTER
+
+
+class LightGBMEval:
+    """LightGBM ``feval`` that evaluates several vectorized metrics.
+
+    Label-dependent precomputation is cached per evaluation dataset, so each
+    boosting iteration only pays for the prediction-dependent work.
+    """
+
+    def __init__(self, metrics: Sequence[str]) -> None:
+        """Initialize the evaluation callback.
+
+        Parameters
+        ----------
+        metrics
+            Metric names passed to :func:`evaluate`.
+        """
+        if not metrics:
+            msg = "metrics must include at least one metric."
+            raise ValueError(msg)
+        for metric in metrics:
+            _metric_fn(metric)
+        self.metrics = list(dict.fromkeys(metrics))
+        self._labels: weakref.WeakKeyDictionary[lgb.Dataset, EvalLabels] = weakref.WeakKeyDictionary()
+
+    def __call__(self, preds: np.ndarray[Any, Any], data: lgb.Dataset) -> list[tuple[str, float, bool]]:
+        """Return LightGBM evaluation tuples for one dataset."""
+        labels = self._labels.get(data)
+        if labels is None:
+            y_true = data.get_label()
+            if y_true is None:
+                msg = "LightGBM evaluation data is missing labels."
+                raise ValueError(msg)
+            labels = EvalLabels(y_true, data.get_weight())
+            self._labels[data] = labels
+        scores = evaluate(labels, preds, self.metrics)
+        return [(metric, score, higher_is_better(metric)) for metric, score in scores.items()]
+
+
+def _roc_auc(labels: EvalLabels, y_score: np.ndarray[Any, Any]) -> float:
+    if y_score.ndim != 1:
+        msg = "auc requires one positive-class score per row."
+        raise ValueError(msg)
+    # One descending sort; tied scores are collapsed onto a single ROC point.
+    order = np.argsort(-y_score, kind="mergesort")
+    sorted_scores = y_score[order]
+    threshold_ends = np.r_[np.flatnonzero(np.diff(sorted_scores)), len(sorted_scores) - 1]
+    tps = np.r_[0.0, np.cumsum(labels.positive_weight[order])[threshold_ends]]
+    fps = np.r_[0.0, np.cumsum(labels.negative_weight[order])[threshold_ends]]
+    if tps[-1] == 0 or fps[-1] == 0:
+        msg = "auc requires both positive and negative labels with positive weight."
+        raise ValueError(msg)
+    area = np.sum(np.diff(fps) * (tps[1:] + tps[:-1])) / 2
+    return float(area / (tps[-1] * fps[-1]))
+
+
+def _log_loss(labels: EvalLabels, y_prob: np.ndarray[Any, Any]) -> float:
+    if y_prob.ndim == 1:
+        probs = np.where(labels.class_index == 1, y_prob, 1 - y_prob)
+    else:
+        probs = np.take_along_axis(y_prob, labels.class_index[:, None], axis=1)[:, 0]
+    losses = -np.log(np.clip(probs, PROBABILITY_EPS, 1))
+    return float(np.dot(labels.weight, losses) / labels.total_weight)
+
+
+def _balanced_accuracy(labels: EvalLabels, y_prob: np.ndarray[Any, Any]) -> float:
+    predicted = (y_prob >= PROBABILITY_THRESHOLD).astype(np.intp) if y_prob.ndim == 1 else np.argmax(y_prob, axis=1)
+    class_weight = labels.class_weight
+    correct = labels.class_index == predicted
+    hits = np.bincount(labels.class_index[correct], weights=labels.weight[correct], minlength=len(class_weight))
+    present = class_weight > 0
+    return float(np.mean(hits[present] / class_weight[present]))
+
+
+def _rmse(labels: EvalLabels, y_pred: np.ndarray[Any, Any]) -> float:
+    if y_pred.ndim != 1:
+        msg = "rmse requires one prediction per row."
+        raise ValueError(msg)
+    residuals = labels.y_true - y_pred
+    return float(np.sqrt(np.dot(labels.weight, residuals * residuals) / labels.total_weight))
+
+
+_METRICS: dict[str, Callable[[EvalLabels, np.ndarray[Any, Any]], float]] = {
+    "auc": _roc_auc,
+    "balanced_accuracy": _balanced_accuracy,
+    "log_loss": _log_loss,
+    "rmse": _rmse,
+}
+_HIGHER_IS_BETTER = {"auc", "balanced_accuracy"}
+
+
+def _metric_fn(metric: str) -> Callable[[EvalLabels, np.ndarray[Any, Any]], float]:
+    if metric not in _METRICS:
+        msg = f"Unsupported metric: {metric}. Supported metrics: {sorted(_METRICS)}."
+        raise ValueError(msg)
+    return _METRICS[metric]
@@ -0,0 +1,140 @@
+"""Greedy ensemble selection over out-of-fold stack matrices."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel
+
+from mltools.data.transformers.blend import Blender
+from mltools.models.metrics import EvalLabels, evaluate, higher_is_better
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from mltools.data.schema import DatasetSchema
+
+
+class EnsembleSelection(BaseModel):
+    """Weights chosen by greedy ensemble selection."""
+
+    metric: str
+    cols: list[str]
+    weights: list[float]
+    scores: list[float]
+    best_iteration: int
+
+    @property
+    def best_score(self) -> float:
+        """Return the metric of the selected blend."""
+        return self.scores[self.best_iteration]
+
+    def to_blender(self, out_col: str = "blend") -> Blender:
+        """Return a :class:`Blender` that applies the selected weights.
+
+        Parameters
+        ----------
+        out_col
+            Name of the blended output column.
+        """
+        return Blender(self.weights, self.cols, out_col=out_col)
+
+
+def greedy_ensemble_selection(  # noqa: PLR0913
+    stack_matrix: pd.DataFrame,
+    *,
+    schema: DatasetSchema,
+    metric: str,
+    cols: Sequence[str] | None = None,
+    n_iterations: int = 50,
+    class_order: Sequence[Any] | None = None,
+) -> EnsembleSelection:
+    """Select blend weights with Caruana-style greedy forward selection with replacement.
+
+    Each iteration adds the stack column that most improves the metric of the equally
+    weighted average of the columns chosen so far; a column can be added repeatedly,
+    so its final weight is its selection count. The running sum of chosen columns is
+    kept between iterations, so scoring one candidate costs one vectorized pass over
+    the rows. The blend from the best-scoring iteration is returned.
+
+    Parameters
+    ----------
+    stack_matrix
+        Out-of-fold stack matrix with the target column and one column per candidate.
+    schema
+        Dataset schema with the target and optional weight column names.
+    metric
+        Metric name supported by :func:`mltools.models.metrics.evaluate`. Candidate
+        columns hold one prediction per row, such as binary scores or regression
+        predictions.
+    cols
+        Candidate columns. Defaults to every column except the schema columns.
+    n_iterations
+        Number of greedy selection steps.
+    class_order
+        Optional class labels used to encode the target as class positions for
+        classification metrics.
+
+    Returns
+    -------
+    EnsembleSelection
+        Candidate columns with non-zero weight, normalized weights, and the metric after
+        every iteration.
+    """
+    if n_iterations < 1:
+        msg = f"n_iterations must be at least 1, got {n_iterations}."
+        raise ValueError(msg)
+    excluded = {schema.id_col, schema.target_col, schema.weight_col}
+    candidates = list(cols) if cols is not None else [col for col in stack_matrix.columns if col not in excluded]
+    if not candidates:
+        msg = "greedy_ensemble_selection requires at least one candidate column."
+        raise ValueError(msg)
+    missing = [col for col in candidates if col not in stack_matrix.columns]
+    if missing:
+        msg = f"stack_matrix is missing candidate columns: {missing}."
+        raise ValueError(msg)
+
+    y_true = stack_matrix[schema.target_col].to_numpy()
+    if class_order is not None:
+        y_true = pd.Index(class_order).get_indexer(y_true)
+        if (y_true < 0).any():
+            msg = "stack_matrix contains targets missing from class_order."
+            raise ValueError(msg)
+    weights = stack_matrix[schema.weight_col].to_numpy() if schema.weight_col is not None else None
+    labels = EvalLabels(y_true, weights)
+    # Column-major so every candidate column is one contiguous read.
+    predictions = np.asfortranarray(stack_matrix.loc[:, candidates].to_numpy(dtype=float))
+    direction = 1.0 if higher_is_better(metric) else -1.0
+
+    running_sum = np.zeros(len(stack_matrix))
+    blend = np.empty(len(stack_matrix))
+    counts = np.zeros(len(candidates), dtype=np.int64)
+    best_counts = counts
+    scores: list[float] = []
+    best_iteration = 0
+    for iteration in range(n_iterations):
+        step_choice = 0
+        step_score = 0.0
+        for position in range(len(candidates)):
+            np.add(running_sum, predictions[:, position], out=blend)
+            blend /= iteration + 1
+            score = evaluate(labels, blend, [metric])[metric]
+            if position == 0 or direction * score > direction * step_score:
+                step_choice, step_score = position, score
+        running_sum += predictions[:, step_choice]
+        counts[step_choice] += 1
+        scores.append(step_score)
+        if iteration == 0 or direction * step_score > direction * scores[best_iteration]:
+            best_iteration = iteration
+            best_counts = counts.copy()
+
+    selected = np.flatnonzero(best_counts)
+    return EnsembleSelection(
+        metric=metric,
+        cols=[candidates[position] for position in selected],
+        weights=(best_counts[selected] / best_counts.sum()).tolist(),
+        scores=scores,
+        best_iteration=best_iteration,
+    )
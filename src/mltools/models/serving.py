@@ -0,0 +1,334 @@
+"""Asyncio micro-batching prediction server for fitted model wrappers."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Self
+
+import numpy as np
+from pydantic import BaseModel
+
+from mltools.io import read_file
+from mltools.models.ensemble import stack_feature_names
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from mltools.artifacts import ArtifactLayout
+    from mltools.models.arch.base import BaseModelWrapper
+
+
+class ServerStats(BaseModel):
+    """Latency and throughput counters for a prediction server."""
+
+    requests: int
+    batches: int
+    errors: int
+    mean_batch_size: float
+    mean_latency_seconds: float
+    rows_per_second: float
+
+
+class MicroBatchServer:
+    """Coalesce concurrent prediction requests into micro-batches.
+
+    Requests are queued and grouped until ``max_batch_size`` records are waiting or
+    ``max_wait_seconds`` has passed since the first queued record. Each batch is scored
+    in a thread pool through :meth:`BaseModelWrapper.predict_records`.
+    """
+
+    def __init__(
+        self,
+        models: Mapping[str, Sequence[BaseModelWrapper]],
+        *,
+        stack_model: BaseModelWrapper | None = None,
+        max_batch_size: int = 256,
+        max_wait_seconds: float = 0.005,
+        max_workers: int | None = None,
+    ) -> None:
+        """Initialize the server.
+
+        Parameters
+        ----------
+        models
+            Mapping from base model name to its fitted fold models. Fold outputs are averaged.
+        stack_model
+            Optional fitted level-2 model scored on the base-model stack features.
+        max_batch_size
+            Maximum number of records scored together.
+        max_wait_seconds
+            Maximum time the first record of a batch waits for more records.
+        max_workers
+            Number of scoring threads.
+        """
+        if not models or any(len(fold_models) == 0 for fold_models in models.values()):
+            msg = "models must include at least one fitted model per base model name."
+            raise ValueError(msg)
+        if max_batch_size < 1:
+            msg = f"max_batch_size must be at least 1, got {max_batch_size}."
+            raise ValueError(msg)
+        self.models = {name: list(fold_models) for name, fold_models in models.items()}
+        schema = next(iter(self.models.values()))[0].schema_
+        if schema is None:
+            msg = "models must be fitted before serving."
+            raise ValueError(msg)
+        self.id_col = str(schema.id_col)
+        self.stack_model = stack_model
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self.max_workers = max_workers
+
+        self._queue: asyncio.Queue[tuple[Mapping[str, Any], asyncio.Future[dict[str, Any]], float]] | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._batcher: asyncio.Task[None] | None = None
+        self._scoring: set[asyncio.Task[None]] = set()
+        self._collecting: list[tuple[Mapping[str, Any], asyncio.Future[dict[str, Any]], float]] = []
+        self._started_at: float | None = None
+        self._requests = 0
+        self._batches = 0
+        self._errors = 0
+        self._latency_total = 0.0
+
+    @classmethod
+    def from_layout(
+        cls,
+        layout: ArtifactLayout,
+        *,
+        model_names: Sequence[str],
+        fold_ids: Sequence[int] = (0,),
+        ensemble_name: str | None = None,
+        **kwargs: Any,
+    ) -> Self:
+        """Load fitted wrappers from an artifact layout.
+
+        Parameters
+        ----------
+        layout
+            Artifact layout containing pickled model wrappers.
+        model_names
+            Base model names to load.
+        fold_ids
+            Fold models to load and average for every base model.
+        ensemble_name
+            Optional ensemble whose level-2 model is loaded from ``stack_model_path``.
+        **kwargs
+            Additional keyword arguments passed to the constructor.
+
+        Returns
+        -------
+        Self
+            Server for the loaded models.
+        """
+        models = {
+            model_name: [read_file(layout.model_path(model_name=model_name, fold_id=fold_id)) for fold_id in fold_ids]
+            for model_name in model_names
+        }
+        stack_model = None
+        if ensemble_name is not None:
+            stack_model = read_file(layout.stack_model_path(ensemble_name=ensemble_name))
+        return cls(models, stack_model=stack_model, **kwargs)
+
+    def score_batch(self, records: Sequence[Mapping[str, Any]]) -> list[dict[str, Any]]:
+        """Score records synchronously.
+
+        Parameters
+        ----------
+        records
+            Feature records containing the id column and every model feature.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            One output mapping per record with the id column and the output columns.
+        """
+        ids = np.asarray([record[self.id_col] for record in records])
+        columns: list[str] = []
+        blocks: list[np.ndarray[Any, Any]] = []
+        for model_name, fold_models in self.models.items():
+            fold_outputs = [model.predict_records(records)[1] for model in fold_models]
+            blocks.append(np.mean(fold_outputs, axis=0))
+            columns.extend(stack_feature_names(model_name, fold_models[0].output_columns()))
+        values = np.hstack(blocks)
+
+        if self.stack_model is not None:
+            ids, values = self.stack_model.predict_arrays(values, ids, columns=columns)
+            columns = self.stack_model.output_columns()
+
+        return [
+            {self.id_col: row_id, **dict(zip(columns, row, strict=True))}
+            for row_id, row in zip(np.asarray(ids).tolist(), values.tolist(), strict=True)
+        ]
+
+    async def start(self) -> None:
+        """Start the batching loop and scoring threads."""
+        if self._batcher is not None:
+            return
+        self._queue = asyncio.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="mltools-serving")
+        self._started_at = time.perf_counter()
+        self._batcher = asyncio.create_task(self._run_batches())
+
+    async def stop(self) -> None:
+        """Stop batching, finish in-flight batches, and fail queued requests.
+
+        Records already taken off the queue for a batch that is still collecting are
+        scored as one final batch.
+        """
+        if self._batcher is None:
+            return
+        self._batcher.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._batcher
+        self._batcher = None
+        batch, self._collecting = self._collecting, []
+        if batch:
+            await self._score(batch)
+        if self._scoring:
+            await asyncio.gather(*self._scoring, return_exceptions=True)
+        while self._queue is not None and not self._queue.empty():
+            _, future, _ = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("Prediction server stopped."))
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    async def __aenter__(self) -> Self:
+        """Start the server."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Stop the server."""
+        await self.stop()
+
+    async def predict(self, record: Mapping[str, Any]) -> dict[str, Any]:
+        """Score one record as part of the next micro-batch.
+
+        Parameters
+        ----------
+        record
+            Feature record containing the id column and every model feature.
+
+        Returns
+        -------
+        dict[str, Any]
+            Output mapping with the id column and the output columns.
+        """
+        if self._queue is None or self._batcher is None:
+            msg = "Prediction server is not running; call start() first."
+            raise RuntimeError(msg)
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        await self._queue.put((record, future, time.perf_counter()))
+        return await future
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.Server:
+        """Serve newline-delimited JSON records over TCP.
+
+        Each request line is one JSON record; each response line is the JSON output
+        mapping, or ``{"error": message}`` when the record cannot be scored. Requests on
+        one connection are batched concurrently, so responses are matched by id rather
+        than by order.
+
+        Parameters
+        ----------
+        host
+            Interface to bind.
+        port
+            Port to bind. ``0`` selects a free port.
+
+        Returns
+        -------
+        asyncio.Server
+            Started TCP server.
+        """
+        await self.start()
+        return await asyncio.start_server(self._handle_connection, host=host, port=port)
+
+    def stats(self) -> ServerStats:
+        """Return request, batch, latency, and throughput counters."""
+        elapsed = time.perf_counter() - self._started_at if self._started_at is not None else 0.0
+        return ServerStats(
+            requests=self._requests,
+            batches=self._batches,
+            errors=self._errors,
+            mean_batch_size=self._requests / self._batches if self._batches else 0.0,
+            mean_latency_seconds=self._latency_total / self._requests if self._requests else 0.0,
+            rows_per_second=self._requests / elapsed if elapsed > 0 else 0.0,
+        )
+
+    async def _run_batches(self) -> None:
+        queue = self._queue
+        if queue is None:  # pragma: no cover
+            return
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = self._collecting = [await queue.get()]
+            deadline = loop.time() + self.max_wait_seconds
+            while len(batch) < self.max_batch_size:
+                if not queue.empty():
+                    batch.append(queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except TimeoutError:
+                    break
+            self._collecting = []
+            task = asyncio.create_task(self._score(batch))
+            self._scoring.add(task)
+            task.add_done_callback(self._scoring.discard)
+
+    async def _score(self, batch: list[tuple[Mapping[str, Any], asyncio.Future[dict[str, Any]], float]]) -> None:
+        records = [record for record, _, _ in batch]
+        self._batches += 1
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(self._executor, self.score_batch, records)
+        except Exception as exc:  # noqa: BLE001
+            if len(batch) > 1:
+                # Re-score records one by one so a single bad record only fails its own request.
+                await asyncio.gather(*(self._score([item]) for item in batch))
+                return
+            self._errors += 1
+            _, future, _ = batch[0]
+            if not future.done():
+                future.set_exception(exc)
+            return
+
+        finished = time.perf_counter()
+        for (_, future, queued_at), result in zip(batch, results, strict=True):
+            self._requests += 1
+            self._latency_total += finished - queued_at
+            if not future.done():
+                future.set_result(result)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        pending: set[asyncio.Task[None]] = set()
+        write_lock = asyncio.Lock()
+
+        async def respond(line: bytes) -> None:
+            try:
+                response = await self.predict(json.loads(line))
+            except Exception as exc:  # noqa: BLE001
+                response = {"error": str(exc)}
+            async with write_lock:
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+
+        try:
+            while line := await reader.readline():
+                task = asyncio.create_task(respond(line))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+            if pending:
+                await asyncio.gather(*pending)
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
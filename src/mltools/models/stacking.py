@@ -0,0 +1,354 @@
+"""Trainable two-level stacking ensembles."""
+
+from __future__ import annotations
+
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Self
+
+import numpy as np
+import pandas as pd
+
+from mltools.data.schema import FittedTransformerSet, FoldDesignMatrix, schema_columns
+from mltools.io import read_file, write_file
+from mltools.models.cv import train_cv
+from mltools.models.ensemble import StackBlock, StackingEnsemble, build_oof_stack_block
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+    from pathlib import Path
+
+    import numpy.typing as npt
+
+    from mltools.artifacts import ArtifactLayout
+    from mltools.data.schema import DatasetSchema
+    from mltools.models.arch.base import BaseModelWrapper
+
+
+class StackingModel:
+    """Cross-validated base models blended by a cross-validated level-2 model.
+
+    :meth:`fit` trains every base model with :func:`train_cv`, builds the out-of-fold
+    stack matrix, and trains the level-2 model on the same fold partition. At predict
+    time the base models are scored concurrently, their fold-averaged outputs are written
+    straight into one preallocated stack block, and the level-2 fold models are averaged
+    on that block.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        base_models: Mapping[str, Callable[[], BaseModelWrapper]],
+        meta_model: Callable[[], BaseModelWrapper],
+        dtype: npt.DTypeLike = np.float64,
+        max_workers: int | None = None,
+    ) -> None:
+        """Initialize the ensemble.
+
+        Parameters
+        ----------
+        name
+            Ensemble name used for artifact paths.
+        base_models
+            Mapping from base model name to a factory returning an unfitted wrapper.
+        meta_model
+            Factory returning an unfitted level-2 wrapper.
+        dtype
+            Floating dtype of the stack block.
+        max_workers
+            Number of threads used to score base models when no executor is passed.
+        """
+        if not base_models:
+            msg = "base_models must include at least one base model."
+            raise ValueError(msg)
+        self.name = name
+        self.base_model_factories: dict[str, Callable[[], BaseModelWrapper]] | None = dict(base_models)
+        self.meta_model_factory: Callable[[], BaseModelWrapper] | None = meta_model
+        self.dtype = np.dtype(dtype)
+        self.max_workers = max_workers
+
+        self.schema_: DatasetSchema | None = None
+        self.ensemble_: StackingEnsemble | None = None
+        self.fold_ids_: list[int] = []
+        self.base_models_: dict[str, list[BaseModelWrapper]] = {}
+        self.meta_models_: list[BaseModelWrapper] = []
+
+    def fit(self, folds: Sequence[FoldDesignMatrix]) -> Self:
+        """Train base models and the level-2 model across folds.
+
+        Parameters
+        ----------
+        folds
+            Fold design matrices shared by the base and level-2 models. Validation
+            frames must not overlap, so every validation id has one OOF prediction.
+
+        Returns
+        -------
+        Self
+            Fitted ensemble.
+        """
+        if self.base_model_factories is None or self.meta_model_factory is None:
+            msg = f"{self.name} was restored from artifacts and cannot be refit; create a new ensemble."
+            raise RuntimeError(msg)
+        fold_list = list(folds)
+        if not fold_list:
+            msg = "folds must contain at least one fold."
+            raise ValueError(msg)
+        schema = fold_list[0].schema
+
+        base_results = {
+            model_name: train_cv(model_factory=factory, folds=fold_list)
+            for model_name, factory in self.base_model_factories.items()
+        }
+        labels = pd.concat(
+            [fold.val.loc[:, schema_columns(schema)] for fold in fold_list],
+            ignore_index=True,
+        )
+        oof_block = build_oof_stack_block(
+            schema=schema,
+            labels=labels,
+            predictions={model_name: result.oof_predictions() for model_name, result in base_results.items()},
+            output_cols_by_model={
+                model_name: result.models()[0].output_columns() for model_name, result in base_results.items()
+            },
+            dtype=self.dtype,
+        )
+        stack_matrix = pd.concat(
+            [labels, pd.DataFrame(oof_block.matrix, columns=oof_block.feature_names, copy=False)],
+            axis=1,
+        )
+        meta_result = train_cv(
+            model_factory=self.meta_model_factory,
+            folds=[_meta_fold(fold, stack_matrix) for fold in fold_list],
+        )
+
+        self.schema_ = schema
+        self.fold_ids_ = [fold.fold_id for fold in fold_list]
+        self.base_models_ = {model_name: result.models() for model_name, result in base_results.items()}
+        self.meta_models_ = meta_result.models()
+        self.ensemble_ = StackingEnsemble(
+            name=self.name,
+            base_model_names=list(self.base_models_),
+            stack_feature_columns=oof_block.feature_names,
+            class_order_by_model={
+                model_name: list(class_order)
+                for model_name, models in self.base_models_.items()
+                if (class_order := getattr(models[0], "class_order_", None)) is not None
+            },
+        )
+        return self
+
+    def predict_stack_block(self, df: pd.DataFrame, *, executor: Executor | None = None) -> StackBlock:
+        """Score base models concurrently and return their stack features.
+
+        Parameters
+        ----------
+        df
+            Model-ready dataframe with the id column and every base model feature.
+        executor
+            Optional executor for base-model scoring. A :class:`ProcessPoolExecutor`
+            moves scoring off the GIL at the cost of pickling the fold models per call.
+            Defaults to a thread pool with ``max_workers`` threads.
+
+        Returns
+        -------
+        StackBlock
+            Stack features in ``df`` row order.
+        """
+        schema = self._require_fit()
+        if schema.id_col not in df.columns:
+            msg = f"{self.name} input is missing id column {schema.id_col!r}."
+            raise ValueError(msg)
+        features = list(
+            dict.fromkeys(
+                feature
+                for fold_models in self.base_models_.values()
+                for model in fold_models
+                for feature in model.feature_names_ or []
+            ),
+        )
+        missing = [feature for feature in features if feature not in df.columns]
+        if missing:
+            msg = f"{self.name} input is missing feature columns: {missing}."
+            raise ValueError(msg)
+        values = df.loc[:, features].to_numpy()
+        ids = df[schema.id_col].to_numpy()
+
+        feature_names = self._stack_feature_names()
+        matrix = np.empty((len(df), len(feature_names)), dtype=self.dtype)
+        pool = executor if executor is not None else ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            futures = [
+                pool.submit(_average_fold_outputs, fold_models, values, ids, features)
+                for fold_models in self.base_models_.values()
+            ]
+            start = 0
+            for future in futures:
+                outputs = future.result()
+                stop = start + outputs.shape[1]
+                matrix[:, start:stop] = outputs
+                start = stop
+        finally:
+            if executor is None:
+                pool.shutdown(wait=True)
+        return StackBlock(ids=ids, matrix=matrix, feature_names=feature_names)
+
+    def predict(self, df: pd.DataFrame, *, executor: Executor | None = None) -> pd.DataFrame:
+        """Predict with the fitted stacking ensemble.
+
+        Parameters
+        ----------
+        df
+            Model-ready dataframe with the id column and every base model feature.
+        executor
+            Optional executor for base-model scoring; see :meth:`predict_stack_block`.
+
+        Returns
+        -------
+        pd.DataFrame
+            Prediction frame with the id column and the level-2 output columns.
+        """
+        schema = self._require_fit()
+        block = self.predict_stack_block(df, executor=executor)
+        ids, outputs = self.predict_arrays(block.matrix, block.ids, columns=block.feature_names)
+        return pd.DataFrame({schema.id_col: ids, **dict(zip(self.output_columns(), outputs.T, strict=True))})
+
+    def predict_arrays(
+        self,
+        x: np.ndarray[Any, Any],
+        ids: Any,
+        *,
+        columns: Sequence[str] | None = None,
+    ) -> tuple[np.ndarray[Any, Any], np.ndarray[Any, Any]]:
+        """Average the level-2 fold models on a stack-feature array.
+
+        This mirrors :meth:`BaseModelWrapper.predict_arrays`, so a restored ensemble can
+        be passed as ``stack_model`` to :class:`mltools.models.serving.MicroBatchServer`.
+
+        Parameters
+        ----------
+        x
+            Two-dimensional stack-feature array.
+        ids
+            Row ids returned alongside the outputs.
+        columns
+            Column names of ``x``. Defaults to the fitted stack feature order.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            Row ids and the averaged level-2 outputs ordered like :meth:`output_columns`.
+        """
+        self._require_fit()
+        stack_columns = list(columns) if columns is not None else self._stack_feature_names()
+        return np.asarray(ids), _average_fold_outputs(self.meta_models_, x, ids, stack_columns)
+
+    def output_columns(self) -> list[str]:
+        """Return the level-2 output column names."""
+        self._require_fit()
+        return self.meta_models_[0].output_columns()
+
+    def save(self, layout: ArtifactLayout) -> Path:
+        """Persist the ensemble under an artifact layout.
+
+        Base fold models are written to ``layout.model_path`` and the ensemble itself,
+        including the level-2 fold models, to ``layout.stack_model_path``.
+
+        Parameters
+        ----------
+        layout
+            Destination artifact layout.
+
+        Returns
+        -------
+        Path
+            Path of the stack model artifact.
+        """
+        self._require_fit()
+        for model_name, fold_models in self.base_models_.items():
+            for fold_id, model in zip(self.fold_ids_, fold_models, strict=True):
+                write_file(model, layout.model_path(model_name=model_name, fold_id=fold_id))
+        return write_file(self, layout.stack_model_path(ensemble_name=self.name))
+
+    @classmethod
+    def load(cls, layout: ArtifactLayout, *, ensemble_name: str) -> StackingModel:
+        """Restore an ensemble written by :meth:`save`.
+
+        Parameters
+        ----------
+        layout
+            Artifact layout containing the ensemble.
+        ensemble_name
+            Name of the saved ensemble.
+
+        Returns
+        -------
+        StackingModel
+            Fitted ensemble with its base fold models reloaded.
+        """
+        ensemble = read_file(layout.stack_model_path(ensemble_name=ensemble_name))
+        if not isinstance(ensemble, cls):
+            msg = f"Stack model artifact for {ensemble_name} is not a {cls.__name__}: {type(ensemble).__name__}."
+            raise TypeError(msg)
+        ensemble.base_models_ = {
+            model_name: [
+                read_file(layout.model_path(model_name=model_name, fold_id=fold_id)) for fold_id in ensemble.fold_ids_
+            ]
+            for model_name in ensemble.base_models_
+        }
+        return ensemble
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Drop factories and base fold models, which are saved separately."""
+        state = self.__dict__.copy()
+        state["base_model_factories"] = None
+        state["meta_model_factory"] = None
+        state["base_models_"] = {model_name: [] for model_name in self.base_models_}
+        return state
+
+    def _require_fit(self) -> DatasetSchema:
+        if self.schema_ is None or not self.meta_models_:
+            msg = f"{self.name} must be fit before prediction."
+            raise RuntimeError(msg)
+        return self.schema_
+
+    def _stack_feature_names(self) -> list[str]:
+        if self.ensemble_ is None:
+            msg = f"{self.name} must be fit before prediction."
+            raise RuntimeError(msg)
+        return self.ensemble_.stack_feature_columns
+
+
+def _meta_fold(fold: FoldDesignMatrix, stack_matrix: pd.DataFrame) -> FoldDesignMatrix:
+    """Return the level-2 fold with the same train/validation ids as a base fold."""
+    id_col = fold.schema.id_col
+    stack_ids = pd.Index(stack_matrix[id_col])
+    train_positions = stack_ids.get_indexer(fold.train[id_col])
+    return FoldDesignMatrix(
+        fold_id=fold.fold_id,
+        schema=fold.schema,
+        train=stack_matrix.iloc[train_positions[train_positions >= 0]].reset_index(drop=True),
+        val=stack_matrix.iloc[stack_ids.get_indexer(fold.val[id_col])].reset_index(drop=True),
+        fitted=FittedTransformerSet(),
+    )
+
+
+def _average_fold_outputs(
+    fold_models: Sequence[BaseModelWrapper],
+    values: np.ndarray[Any, Any],
+    ids: Any,
+    columns: Sequence[str],
+) -> np.ndarray[Any, Any]:
+    """Return fold models' outputs averaged into one accumulator."""
+    totals: np.ndarray[Any, Any] | None = None
+    for model in fold_models:
+        outputs = model.predict_arrays(values, ids, columns=columns)[1]
+        if totals is None:
+            totals = np.array(outputs, dtype=float)
+        else:
+            totals += outputs
+    if totals is None:
+        msg = "fold_models must include at least one fitted model."
+        raise ValueError(msg)
+    totals /= len(fold_models)
+    return totals
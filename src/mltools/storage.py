@@ -0,0 +1,539 @@
+"""Pluggable object-store backends for artifact I/O."""
+
+from __future__ import annotations
+
+import abc
+import hashlib
+import io
+import os
+import shutil
+import tempfile
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING, Any
+
+import pyarrow as pa
+import pyarrow.fs as pafs
+import pydantic as pdt
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_DEFAULT_PART_SIZE = 8 * 1024 * 1024
+_NOT_FOUND_CODES = {"404", "NoSuchKey", "NotFound"}
+
+
+class ObjectInfo(pdt.BaseModel):
+    """Size and ETag of a stored object."""
+
+    key: str
+    size: int
+    etag: str
+
+
+class ObjectStore(abc.ABC):
+    """Minimal S3-style object store used by :class:`RemoteFileSystem`.
+
+    Keys are ``/``-separated object names without a leading slash. Missing objects
+    raise :class:`FileNotFoundError`.
+    """
+
+    @abc.abstractmethod
+    def head(self, key: str) -> ObjectInfo:
+        """Return the size and ETag of an object."""
+
+    @abc.abstractmethod
+    def get_range(self, key: str, start: int, end: int) -> bytes:
+        """Return the bytes ``[start, end)`` of an object."""
+
+    @abc.abstractmethod
+    def put(self, key: str, data: bytes) -> str:
+        """Store an object in one request and return its ETag."""
+
+    @abc.abstractmethod
+    def create_multipart_upload(self, key: str) -> str:
+        """Start a multipart upload and return its upload id."""
+
+    @abc.abstractmethod
+    def upload_part(self, key: str, upload_id: str, part_number: int, data: bytes) -> str:
+        """Upload one part, numbered from 1, and return its ETag."""
+
+    @abc.abstractmethod
+    def complete_multipart_upload(self, key: str, upload_id: str, parts: list[tuple[int, str]]) -> str:
+        """Assemble uploaded ``(part_number, etag)`` parts into the object and return its ETag."""
+
+    @abc.abstractmethod
+    def abort_multipart_upload(self, key: str, upload_id: str) -> None:
+        """Discard a multipart upload and its parts."""
+
+    @abc.abstractmethod
+    def list_objects(self, prefix: str) -> list[ObjectInfo]:
+        """Return every object whose key starts with ``prefix``."""
+
+
+class LocalDirectoryStore(ObjectStore):
+    """Object store backed by a local directory, for tests and local stand-ins.
+
+    ETags follow S3: the MD5 of the content for single uploads, and the MD5 of the part
+    digests suffixed with the part count for multipart uploads.
+    """
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+        self._objects = self.root / "objects"
+        self._etags = self.root / "etags"
+        self._uploads = self.root / "uploads"
+
+    def head(self, key: str) -> ObjectInfo:
+        """Return the size and ETag of an object."""
+        path = self._object_path(key)
+        if not path.is_file():
+            msg = f"Object does not exist: {key}"
+            raise FileNotFoundError(msg)
+        return ObjectInfo(key=key, size=path.stat().st_size, etag=self._etag_path(key).read_text(encoding="utf-8"))
+
+    def get_range(self, key: str, start: int, end: int) -> bytes:
+        """Return the bytes ``[start, end)`` of an object."""
+        path = self._object_path(key)
+        if not path.is_file():
+            msg = f"Object does not exist: {key}"
+            raise FileNotFoundError(msg)
+        with path.open("rb") as file:
+            file.seek(start)
+            return file.read(max(end - start, 0))
+
+    def put(self, key: str, data: bytes) -> str:
+        """Store an object in one request and return its ETag."""
+        etag = hashlib.md5(data, usedforsecurity=False).hexdigest()
+        self._store(key, etag, lambda file: file.write(data))
+        return etag
+
+    def create_multipart_upload(self, key: str) -> str:
+        """Start a multipart upload and return its upload id."""
+        self._object_path(key)
+        upload_id = uuid.uuid4().hex
+        (self._uploads / upload_id).mkdir(parents=True)
+        return upload_id
+
+    def upload_part(self, key: str, upload_id: str, part_number: int, data: bytes) -> str:  # noqa: ARG002
+        """Upload one part, numbered from 1, and return its ETag."""
+        (self._uploads / upload_id / f"{part_number:05d}").write_bytes(data)
+        return hashlib.md5(data, usedforsecurity=False).hexdigest()
+
+    def complete_multipart_upload(self, key: str, upload_id: str, parts: list[tuple[int, str]]) -> str:
+        """Assemble uploaded ``(part_number, etag)`` parts into the object and return its ETag."""
+        upload_dir = self._uploads / upload_id
+        ordered = sorted(parts)
+        digest = hashlib.md5(b"".join(bytes.fromhex(etag) for _, etag in ordered), usedforsecurity=False)
+        etag = f"{digest.hexdigest()}-{len(ordered)}"
+
+        def write(file: Any) -> None:
+            for part_number, _ in ordered:
+                with (upload_dir / f"{part_number:05d}").open("rb") as part:
+                    shutil.copyfileobj(part, file)
+
+        self._store(key, etag, write)
+        shutil.rmtree(upload_dir)
+        return etag
+
+    def abort_multipart_upload(self, key: str, upload_id: str) -> None:  # noqa: ARG002
+        """Discard a multipart upload and its parts."""
+        shutil.rmtree(self._uploads / upload_id, ignore_errors=True)
+
+    def list_objects(self, prefix: str) -> list[ObjectInfo]:
+        """Return every object whose key starts with ``prefix``."""
+        if not self._objects.is_dir():
+            return []
+        keys = sorted(path.relative_to(self._objects).as_posix() for path in self._objects.rglob("*") if path.is_file())
+        return [self.head(key) for key in keys if key.startswith(prefix) and not key.endswith(".partial")]
+
+    def _object_path(self, key: str) -> Path:
+        parts = PurePosixPath(key).parts
+        if not parts or key.startswith("/") or any(part in {".", ".."} for part in parts):
+            msg = f"Invalid object key: {key!r}"
+            raise ValueError(msg)
+        return self._objects.joinpath(*parts)
+
+    def _etag_path(self, key: str) -> Path:
+        return self._etags.joinpath(*PurePosixPath(key).parts)
+
+    def _store(self, key: str, etag: str, write: Callable[[Any], Any]) -> None:
+        path = self._object_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_name(f"{path.name}.{uuid.uuid4().hex}.partial")
+        with partial.open("wb") as file:
+            write(file)
+        etag_path = self._etag_path(key)
+        etag_path.parent.mkdir(parents=True, exist_ok=True)
+        etag_path.write_text(etag, encoding="utf-8")
+        partial.replace(path)
+
+
+class S3ObjectStore(ObjectStore):
+    """Object store over an S3-compatible client, such as a boto3 client for S3 or MinIO.
+
+    The client is used through its ``head_object``, ``get_object``, ``put_object``,
+    multipart upload and ``list_objects_v2`` methods, so no client library is imported.
+    """
+
+    def __init__(self, client: Any, bucket: str):
+        self.client = client
+        self.bucket = bucket
+
+    def head(self, key: str) -> ObjectInfo:
+        """Return the size and ETag of an object."""
+        try:
+            response = self.client.head_object(Bucket=self.bucket, Key=key)
+        except Exception as error:
+            if _error_code(error) in _NOT_FOUND_CODES:
+                msg = f"Object does not exist: s3://{self.bucket}/{key}"
+                raise FileNotFoundError(msg) from error
+            raise
+        return ObjectInfo(key=key, size=response["ContentLength"], etag=_strip_etag(response["ETag"]))
+
+    def get_range(self, key: str, start: int, end: int) -> bytes:
+        """Return the bytes ``[start, end)`` of an object."""
+        if end <= start:
+            return b""
+        response = self.client.get_object(Bucket=self.bucket, Key=key, Range=f"bytes={start}-{end - 1}")
+        return response["Body"].read()
+
+    def put(self, key: str, data: bytes) -> str:
+        """Store an object in one request and return its ETag."""
+        return _strip_etag(self.client.put_object(Bucket=self.bucket, Key=key, Body=data)["ETag"])
+
+    def create_multipart_upload(self, key: str) -> str:
+        """Start a multipart upload and return its upload id."""
+        return self.client.create_multipart_upload(Bucket=self.bucket, Key=key)["UploadId"]
+
+    def upload_part(self, key: str, upload_id: str, part_number: int, data: bytes) -> str:
+        """Upload one part, numbered from 1, and return its ETag."""
+        response = self.client.upload_part(
+            Bucket=self.bucket,
+            Key=key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=data,
+        )
+        return _strip_etag(response["ETag"])
+
+    def complete_multipart_upload(self, key: str, upload_id: str, parts: list[tuple[int, str]]) -> str:
+        """Assemble uploaded ``(part_number, etag)`` parts into the object and return its ETag."""
+        response = self.client.complete_multipart_upload(
+            Bucket=self.bucket,
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": [{"PartNumber": number, "ETag": etag} for number, etag in sorted(parts)]},
+        )
+        return _strip_etag(response["ETag"])
+
+    def abort_multipart_upload(self, key: str, upload_id: str) -> None:
+        """Discard a multipart upload and its parts."""
+        self.client.abort_multipart_upload(Bucket=self.bucket, Key=key, UploadId=upload_id)
+
+    def list_objects(self, prefix: str) -> list[ObjectInfo]:
+        """Return every object whose key starts with ``prefix``."""
+        objects: list[ObjectInfo] = []
+        request = {"Bucket": self.bucket, "Prefix": prefix}
+        while True:
+            response = self.client.list_objects_v2(**request)
+            objects.extend(
+                ObjectInfo(key=item["Key"], size=item["Size"], etag=_strip_etag(item["ETag"]))
+                for item in response.get("Contents", [])
+            )
+            if not response.get("IsTruncated"):
+                return objects
+            request["ContinuationToken"] = response["NextContinuationToken"]
+
+
+class RangedObjectFile(io.RawIOBase):
+    """Read-only, seekable file over an object that fetches only the requested byte ranges."""
+
+    def __init__(self, store: ObjectStore, key: str, size: int):
+        self.store = store
+        self.key = key
+        self.size = size
+        self._position = 0
+
+    def readable(self) -> bool:
+        """Return ``True``."""
+        return True
+
+    def seekable(self) -> bool:
+        """Return ``True``."""
+        return True
+
+    def tell(self) -> int:
+        """Return the current position."""
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """Move to a position relative to the start, the current position or the end."""
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._position, io.SEEK_END: self.size}[whence]
+        self._position = max(base + offset, 0)
+        return self._position
+
+    def readinto(self, buffer: Any) -> int:
+        """Read up to ``len(buffer)`` bytes with one ranged request."""
+        view = memoryview(buffer).cast("B")
+        data = self.store.get_range(self.key, self._position, min(self._position + len(view), self.size))
+        view[: len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+    def readall(self) -> bytes:
+        """Read the rest of the object with one ranged request."""
+        data = self.store.get_range(self.key, self._position, self.size)
+        self._position += len(data)
+        return data
+
+
+class RemoteFileSystem:
+    """Upload, download and ranged-read objects of a store, with a local ETag-keyed cache.
+
+    Parameters
+    ----------
+    store
+        Object store holding the artifacts.
+    cache_dir
+        Directory of downloaded objects. Each object is kept under its key and ETag,
+        so an unchanged object is downloaded once. Defaults to a directory in the
+        system temporary directory.
+    part_size
+        Size of the parts of multipart uploads and of concurrent ranged downloads.
+        S3 requires parts of at least 5 MiB.
+    max_workers
+        Maximum number of parts transferred at the same time.
+    """
+
+    def __init__(
+        self,
+        store: ObjectStore,
+        *,
+        cache_dir: str | Path | None = None,
+        part_size: int = _DEFAULT_PART_SIZE,
+        max_workers: int = 4,
+    ):
+        if part_size < 1 or max_workers < 1:
+            msg = f"part_size and max_workers must be at least 1, got {part_size} and {max_workers}."
+            raise ValueError(msg)
+        self.store = store
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else Path(tempfile.gettempdir()) / "mltools-cache"
+        self.part_size = part_size
+        self.max_workers = max_workers
+
+    def upload(self, local_path: str | Path, key: str) -> ObjectInfo:
+        """Upload a local file, in concurrent parts when it is larger than ``part_size``."""
+        path = Path(local_path)
+        size = path.stat().st_size
+        if size <= self.part_size:
+            return ObjectInfo(key=key, size=size, etag=self.store.put(key, path.read_bytes()))
+
+        upload_id = self.store.create_multipart_upload(key)
+        try:
+            with path.open("rb") as file:
+
+                def upload_part(part_number: int) -> tuple[int, str]:
+                    data = os.pread(file.fileno(), self.part_size, (part_number - 1) * self.part_size)
+                    return part_number, self.store.upload_part(key, upload_id, part_number, data)
+
+                part_numbers = range(1, -(-size // self.part_size) + 1)
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    parts = list(executor.map(upload_part, part_numbers))
+            etag = self.store.complete_multipart_upload(key, upload_id, parts)
+        except BaseException:
+            self.store.abort_multipart_upload(key, upload_id)
+            raise
+        return ObjectInfo(key=key, size=size, etag=etag)
+
+    def staging_path(self, key: str) -> Path:
+        """Return a new local path, with the key's file name, to write an object before :meth:`commit`."""
+        staging_dir = self.cache_dir / "staging" / uuid.uuid4().hex
+        staging_dir.mkdir(parents=True)
+        return staging_dir / PurePosixPath(key).name
+
+    def commit(self, staged_path: Path, key: str) -> Path:
+        """Upload a staged file and move it into the cache as the copy of the new object."""
+        info = self.upload(staged_path, key)
+        cached = self.cache_path(key, info.etag)
+        self._replace_cached(staged_path, cached)
+        staged_path.parent.rmdir()
+        return cached
+
+    def download(self, key: str) -> Path:
+        """Return a local copy of an object, downloading it in concurrent ranges unless cached."""
+        info = self.store.head(key)
+        cached = self.cache_path(key, info.etag)
+        if cached.is_file() and cached.stat().st_size == info.size:
+            return cached
+
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        partial = cached.with_name(f"{cached.name}.{uuid.uuid4().hex}.partial")
+        with partial.open("wb") as file:
+            file.truncate(info.size)
+
+            def download_range(start: int) -> None:
+                data = self.store.get_range(key, start, min(start + self.part_size, info.size))
+                os.pwrite(file.fileno(), data, start)
+
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                list(executor.map(download_range, range(0, info.size, self.part_size)))
+        self._replace_cached(partial, cached)
+        return cached
+
+    def cache_path(self, key: str, etag: str) -> Path:
+        """Return the cache location of one version of an object."""
+        key_dir = hashlib.sha256(key.encode()).hexdigest()[:32]
+        safe_etag = "".join(char if char.isalnum() or char == "-" else "_" for char in etag)
+        return self.cache_dir / "objects" / key_dir / safe_etag / PurePosixPath(key).name
+
+    def open(self, key: str) -> RangedObjectFile:
+        """Open an object for ranged reads."""
+        return RangedObjectFile(self.store, key, self.store.head(key).size)
+
+    def arrow_filesystem(self) -> pafs.PyFileSystem:
+        """Return a read-only pyarrow filesystem over the store, reading byte ranges on demand."""
+        return pafs.PyFileSystem(_ObjectStoreHandler(self.store))
+
+    def _replace_cached(self, source: Path, cached: Path) -> None:
+        """Move a file into the cache and drop older versions of the same key."""
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        source.replace(cached)
+        for version in cached.parent.parent.iterdir():
+            if version != cached.parent:
+                shutil.rmtree(version, ignore_errors=True)
+
+
+def register_filesystem(prefix: str, filesystem: RemoteFileSystem | ObjectStore) -> RemoteFileSystem:
+    """Route artifact paths starting with ``prefix`` to an object store.
+
+    Parameters
+    ----------
+    prefix
+        URI prefix such as ``"s3://artifacts"``. Paths below it map to object keys
+        relative to the prefix.
+    filesystem
+        Remote filesystem, or an object store wrapped with default settings.
+
+    Returns
+    -------
+    RemoteFileSystem
+        The registered filesystem.
+    """
+    normalized = prefix.rstrip("/")
+    if "://" not in normalized:
+        msg = f"Object store prefix must be a URI such as s3://bucket, got {prefix}."
+        raise ValueError(msg)
+    remote = filesystem if isinstance(filesystem, RemoteFileSystem) else RemoteFileSystem(filesystem)
+    _FILESYSTEMS[normalized] = remote
+    return remote
+
+
+def unregister_filesystem(prefix: str) -> None:
+    """Stop routing paths starting with ``prefix`` to an object store."""
+    _FILESYSTEMS.pop(prefix.rstrip("/"), None)
+
+
+def resolve_uri(path: str | Path) -> tuple[RemoteFileSystem, str] | None:
+    """Return the filesystem and object key for a URI, or ``None`` for local paths."""
+    if not isinstance(path, str) or "://" not in path:
+        return None
+    for prefix in sorted(_FILESYSTEMS, key=len, reverse=True):
+        if path.startswith(f"{prefix}/") and len(path) > len(prefix) + 1:
+            return _FILESYSTEMS[prefix], path[len(prefix) + 1 :]
+    msg = f"No object store is registered for {path}."
+    raise ValueError(msg)
+
+
+class _ObjectStoreHandler(pafs.FileSystemHandler):
+    """Read-only pyarrow filesystem handler over an object store."""
+
+    def __init__(self, store: ObjectStore):
+        self.store = store
+
+    def get_type_name(self) -> str:
+        return "mltools-object-store"
+
+    def normalize_path(self, path: str) -> str:
+        return path.strip("/")
+
+    def get_file_info(self, paths: list[str]) -> list[pafs.FileInfo]:
+        infos = []
+        for path in paths:
+            try:
+                infos.append(pafs.FileInfo(path, pafs.FileType.File, size=self.store.head(path).size))
+            except FileNotFoundError:
+                is_dir = bool(self.store.list_objects(f"{path.rstrip('/')}/"))
+                infos.append(pafs.FileInfo(path, pafs.FileType.Directory if is_dir else pafs.FileType.NotFound))
+        return infos
+
+    def get_file_info_selector(self, selector: pafs.FileSelector) -> list[pafs.FileInfo]:
+        base = selector.base_dir.strip("/")
+        prefix = f"{base}/" if base else ""
+        objects = self.store.list_objects(prefix)
+        if not objects and not selector.allow_not_found:
+            msg = f"Object store directory does not exist: {selector.base_dir}"
+            raise FileNotFoundError(msg)
+        infos: dict[str, pafs.FileInfo] = {}
+        for info in objects:
+            parts = PurePosixPath(info.key[len(prefix) :]).parts
+            depth = len(parts) if selector.recursive else 1
+            for level in range(1, min(depth, len(parts) - 1) + 1):
+                directory = prefix + "/".join(parts[:level])
+                infos.setdefault(directory, pafs.FileInfo(directory, pafs.FileType.Directory))
+            if selector.recursive or len(parts) == 1:
+                infos[info.key] = pafs.FileInfo(info.key, pafs.FileType.File, size=info.size)
+        return list(infos.values())
+
+    def open_input_file(self, path: str) -> pa.NativeFile:
+        return pa.PythonFile(RangedObjectFile(self.store, path, self.store.head(path).size), mode="r")
+
+    def open_input_stream(self, path: str) -> pa.NativeFile:
+        return self.open_input_file(path)
+
+    def open_output_stream(self, path: str, metadata: Any) -> pa.NativeFile:  # noqa: ARG002
+        return _read_only(path)
+
+    def open_append_stream(self, path: str, metadata: Any) -> pa.NativeFile:  # noqa: ARG002
+        return _read_only(path)
+
+    def create_dir(self, path: str, recursive: bool) -> None:  # noqa: ARG002, FBT001
+        _read_only(path)
+
+    def delete_dir(self, path: str) -> None:
+        _read_only(path)
+
+    def delete_dir_contents(self, path: str, missing_dir_ok: bool = False) -> None:  # noqa: ARG002, FBT001, FBT002
+        _read_only(path)
+
+    def delete_root_dir_contents(self) -> None:
+        _read_only("/")
+
+    def delete_file(self, path: str) -> None:
+        _read_only(path)
+
+    def move(self, src: str, dest: str) -> None:  # noqa: ARG002
+        _read_only(src)
+
+    def copy_file(self, src: str, dest: str) -> None:  # noqa: ARG002
+        _read_only(src)
+
+
+def _read_only(path: str) -> Any:
+    msg = f"The object store filesystem is read-only; upload artifacts through mltools.io: {path}"
+    raise NotImplementedError(msg)
+
+
+def _strip_etag(etag: str) -> str:
+    return etag.strip('"')
+
+
+def _error_code(error: Exception) -> str | None:
+    response = getattr(error, "response", None)
+    if not isinstance(response, dict):
+        return None
+    return str(response.get("Error", {}).get("Code"))
+
+
+_FILESYSTEMS: dict[str, RemoteFileSystem] = {}
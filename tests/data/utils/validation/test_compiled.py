@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import mltools.data.utils.validation as mtv
+import mltools.data.utils.validation.schema as mts
+
+
+@pytest.fixture
+def schema():
+    return [
+        mts.SchemaObj(column="a", dtype="int64", valid_vals=[mts.SchemaRange(0, 4), mts.SchemaList([10, 11])]),
+        mts.SchemaObj(column="b", dtype="float64", valid_vals=[mts.SchemaRange(0.0, 1.0, include_ub=False)]),
+        mts.SchemaObj(column="c", dtype="float64", valid_vals=[mts.SchemaRange(minval=0)], nullable=False),
+        mts.SchemaObj(column="d", dtype="int64"),
+    ]
+
+
+@pytest.fixture
+def data():
+    return pd.DataFrame(
+        {
+            "a": [0, 5, 10, 12, 4],
+            "b": [0.0, 0.5, 1.0, np.nan, 0.2],
+            "c": [1.0, np.nan, -1.0, 2.0, 3.0],
+        },
+    )
+
+
+def test_compiled_schema_reports_messages_rows_and_nulls(schema, data):
+    report = mtv.compile_schema(schema).validate(data)
+
+    assert report.messages == [
+        "Found illegal values [5, 12] in a, expected value in [Range[0, 4], List[10, 11]].",
+        "Found illegal values [1.0] in b, expected value in [Range[0.0, 1.0)].",
+        "Found illegal values [nan, -1.0] in c, expected value in [Range[0, None]].",
+        "Found null values in non-nullable column c.",
+        "Required column d not found.",
+    ]
+    assert not report.is_valid
+    rows = report.illegal_rows()
+    assert rows["a"].tolist() == [1, 3]
+    assert rows["b"].tolist() == [2]
+    assert rows["c"].tolist() == [1, 2]
+    assert [column.null_count for column in report.columns] == [0, 1, 1, 0]
+
+
+def test_compiled_schema_parallel_matches_sequential(schema, data):
+    compiled = mtv.compile_schema(schema)
+
+    assert compiled.validate(data, max_workers=4).messages == compiled.validate(data).messages
+
+
+def test_validate_data_matches_compiled_messages(schema, data):
+    assert mtv.validate_data(data, schema, max_workers=2) == mtv.compile_schema(schema).validate(data).messages
+
+
+def test_compiled_schema_reports_invalid_dtype_only():
+    schema = [mts.SchemaObj(column="a", dtype="int64", valid_vals=[mts.SchemaRange(0, 1)])]
+
+    report = mtv.compile_schema(schema).validate(pd.DataFrame({"a": ["x", "y"]}))
+
+    assert report.messages == ["Invalid datatype for a: str, expected: int64."]
+    assert report.illegal_rows() == {}
+
+
+def test_check_dtype_coerces_object_columns_once():
+    col = pd.Series(["0.5", 2, None, "x", "3"], dtype="object")
+
+    check = mtv.check_dtype(col, "float64")
+
+    assert not check.matches
+    assert check.non_coercible_rows.tolist() == [3]
+    np.testing.assert_array_equal(check.values, [0.5, 2.0, np.nan, np.nan, 3.0])
+    assert mtv.dtype_matches(col.drop(3), "float64")
+
+
+def test_check_dtype_accepts_nan_strings_like_astype():
+    col = pd.Series(["1", "nan", " NaN ", "inf", None], dtype="object")
+
+    check = mtv.check_dtype(col, "float64")
+
+    assert check.matches
+    assert check.non_coercible_rows.tolist() == []
+    np.testing.assert_array_equal(check.values, col.astype("float64").to_numpy())
+    assert mtv.validate_data(pd.DataFrame({"a": col}), [mts.SchemaObj(column="a", dtype="float64")]) == []
+
+
+def test_object_column_reports_non_coercible_rows_and_checks_coerced_ranges():
+    schema = [mts.SchemaObj(column="a", dtype="float64", valid_vals=[mts.SchemaRange(0.0, 1.0)])]
+    compiled = mtv.compile_schema(schema)
+
+    bad = compiled.validate(pd.DataFrame({"a": pd.Series(["0.5", "x", "y", 0.1], dtype="object")}))
+    coercible = compiled.validate(pd.DataFrame({"a": pd.Series(["0.5", "2", None, pd.NA], dtype="object")}))
+
+    assert bad.messages == ["Invalid datatype for a: object, expected: float64."]
+    assert bad.columns[0].non_coercible_rows.tolist() == [1, 2]
+    assert bad.columns[0].non_coercible_count == 2
+    assert coercible.messages == ["Found illegal values ['2'] in a, expected value in [Range[0.0, 1.0]]."]
+    assert coercible.columns[0].illegal_rows.tolist() == [1]
+    assert coercible.columns[0].null_count == 2
+
+
+@pytest.mark.parametrize(("dtype", "schema_dtype"), [("Int64", "float64"), ("Float64", "float64"), ("Int64", "Int64")])
+def test_nullable_extension_columns_are_range_checked(dtype, schema_dtype):
+    schema = [mts.SchemaObj(column="a", dtype=schema_dtype, valid_vals=[mts.SchemaRange(0, 4)])]
+    data = pd.DataFrame({"a": pd.array([1, None, 7, 3], dtype=dtype)})
+
+    report = mtv.compile_schema(schema).validate(data)
+
+    assert report.columns[0].illegal_rows.tolist() == [2]
+    assert report.columns[0].null_count == 1
+    assert len(report.messages) == 1
+
+
+def test_merged_lists_are_reused_across_compilations():
+    s = mts.SchemaObj(column="a", dtype="int64", valid_vals=[mts.SchemaList([1, 2]), mts.SchemaList([3])])
+    data = pd.DataFrame({"a": [1, 3, 4]})
+
+    first = mtv.CompiledColumn(s)
+    assert mtv.CompiledColumn(s)._allowed is first._allowed
+    assert mtv.validate_data(data, [s]) == ["Found illegal values [4] in a, expected value in [List[1, 2], List[3]]."]
+
+    s.valid_vals.append(mts.SchemaList([4]))
+    assert mtv.CompiledColumn(s)._allowed is not first._allowed
+    assert mtv.validate_data(data, [s]) == []
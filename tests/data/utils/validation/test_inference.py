@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+import mltools.data.utils.validation as mtv
+import mltools.data.utils.validation.schema as mts
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "flag": rng.integers(0, 3, size=200),
+            "count": np.arange(200),
+            "score": rng.uniform(-1.0, 2.0, size=200),
+            "city": rng.choice(["a", "b", "c"], size=200),
+            "maybe": np.where(np.arange(200) % 7 == 0, np.nan, rng.normal(size=200)),
+        },
+    )
+
+
+@pytest.fixture
+def parquet_path(tmp_path, data):
+    path = tmp_path / "data.parquet"
+    pq.write_table(pa.Table.from_pandas(data, preserve_index=False), path, row_group_size=32)
+    return path
+
+
+def _dicts(schema):
+    return [s.to_dict() for s in schema]
+
+
+def test_infer_schema_proposes_rules(data):
+    schema = {s.column: s for s in mtv.infer_schema(data, max_list_values=5)}
+
+    assert schema["flag"].dtype == "int64"
+    assert schema["flag"].valid_vals[0].vals == [0, 1, 2]
+    assert schema["count"].valid_vals[0].to_dict() == mts.SchemaRange(0, 199).to_dict()
+    assert isinstance(schema["score"].valid_vals[0], mts.SchemaRange)
+    assert schema["city"].valid_vals[0].vals == ["a", "b", "c"]
+    assert not schema["flag"].nullable
+    assert schema["maybe"].nullable
+
+
+def test_inferred_schema_round_trips_and_validates(data):
+    schema = mts.dict_to_schema(_dicts(mtv.infer_schema(data)))
+
+    assert mtv.validate_data(data, schema) == []
+    assert mtv.validate_data(data.assign(count=data["count"] + 1), schema) != []
+
+
+def test_parquet_inference_matches_in_memory(data, parquet_path):
+    assert _dicts(mtv.infer_schema(parquet_path)) == _dicts(mtv.infer_schema(data))
+
+
+def test_parquet_merges_int_and_float_row_groups(tmp_path):
+    path = tmp_path / "mixed.parquet"
+    with pq.ParquetWriter(path, pa.schema([("x", pa.int64())])) as writer:
+        writer.write_table(pa.table({"x": pa.array([1, 2, 3], pa.int64())}))
+        writer.write_table(pa.table({"x": pa.array([None, 8, 9], pa.int64())}))
+
+    (schema,) = mtv.infer_schema(path, max_list_values=0)
+
+    assert schema.dtype == "float64"
+    assert schema.valid_vals[0].to_dict() == mts.SchemaRange(1, 9).to_dict()
+    assert schema.nullable
+
+
+@pytest.mark.parametrize("source", ["frame", "parquet"])
+def test_sampled_inference(data, parquet_path, source):
+    table = data if source == "frame" else parquet_path
+
+    first = mtv.infer_schema(table, columns=["count", "city"], sample_size=50, random_state=1)
+    second = mtv.infer_schema(table, columns=["count", "city"], sample_size=50, random_state=1)
+
+    assert _dicts(first) == _dicts(second)
+    assert [s.column for s in first] == ["count", "city"]
+    count_range = first[0].valid_vals[0]
+    assert 0 <= count_range.minval < count_range.maxval <= 199
+    assert first[1].valid_vals[0].vals == ["a", "b", "c"]
+
+
+def test_constant_and_empty_columns():
+    data = pd.DataFrame({"const": [1.5, 1.5], "empty": [np.nan, np.nan]})
+
+    const, empty = mtv.infer_schema(data)
+
+    assert const.valid_vals[0].vals == [1.5]
+    assert empty.valid_vals == []
+    assert empty.nullable
+
+
+def test_infer_schema_rejects_empty_sample(data):
+    with pytest.raises(ValueError, match="sample_size"):
+        mtv.infer_schema(data, sample_size=0)
@@ -94,6 +94,32 @@ def test_schema_list_contains(schemalist, val, expected, input_fn):
     assert schemalist.contains(data).tolist() == [expected]
 
 
+@pytest.mark.parametrize(
+    "data",
+    [
+        pd.Series(["a", "z", None, "b"]),
+        pd.Series(["a", "z", None, "b"], dtype="category"),
+        pd.Series([1.0, 5.0, np.nan, 2.0]),
+        pd.Series([True, False, True, False]),
+    ],
+)
+@pytest.mark.parametrize("vals", [["a", "b"], ["a", "b", None], [1, 2], [1, 2, np.nan], [True]])
+def test_schema_list_contains_matches_isin(data, vals):
+    assert mts.SchemaList(vals).contains(data).tolist() == data.isin(vals).tolist()
+
+
+def test_schema_list_index_is_built_once_and_reset_on_assignment():
+    sl = mts.SchemaList(["a", "b", "b"])
+    index = sl.index
+
+    sl.contains(["a", "c"])
+    assert sl.index is index
+    assert index.tolist() == ["a", "b"]
+
+    sl.vals = ["c"]
+    assert sl.contains(["a", "c"]).tolist() == [False, True]
+
+
 def test_unpack_pack_schemalist():
     sl = mts.SchemaList(["a", "b", "c"])
     serialized = mts.dict_to_valid_vals(sl.to_dict())
@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+import mltools.data.utils.validation as mtv
+import mltools.data.utils.validation.schema as mts
+
+
+@pytest.fixture
+def schema():
+    return [
+        mts.SchemaObj(column="a", dtype="int64", valid_vals=[mts.SchemaRange(0, 4), mts.SchemaList([10, 11])]),
+        mts.SchemaObj(column="b", dtype="float64", valid_vals=[mts.SchemaRange(0.0, 1.0)]),
+        mts.SchemaObj(column="c", dtype="float64", valid_vals=[mts.SchemaRange(minval=0)], nullable=False),
+        mts.SchemaObj(column="d", dtype="int64"),
+    ]
+
+
+@pytest.fixture
+def parquet_path(tmp_path):
+    data = pd.DataFrame(
+        {
+            "a": [0, 5, 10, 12, 4, 5, 7, 1, 2, 3],
+            "b": [0.0, 0.5, 2.0, np.nan, 0.2, 0.3, 3.0, 0.1, 2.0, 0.4],
+            "c": [1.0, np.nan, -1.0, 2.0, 3.0, np.nan, -2.0, 1.0, 1.0, 1.0],
+            "unused": ["x"] * 10,
+        },
+    )
+    path = tmp_path / "feed.parquet"
+    pq.write_table(pa.Table.from_pandas(data, preserve_index=False), path, row_group_size=3)
+    return path
+
+
+@pytest.mark.parametrize("max_workers", [None, 2, 8])
+def test_validate_parquet_matches_validate_data(schema, parquet_path, max_workers):
+    report = mtv.validate_parquet(parquet_path, schema, max_workers=max_workers)
+
+    assert report.messages == mtv.validate_data(pd.read_parquet(parquet_path), schema)
+    rows = report.illegal_rows()
+    assert rows["a"].tolist() == [1, 3, 5, 6]
+    assert rows["b"].tolist() == [2, 6, 8]
+    assert rows["c"].tolist() == [1, 2, 5, 6]
+    assert [column.null_count for column in report.columns] == [0, 1, 2, 0]
+
+
+def test_validate_parquet_reports_dtype_found_in_later_row_group(tmp_path):
+    path = tmp_path / "feed.parquet"
+    pq.write_table(pa.table({"a": pa.array([1, 2, 3, None], type=pa.int64())}), path, row_group_size=2)
+    schema = [mts.SchemaObj(column="a", dtype="int64", valid_vals=[mts.SchemaRange(0, 1)])]
+
+    report = mtv.validate_parquet(path, schema)
+
+    assert report.messages == ["Invalid datatype for a: float64, expected: int64."]
+
+
+def test_validate_parquet_fail_fast_stops_after_first_error(schema, parquet_path):
+    report = mtv.validate_parquet(parquet_path, schema[:1], fail_fast=True)
+
+    assert report.messages == ["Found illegal values [5] in a, expected value in [Range[0, 4], List[10, 11]]."]
+    assert mtv.validate_parquet(parquet_path, schema, fail_fast=True).messages == ["Required column d not found."]
+
+
+def test_validate_parquet_caps_illegal_values(schema, parquet_path):
+    report = mtv.validate_parquet(parquet_path, schema[:1], max_illegal_values=1, max_workers=2)
+
+    assert report.messages == ["Found illegal values [5] in a, expected value in [Range[0, 4], List[10, 11]]."]
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Self
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -75,3 +76,96 @@ def test_prediction_frame_omits_target_and_uses_binary_score() -> None:
 
     assert pred.columns.tolist() == ["id", "score_1"]
     assert pred["score_1"].tolist() == [0.25]
+
+
+class FirstFeatureModel(BaseModelWrapper):
+    """Wrapper scoring the first recorded feature through the shared predict paths."""
+
+    def fit(self, fold: BaseFoldDesignMatrix) -> Self:
+        """Record fold context without backend fitting."""
+        self._record_fit_context(fold)
+        self.class_order_ = [0, 1]
+        self.is_fit = True
+        return self
+
+    def predict(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Return the first feature as the binary score."""
+        return self._predict_frame(df)
+
+    def _predict_values(self, x: pd.DataFrame | np.ndarray) -> np.ndarray:
+        return np.asarray(x, dtype=float)[:, 0]
+
+
+def _first_feature_model() -> FirstFeatureModel:
+    fold = FoldDesignMatrix(
+        fold_id=0,
+        schema=DatasetSchema(id_col="id", target_col="target"),
+        train=pd.DataFrame({"id": [1, 2], "target": [0, 1], "x": [0.1, 0.2], "y": [1.1, 1.2]}),
+        val=pd.DataFrame({"id": [3], "target": [0], "x": [0.3], "y": [1.3]}),
+        fitted=FittedTransformerSet(),
+    )
+    return FirstFeatureModel(name="first", task=Task.CLASSIFICATION).fit(fold)
+
+
+def test_array_and_record_predictions_match_dataframe_predictions() -> None:
+    model = _first_feature_model()
+    df = pd.DataFrame({"y": [1.3, 1.4], "id": [3, 4], "x": [0.3, 0.4]})
+
+    frame = model.predict(df)
+    array_ids, array_outputs = model.predict_arrays(df[["x", "y"]].to_numpy(), df["id"])
+    named_ids, named_outputs = model.predict_arrays(df.to_numpy(), df["id"], columns=list(df.columns))
+    record_ids, record_outputs = model.predict_records(df.to_dict(orient="records"))
+
+    assert model.output_columns() == ["score_1"]
+    assert frame.columns.tolist() == ["id", "score_1"]
+    for ids, outputs in [(array_ids, array_outputs), (named_ids, named_outputs), (record_ids, record_outputs)]:
+        assert ids.tolist() == frame["id"].tolist()
+        assert outputs.shape == (2, 1)
+        assert outputs[:, 0].tolist() == frame["score_1"].tolist()
+
+
+def test_array_predictions_fall_back_to_frame_predict() -> None:
+    fold = FoldDesignMatrix(
+        fold_id=0,
+        schema=DatasetSchema(id_col="id", target_col="target"),
+        train=pd.DataFrame({"id": [1, 2], "target": [0, 1], "x": [0.1, 0.2]}),
+        val=pd.DataFrame({"id": [3], "target": [0], "x": [0.3]}),
+        fitted=FittedTransformerSet(),
+    )
+    model = DummyModel(name="dummy", task=Task.CLASSIFICATION).fit(fold)
+
+    ids, outputs = model.predict_arrays(np.array([[0.3], [0.4]]), [3, 4])
+    record_ids, record_outputs = model.predict_records([{"id": 3, "x": 0.3}])
+
+    assert ids.tolist() == [3, 4]
+    assert outputs.tolist() == [[0.25], [0.25]]
+    assert record_ids.tolist() == [3]
+    assert record_outputs.tolist() == [[0.25]]
+
+
+def test_wrapper_without_predict_cannot_be_instantiated() -> None:
+    class NoPredictModel(BaseModelWrapper):
+        def fit(self, fold: BaseFoldDesignMatrix) -> Self:
+            self._record_fit_context(fold)
+            return self
+
+    with pytest.raises(TypeError, match="predict"):
+        NoPredictModel(name="incomplete", task=Task.REGRESSION)  # type: ignore[abstract]
+
+
+def test_array_predictions_validate_shape_and_ids() -> None:
+    model = _first_feature_model()
+
+    with pytest.raises(ValueError, match="2-D feature array with 2 columns"):
+        model.predict_arrays(np.zeros((2, 3)), [1, 2])
+    with pytest.raises(ValueError, match="Expected 2 ids"):
+        model.predict_arrays(np.zeros((2, 2)), [1])
+    with pytest.raises(ValueError, match="Missing feature columns"):
+        model.predict_arrays(np.zeros((1, 1)), [1], columns=["x"])
+
+
+def test_record_predictions_report_missing_columns() -> None:
+    model = _first_feature_model()
+
+    with pytest.raises(ValueError, match="missing column 'y'"):
+        model.predict_records([{"id": 1, "x": 0.1}])
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import pickle
+
+import numpy as np
 import pandas as pd
+import pytest
 
 from mltools.data.schema import DatasetSchema, FittedTransformerSet, FoldDesignMatrix
 from mltools.models.arch import LightGBMModel, Task
@@ -67,3 +71,138 @@ def test_lightgbm_feature_importance_gain_schema() -> None:
     assert importance["model_name"].unique().tolist() == ["lgbm_gain"]
     assert importance["feature"].tolist() == ["x1", "x2"]
     assert importance["importance_type"].unique().tolist() == ["gain"]
+
+
+def _small_params() -> dict[str, object]:
+    return {"num_boost_round": 3, "learning_rate": 0.2, "min_data_in_leaf": 1, "num_leaves": 3, "seed": 0}
+
+
+def test_lightgbm_continue_fit_boosts_additional_rounds() -> None:
+    fold = _binary_fold(weight_col="weight")
+    model = LightGBMModel(name="lgbm", task=Task.CLASSIFICATION, params=_small_params()).fit(fold)
+
+    result = model.continue_fit(fold, num_boost_round=2)
+
+    assert result is model
+    assert model.booster_ is not None
+    assert model.booster_.num_trees() == 5
+    assert model.predict(fold.val)["score_1"].between(0, 1).all()
+
+
+def test_lightgbm_continue_fit_refit_keeps_tree_structure() -> None:
+    fold = _binary_fold()
+    model = LightGBMModel(name="lgbm", task=Task.CLASSIFICATION, params=_small_params()).fit(fold)
+    before = model.predict(fold.val)["score_1"].to_numpy()
+
+    flipped = fold.model_copy(update={"train": fold.train.assign(target=1 - fold.train["target"])})
+    model.continue_fit(flipped, refit=True)
+
+    assert model.booster_ is not None
+    assert model.booster_.num_trees() == 3
+    assert not np.allclose(model.predict(fold.val)["score_1"].to_numpy(), before)
+
+
+def test_lightgbm_continue_fit_rejects_changed_features() -> None:
+    fold = _binary_fold()
+    model = LightGBMModel(name="lgbm", task=Task.CLASSIFICATION, params=_small_params()).fit(fold)
+    changed = fold.model_copy(update={"train": fold.train.drop(columns=["x2"]), "val": fold.val.drop(columns=["x2"])})
+
+    with pytest.raises(ValueError, match="was fit on features"):
+        model.continue_fit(changed)
+
+
+def test_lightgbm_continue_fit_rejects_unseen_classes() -> None:
+    fold = _binary_fold()
+    model = LightGBMModel(name="lgbm", task=Task.CLASSIFICATION, params=_small_params()).fit(fold)
+    unseen = fold.model_copy(update={"train": fold.train.assign(target=[0, 1, 2, 0, 1, 2, 0, 1])})
+
+    with pytest.raises(ValueError, match="not seen during fit"):
+        model.continue_fit(unseen)
+
+
+def test_lightgbm_continue_fit_requires_fit() -> None:
+    model = LightGBMModel(name="lgbm", task=Task.CLASSIFICATION, params=_small_params())
+
+    with pytest.raises(RuntimeError, match="must be fit"):
+        model.continue_fit(_binary_fold())
+
+
+def _categorical_fold() -> FoldDesignMatrix:
+    colors = ["red", "blue", "green", "red", "blue", "green"] * 4
+    train = pd.DataFrame(
+        {
+            "id": list(range(24)),
+            "target": [1 if color == "red" else 0 for color in colors],
+            "color": pd.Categorical(colors, categories=["blue", "green", "red"]),
+            "x1": [float(value % 5) for value in range(24)],
+        },
+    )
+    val = train.iloc[:6].assign(id=list(range(100, 106)))
+    return FoldDesignMatrix(
+        fold_id=0,
+        schema=DatasetSchema(id_col="id", target_col="target"),
+        train=train,
+        val=val,
+        fitted=FittedTransformerSet(),
+    )
+
+
+def test_lightgbm_records_category_levels_and_recodes_at_predict() -> None:
+    fold = _categorical_fold()
+    params = {**_small_params(), "num_boost_round": 10, "min_data_per_group": 1, "cat_smooth": 0}
+    model = LightGBMModel(name="lgbm_cat", task=Task.CLASSIFICATION, params=params).fit(fold)
+    expected = model.predict(fold.val)["score_1"].to_numpy()
+
+    reordered = fold.val.assign(color=fold.val["color"].cat.reorder_categories(["red", "green", "blue"]))
+    as_strings = fold.val.assign(color=fold.val["color"].astype(str))
+
+    assert model.categories_ == {"color": ["blue", "green", "red"]}
+    assert np.allclose(model.predict(reordered)["score_1"].to_numpy(), expected)
+    assert np.allclose(model.predict(as_strings)["score_1"].to_numpy(), expected)
+    assert expected[0] > expected[1]
+
+
+def test_lightgbm_unseen_and_missing_categories_are_scored_as_missing() -> None:
+    fold = _categorical_fold()
+    model = LightGBMModel(name="lgbm_cat", task=Task.CLASSIFICATION, params=_small_params()).fit(fold)
+    unseen = fold.val.assign(color=pd.Categorical(["purple", "purple", None, "red", "blue", "green"]))
+    missing = fold.val.assign(color=pd.Categorical([None, None, None, "red", "blue", "green"]))
+
+    pred = model.predict(unseen)
+
+    assert pred["score_1"].tolist() == model.predict(missing)["score_1"].tolist()
+    assert pred["score_1"].notna().all()
+
+
+def test_lightgbm_eval_metrics_are_recorded_for_early_stopping() -> None:
+    params = {**_small_params(), "eval_metrics": ["auc", "log_loss"], "early_stopping_rounds": 2}
+    model = LightGBMModel(name="lgbm", task=Task.CLASSIFICATION, params=params).fit(_binary_fold("weight"))
+
+    assert model.booster_ is not None
+    assert {"auc", "log_loss"} <= set(model.booster_.best_score["valid"])
+
+
+def test_lightgbm_record_predictions_recode_categories_like_dataframes() -> None:
+    fold = _categorical_fold()
+    model = LightGBMModel(name="lgbm_cat", task=Task.CLASSIFICATION, params=_small_params()).fit(fold)
+    records = fold.val.assign(color=fold.val["color"].astype(str)).to_dict(orient="records")
+
+    ids, outputs = model.predict_records(records)
+
+    assert ids.tolist() == fold.val["id"].tolist()
+    assert np.allclose(outputs[:, 0], model.predict(fold.val)["score_1"].to_numpy())
+
+
+def test_lightgbm_pickled_without_category_levels_still_predicts() -> None:
+    fold = _binary_fold()
+    model = LightGBMModel(name="lgbm", task=Task.CLASSIFICATION, params=_small_params()).fit(fold)
+    expected = model.predict(fold.val)
+    del model.categories_
+
+    restored = pickle.loads(pickle.dumps(model))  # noqa: S301
+
+    assert restored.categories_ == {}
+    pd.testing.assert_frame_equal(restored.predict(fold.val), expected)
+    ids, outputs = restored.predict_records(fold.val.to_dict(orient="records"))
+    assert ids.tolist() == expected["id"].tolist()
+    assert np.allclose(outputs[:, 0], expected["score_1"].to_numpy())
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
+from sklearn.compose import make_column_transformer
 from sklearn.ensemble import RandomForestClassifier
-from sklearn.linear_model import LogisticRegression
+from sklearn.linear_model import LinearRegression, LogisticRegression, SGDClassifier, SGDRegressor
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import OneHotEncoder
 from sklearn.svm import SVC
 
 from mltools.data.schema import DatasetSchema, FittedTransformerSet, FoldDesignMatrix
@@ -106,3 +112,125 @@ def test_sklearn_classification_requires_predict_proba() -> None:
 
     with pytest.raises(NotImplementedError, match="predict_proba"):
         model.predict(fold.val)
+
+
+def _stream_chunks() -> list[pd.DataFrame]:
+    fold = _binary_fold()
+    full = pd.concat([fold.train, fold.val], ignore_index=True).iloc[[0, 3, 1, 4, 2, 5, 6, 7]]
+    return [full.iloc[start : start + 2].reset_index(drop=True) for start in range(0, len(full), 2)]
+
+
+def test_sklearn_fit_stream_uses_partial_fit_and_keeps_prediction_contract() -> None:
+    chunks = _stream_chunks()
+    model = SklearnModel(name="sgd", task=Task.CLASSIFICATION, estimator=SGDClassifier(loss="log_loss", random_state=0))
+
+    result = model.fit_stream(chunks, schema=DatasetSchema(id_col="id", target_col="target"), epochs=3, random_state=0)
+    pred = result.predict(chunks[0].loc[:, ["x2", "id", "x1"]])
+
+    assert result is model
+    assert model.feature_names_ == ["x1", "x2"]
+    assert model.class_order_ == [0, 1]
+    assert pred.columns.tolist() == ["id", "score_1"]
+    assert pred["id"].tolist() == chunks[0]["id"].tolist()
+
+
+def test_sklearn_fit_stream_records_explicit_classes_on_first_chunk() -> None:
+    chunks = _stream_chunks()
+    model = SklearnModel(name="sgd", task=Task.CLASSIFICATION, estimator=SGDClassifier(loss="log_loss", random_state=0))
+
+    model.fit_stream(
+        [chunks[0].assign(target=0), *chunks[1:]],
+        schema=DatasetSchema(id_col="id", target_col="target"),
+        classes=[0, 1],
+        shuffle=False,
+    )
+
+    assert model.class_order_ == [0, 1]
+
+
+def test_sklearn_fit_stream_orders_unsorted_string_classes_like_predict_proba() -> None:
+    chunks = [chunk.assign(target=chunk["target"].map({0: "b", 1: "a"})) for chunk in _stream_chunks()]
+    model = SklearnModel(name="sgd", task=Task.CLASSIFICATION, estimator=SGDClassifier(loss="log_loss", random_state=0))
+
+    model.fit_stream(chunks, schema=DatasetSchema(id_col="id", target_col="target"), classes=["b", "a"])
+
+    assert model.class_order_ == ["a", "b"]
+    assert all(type(label) is str for label in model.class_order_)
+    assert model.class_order_ == model.estimator.classes_.tolist()
+
+
+def test_sklearn_fit_stream_reads_parquet_row_groups(tmp_path) -> None:
+    path = tmp_path / "train.parquet"
+    pq.write_table(pa.Table.from_pandas(pd.concat(_stream_chunks(), ignore_index=True)), path, row_group_size=2)
+    model = SklearnModel(name="sgd_reg", task=Task.REGRESSION, estimator=SGDRegressor(random_state=0))
+
+    model.fit_stream(path, schema=DatasetSchema(id_col="id", target_col="target"), epochs=2)
+
+    assert model.feature_names_ == ["x1", "x2"]
+    assert model.predict(_binary_fold().val).columns.tolist() == ["id", "prediction"]
+
+
+def test_sklearn_fit_stream_requires_partial_fit() -> None:
+    model = SklearnModel(name="logreg", task=Task.CLASSIFICATION, estimator=LogisticRegression())
+
+    with pytest.raises(NotImplementedError, match="partial_fit"):
+        model.fit_stream(_stream_chunks(), schema=DatasetSchema(id_col="id", target_col="target"))
+
+
+def test_sklearn_predict_sharded_matches_predict() -> None:
+    fold = _binary_fold()
+    model = SklearnModel(
+        name="forest",
+        task=Task.CLASSIFICATION,
+        estimator=RandomForestClassifier(n_estimators=5, random_state=0),
+    ).fit(fold)
+    df = pd.concat([fold.train, fold.val], ignore_index=True)
+
+    pd.testing.assert_frame_equal(model.predict_sharded(df, n_jobs=2, block_rows=3), model.predict(df))
+
+
+def test_sklearn_predict_sharded_pickles_non_numeric_blocks() -> None:
+    fold = _binary_fold()
+    train = fold.train.assign(group=["a", "b", "a", "b", "a", "b"])
+    val = fold.val.assign(group=["a", "b"])
+    estimator = make_pipeline(
+        make_column_transformer((OneHotEncoder(), ["group"]), remainder="passthrough"),
+        LinearRegression(),
+    )
+    model = SklearnModel(name="ridge", task=Task.REGRESSION, estimator=estimator).fit(
+        fold.model_copy(update={"train": train, "val": val}),
+    )
+
+    pd.testing.assert_frame_equal(model.predict_sharded(train, n_jobs=2, block_rows=4), model.predict(train))
+
+
+def test_sklearn_array_and_record_predictions_keep_column_names_for_pipelines() -> None:
+    fold = _binary_fold()
+    train = fold.train.assign(group=["a", "b", "a", "b", "a", "b"])
+    val = fold.val.assign(group=["a", "b"])
+    estimator = make_pipeline(
+        make_column_transformer((OneHotEncoder(), ["group"]), remainder="passthrough"),
+        LogisticRegression(random_state=0),
+    )
+    model = SklearnModel(name="pipeline", task=Task.CLASSIFICATION, estimator=estimator).fit(
+        fold.model_copy(update={"train": train, "val": val}),
+    )
+    expected = model.predict(val)["score_1"].to_numpy()
+
+    _, array_outputs = model.predict_arrays(val.to_numpy(), val["id"], columns=list(val.columns))
+    _, record_outputs = model.predict_records(val.to_dict(orient="records"))
+
+    assert np.allclose(array_outputs[:, 0], expected)
+    assert np.allclose(record_outputs[:, 0], expected)
+
+
+def test_sklearn_array_predictions_match_dataframe_predictions() -> None:
+    fold = _binary_fold()
+    model = SklearnModel(name="logreg", task=Task.CLASSIFICATION, estimator=LogisticRegression(random_state=0)).fit(
+        fold,
+    )
+
+    ids, outputs = model.predict_arrays(fold.val[["x1", "x2"]].to_numpy(), fold.val["id"])
+
+    assert ids.tolist() == [7, 8]
+    assert np.allclose(outputs[:, 0], model.predict(fold.val)["score_1"].to_numpy())
@@ -2,11 +2,16 @@ from __future__ import annotations
 
 from typing import Any
 
+import numpy as np
 import pandas as pd
 import pytest
+from sklearn.compose import make_column_transformer
 from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import OneHotEncoder
 
 from mltools.data.schema import DatasetSchema, FittedTransformerSet, FoldDesignMatrix
+from mltools.models.arch import SklearnModel
 from mltools.models.arch.base import BaseModelWrapper, Task
 from mltools.models.cv import CVTrainingResult, FoldTrainingResult, train_cv
 
@@ -239,3 +244,110 @@ def test_train_cv_does_not_catch_backend_training_errors() -> None:
 
     with pytest.raises(RuntimeError, match="backend failed"):
         train_cv(model_factory=FailingModel, folds=[_fold(0, [1], [2])])
+
+
+def test_fold_scores_evaluate_validation_predictions_per_fold() -> None:
+    result = CVTrainingResult(
+        id_col="id",
+        fold_results=[
+            FoldTrainingResult(
+                fold_id=0,
+                model=_model("fold_0"),
+                train_predictions=pd.DataFrame(),
+                val_predictions=pd.DataFrame({"id": [1, 2], "score_1": [0.2, 0.8]}),
+            ),
+            FoldTrainingResult(
+                fold_id=1,
+                model=_model("fold_1"),
+                train_predictions=pd.DataFrame(),
+                val_predictions=pd.DataFrame({"id": [4, 3], "score_1": [0.3, 0.6]}),
+            ),
+        ],
+    )
+    labels = pd.DataFrame({"id": [1, 2, 3, 4], "target": [0, 1, 0, 1]})
+
+    scores = result.fold_scores(labels=labels, target_col="target", metrics=["auc", "balanced_accuracy"])
+
+    assert scores.columns.tolist() == ["fold_id", "auc", "balanced_accuracy"]
+    assert scores["auc"].tolist() == [1.0, 0.0]
+    assert scores["balanced_accuracy"].tolist() == [1.0, 0.0]
+
+
+def test_fold_scores_rejects_missing_label_ids() -> None:
+    result = CVTrainingResult(
+        id_col="id",
+        fold_results=[
+            FoldTrainingResult(
+                fold_id=0,
+                model=_model("fold_0"),
+                train_predictions=pd.DataFrame(),
+                val_predictions=pd.DataFrame({"id": [1, 2], "score_1": [0.2, 0.8]}),
+            ),
+        ],
+    )
+
+    with pytest.raises(ValueError, match="missing fold 0 validation ids"):
+        result.fold_scores(labels=pd.DataFrame({"id": [1], "target": [0]}), target_col="target", metrics=["auc"])
+
+
+def test_predict_averaged_matches_averaged_fold_prediction_frames() -> None:
+    df = pd.DataFrame(
+        {
+            "id": list(range(8)),
+            "target": [0, 1, 0, 1, 0, 1, 0, 1],
+            "x0": [0.0, 1.0, 0.2, 1.2, 0.4, 1.4, 0.1, 0.9],
+            "x1": [1.0, 0.0, 0.8, 0.2, 0.6, 0.4, 0.7, 0.3],
+        },
+    )
+    schema = DatasetSchema(id_col="id", target_col="target")
+    folds = [
+        FoldDesignMatrix(fold_id=0, schema=schema, train=df.iloc[:6], val=df.iloc[6:], fitted=FittedTransformerSet()),
+        FoldDesignMatrix(fold_id=1, schema=schema, train=df.iloc[2:], val=df.iloc[:2], fitted=FittedTransformerSet()),
+    ]
+
+    def model_factory() -> SklearnModel:
+        return SklearnModel(name="logreg", task=Task.CLASSIFICATION, estimator=LogisticRegression())
+
+    result = train_cv(model_factory=model_factory, folds=folds)
+    holdout = df.iloc[::-1].drop(columns=["target"])
+
+    averaged = result.predict_averaged(holdout)
+
+    expected = (result.models()[0].predict(holdout)["score_1"] + result.models()[1].predict(holdout)["score_1"]) / 2
+    assert averaged.columns.tolist() == ["id", "score_1"]
+    assert averaged["id"].tolist() == holdout["id"].tolist()
+    assert np.allclose(averaged["score_1"].to_numpy(), expected.to_numpy())
+
+    with pytest.raises(ValueError, match="missing feature columns"):
+        result.predict_averaged(holdout.drop(columns=["x1"]))
+
+
+def test_predict_averaged_supports_name_based_column_transformers() -> None:
+    df = pd.DataFrame(
+        {
+            "id": list(range(8)),
+            "target": [0, 1, 0, 1, 0, 1, 0, 1],
+            "group": ["a", "b", "a", "b", "b", "a", "a", "b"],
+            "x0": [0.0, 1.0, 0.2, 1.2, 0.4, 1.4, 0.1, 0.9],
+        },
+    )
+    schema = DatasetSchema(id_col="id", target_col="target")
+    folds = [
+        FoldDesignMatrix(fold_id=0, schema=schema, train=df.iloc[:6], val=df.iloc[6:], fitted=FittedTransformerSet()),
+        FoldDesignMatrix(fold_id=1, schema=schema, train=df.iloc[2:], val=df.iloc[:2], fitted=FittedTransformerSet()),
+    ]
+
+    def model_factory() -> SklearnModel:
+        estimator = make_pipeline(
+            make_column_transformer((OneHotEncoder(), ["group"]), remainder="passthrough"),
+            LogisticRegression(),
+        )
+        return SklearnModel(name="pipeline", task=Task.CLASSIFICATION, estimator=estimator)
+
+    result = train_cv(model_factory=model_factory, folds=folds)
+    holdout = df.drop(columns=["target"])
+
+    averaged = result.predict_averaged(holdout)
+
+    expected = (result.models()[0].predict(holdout)["score_1"] + result.models()[1].predict(holdout)["score_1"]) / 2
+    assert np.allclose(averaged["score_1"].to_numpy(), expected.to_numpy())
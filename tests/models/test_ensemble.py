@@ -1,13 +1,18 @@
+import warnings
 from dataclasses import dataclass
 
 import numpy as np
 import pandas as pd
 import pytest
 
+from mltools.artifacts import ArtifactLayout
 from mltools.models.ensemble import (
     StackingEnsemble,
+    average_fold_prediction_artifacts,
     average_fold_predictions,
+    build_oof_stack_block,
     build_oof_stack_matrix,
+    build_serving_stack_block,
     build_serving_stack_matrix,
     stack_feature_names,
     validate_prediction_frame,
@@ -206,3 +211,240 @@ def test_stacking_ensemble_records_lineage():
     assert ensemble.base_model_names == ["lgbm", "rf"]
     assert ensemble.stack_feature_columns == ["lgbm", "rf"]
     assert ensemble.class_order_by_model == {"lgbm": [0, 1]}
+
+
+def test_build_oof_stack_matrix_reports_missing_and_extra_ids_together():
+    schema = DatasetSchema()
+    labels = pd.DataFrame({"id": [1, 2, 3], "target": [0, 1, 0]})
+    predictions = {"lgbm": pd.DataFrame({"id": [5, 2, 4, 3], "score_1": [0.5, 0.2, 0.4, 0.3]})}
+
+    with pytest.raises(ValueError, match=r"missing ids: \[1\]; extra ids: \[4, 5\]"):
+        build_oof_stack_matrix(schema=schema, labels=labels, predictions=predictions)
+
+
+def test_build_oof_stack_matrix_keeps_label_index():
+    schema = DatasetSchema()
+    labels = pd.DataFrame({"id": ["b", "a"], "target": [1, 0]}, index=[7, 3])
+    predictions = {"lgbm": pd.DataFrame({"id": ["a", "b"], "score_1": [0.1, 0.9]})}
+
+    stack_matrix = build_oof_stack_matrix(schema=schema, labels=labels, predictions=predictions)
+
+    assert stack_matrix.index.tolist() == [7, 3]
+    assert stack_matrix["lgbm"].tolist() == [0.9, 0.1]
+
+
+def test_build_oof_stack_block_returns_raw_arrays_in_label_order():
+    schema = DatasetSchema()
+    labels = pd.DataFrame({"id": [10, 20, 30], "target": [0, 1, 0]})
+    predictions = {
+        "lgbm": pd.DataFrame({"id": [30, 10, 20], "score_1": [0.3, 0.1, 0.2]}),
+        "rf": pd.DataFrame({"id": [20, 30, 10], "score_1": [0.8, 0.7, 0.9]}),
+    }
+
+    block = build_oof_stack_block(schema=schema, labels=labels, predictions=predictions, dtype=np.float32)
+
+    assert block.feature_names == ["lgbm", "rf"]
+    assert block.ids.tolist() == [10, 20, 30]
+    assert block.target is not None
+    assert block.target.tolist() == [0, 1, 0]
+    assert block.matrix.dtype == np.float32
+    assert block.matrix.flags.c_contiguous
+    np.testing.assert_allclose(block.matrix, [[0.1, 0.9], [0.2, 0.8], [0.3, 0.7]], rtol=1e-6)
+
+
+def test_build_serving_stack_block_matches_stack_matrix():
+    schema = DatasetSchema()
+    base_predictions = {
+        "lgbm": pd.DataFrame({"id": [2, 1], "score_1": [0.8, 0.7]}),
+        "ridge": pd.DataFrame({"id": [1, 2], "prediction": [12.0, 14.0]}),
+    }
+
+    block = build_serving_stack_block(schema=schema, base_predictions=base_predictions)
+    stack_matrix = build_serving_stack_matrix(schema=schema, base_predictions=base_predictions)
+
+    assert block.target is None
+    assert block.ids.tolist() == stack_matrix["id"].tolist()
+    assert block.feature_names == stack_matrix.columns[1:].tolist()
+    np.testing.assert_array_equal(block.matrix, stack_matrix[block.feature_names].to_numpy())
+
+
+def test_build_oof_stack_matrix_float32_has_no_fragmentation_warning():
+    schema = DatasetSchema()
+    labels = pd.DataFrame({"id": np.arange(5), "target": [0, 1, 0, 1, 0]})
+    predictions = {f"model_{i}": pd.DataFrame({"id": np.arange(5), "score_1": np.full(5, i / 200)}) for i in range(150)}
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", pd.errors.PerformanceWarning)
+        stack_matrix = build_oof_stack_matrix(schema=schema, labels=labels, predictions=predictions, dtype="float32")
+
+    assert stack_matrix.shape == (5, 152)
+    assert (stack_matrix.dtypes.iloc[2:] == np.float32).all()
+
+
+def test_build_oof_stack_matrix_rejects_non_float_dtype():
+    schema = DatasetSchema()
+    labels = pd.DataFrame({"id": [1], "target": [0]})
+    predictions = {"lgbm": pd.DataFrame({"id": [1], "score_1": [0.5]})}
+
+    with pytest.raises(ValueError, match="floating dtype"):
+        build_oof_stack_matrix(schema=schema, labels=labels, predictions=predictions, dtype=int)
+
+
+def _write_fold_predictions(layout, frames, *, row_group_size):
+    for fold_id, frame in enumerate(frames):
+        path = layout.prediction_path(model_name="lgbm", split="test", fold_id=fold_id, suffix=".parquet")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        frame.to_parquet(path, index=False, row_group_size=row_group_size)
+
+
+def test_average_fold_prediction_artifacts_matches_in_memory_average(tmp_path):
+    schema = DatasetSchema()
+    layout = ArtifactLayout(root=tmp_path)
+    rng = np.random.default_rng(0)
+    ids = np.arange(11)
+    folds = [pd.DataFrame({"id": ids, "score_0": rng.random(11), "score_1": rng.random(11)}) for _ in range(3)]
+    _write_fold_predictions(layout, folds, row_group_size=4)
+
+    output_path = average_fold_prediction_artifacts(
+        layout,
+        schema=schema,
+        model_name="lgbm",
+        split="test",
+        fold_ids=[0, 1, 2],
+        output_cols=["score_0", "score_1"],
+        output_path=tmp_path / "avg" / "test.parquet",
+        batch_rows=3,
+    )
+
+    expected = average_fold_predictions(
+        schema=schema,
+        prediction_frames=folds,
+        output_cols=["score_0", "score_1"],
+    )
+    pd.testing.assert_frame_equal(pd.read_parquet(output_path), expected)
+
+
+def test_average_fold_prediction_artifacts_rejects_different_row_order(tmp_path):
+    schema = DatasetSchema()
+    layout = ArtifactLayout(root=tmp_path)
+    folds = [
+        pd.DataFrame({"id": [1, 2, 3], "score_1": [0.1, 0.2, 0.3]}),
+        pd.DataFrame({"id": [1, 3, 2], "score_1": [0.1, 0.3, 0.2]}),
+    ]
+    _write_fold_predictions(layout, folds, row_group_size=2)
+
+    with pytest.raises(ValueError, match="fold 1 predictions ids do not match fold 0"):
+        average_fold_prediction_artifacts(
+            layout,
+            schema=schema,
+            model_name="lgbm",
+            split="test",
+            fold_ids=[0, 1],
+            output_cols=["score_1"],
+            output_path=tmp_path / "avg.parquet",
+        )
+
+
+def _average_artifacts(tmp_path, frames, *, row_group_size=2, **kwargs):
+    layout = ArtifactLayout(root=tmp_path)
+    _write_fold_predictions(layout, frames, row_group_size=row_group_size)
+    return average_fold_prediction_artifacts(
+        layout,
+        schema=DatasetSchema(),
+        model_name="lgbm",
+        split="test",
+        fold_ids=list(range(len(frames))),
+        output_cols=["score_1"],
+        output_path=tmp_path / "avg.parquet",
+        **kwargs,
+    )
+
+
+def test_average_fold_prediction_artifacts_merges_sorted_ids_across_chunkings(tmp_path):
+    rng = np.random.default_rng(0)
+    ids = np.array([2, 3, 5, 8, 13, 21, 34])
+    folds = [pd.DataFrame({"id": ids, "score_1": rng.random(7)}) for _ in range(2)]
+    layout = ArtifactLayout(root=tmp_path)
+    _write_fold_predictions(layout, folds[:1], row_group_size=2)
+    _write_fold_predictions(layout, folds, row_group_size=3)
+
+    output_path = average_fold_prediction_artifacts(
+        layout,
+        schema=DatasetSchema(),
+        model_name="lgbm",
+        split="test",
+        fold_ids=[0, 1],
+        output_cols=["score_1"],
+        output_path=tmp_path / "avg.parquet",
+        batch_rows=2,
+        alignment="sorted_id",
+    )
+
+    expected = average_fold_predictions(schema=DatasetSchema(), prediction_frames=folds, output_cols=["score_1"])
+    pd.testing.assert_frame_equal(pd.read_parquet(output_path), expected)
+
+
+@pytest.mark.parametrize(
+    ("second", "match"),
+    [
+        ({"id": [1, 2, 4, 5], "score_1": [0.1, 0.2, 0.4, 0.5]}, r"missing ids: \[3\]; extra ids: \[4\]"),
+        ({"id": [1, 2, 3, 5, 6], "score_1": [0.1, 0.2, 0.3, 0.5, 0.6]}, r"extra ids: \[6\]"),
+        ({"id": [1, 2, 5, 3], "score_1": [0.1, 0.2, 0.5, 0.3]}, "not sorted"),
+    ],
+)
+def test_average_fold_prediction_artifacts_sorted_id_reports_misaligned_ids(tmp_path, second, match):
+    first = pd.DataFrame({"id": [1, 2, 3, 5], "score_1": [0.1, 0.2, 0.3, 0.5]})
+
+    with pytest.raises(ValueError, match=match):
+        _average_artifacts(tmp_path, [first, pd.DataFrame(second)], batch_rows=2, alignment="sorted_id")
+    assert not (tmp_path / "avg.parquet").exists()
+
+
+@pytest.mark.parametrize("alignment", ["row_order", "sorted_id"])
+@pytest.mark.parametrize("duplicate_ids", [[1, 1, 2, 3], [1, 2, 3, 3], [1, 2, 2, 3]])
+def test_average_fold_prediction_artifacts_rejects_duplicate_ids(tmp_path, alignment, duplicate_ids):
+    fold = pd.DataFrame({"id": duplicate_ids, "score_1": [0.1, 0.2, 0.3, 0.4]})
+
+    with pytest.raises(ValueError, match="duplicate ids"):
+        _average_artifacts(tmp_path, [fold, fold.copy()], batch_rows=2, alignment=alignment)
+    assert not (tmp_path / "avg.parquet").exists()
+
+
+def test_average_fold_prediction_artifacts_requires_parquet_artifacts(tmp_path):
+    layout = ArtifactLayout(root=tmp_path)
+
+    with pytest.raises(FileNotFoundError, match="does not exist"):
+        average_fold_prediction_artifacts(
+            layout,
+            schema=DatasetSchema(),
+            model_name="lgbm",
+            split="test",
+            fold_ids=[0],
+            output_cols=["score_1"],
+            output_path=tmp_path / "avg.parquet",
+        )
+
+
+def test_validate_prediction_frame_scans_every_row_by_default():
+    preds = pd.DataFrame({"id": list(range(200)), "score_1": np.zeros(200)})
+    validate_prediction_frame(preds, id_col="id", output_cols=["score_1"])
+
+    preds.loc[100, "score_1"] = np.nan
+
+    with pytest.raises(ValueError, match="non-finite"):
+        validate_prediction_frame(preds, id_col="id", output_cols=["score_1"])
+
+
+def test_stack_builders_reject_frames_mutated_after_validation():
+    preds = pd.DataFrame({"id": list(range(200)), "score_1": np.zeros(200)})
+    labels = pd.DataFrame({"id": list(range(200)), "target": np.arange(200) % 2})
+    validate_prediction_frame(preds, id_col="id", output_cols=["score_1"])
+
+    preds.loc[100, "score_1"] = np.nan
+
+    with pytest.raises(ValueError, match="non-finite"):
+        build_oof_stack_matrix(
+            schema=DatasetSchema(id_col="id", target_col="target"),
+            labels=labels,
+            predictions={"model": preds},
+        )
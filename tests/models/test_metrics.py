@@ -0,0 +1,101 @@
+import lightgbm as lgb
+import numpy as np
+import pytest
+from sklearn import metrics as skm
+
+from mltools.models.metrics import (
+    EvalLabels,
+    LightGBMEval,
+    balanced_accuracy,
+    evaluate,
+    higher_is_better,
+    log_loss,
+    rmse,
+    roc_auc,
+)
+
+
+@pytest.fixture
+def binary_case():
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 2, size=200)
+    y_score = np.clip(np.round(rng.random(200), 1), 0.05, 0.95)
+    weights = rng.random(200) + 0.1
+    return y_true, y_score, weights
+
+
+@pytest.mark.parametrize("weighted", [False, True])
+def test_binary_metrics_match_sklearn(binary_case, weighted):
+    y_true, y_score, weights = binary_case
+    sample_weight = weights if weighted else None
+
+    assert roc_auc(y_true, y_score, sample_weight=sample_weight) == pytest.approx(
+        skm.roc_auc_score(y_true, y_score, sample_weight=sample_weight),
+    )
+    assert log_loss(y_true, y_score, sample_weight=sample_weight) == pytest.approx(
+        skm.log_loss(y_true, y_score, sample_weight=sample_weight),
+    )
+    assert balanced_accuracy(y_true, y_score, sample_weight=sample_weight) == pytest.approx(
+        skm.balanced_accuracy_score(y_true, (y_score >= 0.5).astype(int), sample_weight=sample_weight),
+    )
+
+
+def test_multiclass_metrics_match_sklearn():
+    rng = np.random.default_rng(1)
+    y_true = rng.integers(0, 3, size=100)
+    y_prob = rng.dirichlet(np.ones(3), size=100)
+    weights = rng.random(100)
+
+    assert log_loss(y_true, y_prob, sample_weight=weights) == pytest.approx(
+        skm.log_loss(y_true, y_prob, sample_weight=weights),
+    )
+    assert balanced_accuracy(y_true, y_prob, sample_weight=weights) == pytest.approx(
+        skm.balanced_accuracy_score(y_true, y_prob.argmax(axis=1), sample_weight=weights),
+    )
+
+
+def test_rmse_matches_weighted_definition():
+    y_true = np.array([1.0, 2.0, 4.0])
+    y_pred = np.array([1.5, 2.0, 3.0])
+    weights = np.array([2.0, 1.0, 1.0])
+
+    assert rmse(y_true, y_pred, sample_weight=weights) == pytest.approx(np.sqrt((2 * 0.25 + 1) / 4))
+
+
+def test_evaluate_reuses_labels_for_several_metrics(binary_case):
+    y_true, y_score, _ = binary_case
+    labels = EvalLabels(y_true)
+
+    scores = evaluate(labels, y_score, ["auc", "log_loss"])
+
+    assert list(scores) == ["auc", "log_loss"]
+    assert scores["auc"] == pytest.approx(roc_auc(y_true, y_score))
+    assert higher_is_better("auc")
+    assert not higher_is_better("log_loss")
+
+
+@pytest.mark.parametrize(
+    ("call", "match"),
+    [
+        (lambda: evaluate(EvalLabels([0, 1]), [0.1, 0.9], ["gini"]), "Unsupported metric"),
+        (lambda: roc_auc([1, 1], [0.1, 0.9]), "both positive and negative"),
+        (lambda: log_loss([0.5, 1], [0.1, 0.9]), "class positions"),
+        (lambda: EvalLabels([0, 1], [0.0, 0.0]), "positive value"),
+    ],
+)
+def test_metric_errors(call, match):
+    with pytest.raises(ValueError, match=match):
+        call()
+
+
+def test_lightgbm_eval_caches_labels_per_dataset(binary_case):
+    y_true, y_score, weights = binary_case
+    data = lgb.Dataset(np.zeros((len(y_true), 1)), label=y_true, weight=weights).construct()
+    feval = LightGBMEval(["auc", "balanced_accuracy"])
+
+    first = feval(y_score, data)
+    second = feval(y_score, data)
+
+    assert first == second
+    assert first[0] == ("auc", pytest.approx(roc_auc(y_true, y_score, sample_weight=weights)), True)
+    assert len(feval._labels) == 1
@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from mltools.data.schema import DatasetSchema
+from mltools.models.metrics import log_loss, rmse
+from mltools.models.selection import greedy_ensemble_selection
+
+SCHEMA = DatasetSchema(id_col="id", target_col="target")
+
+
+def _stack_matrix() -> pd.DataFrame:
+    rng = np.random.default_rng(3)
+    target = rng.integers(0, 2, size=200)
+    signal = np.clip(target * 0.6 + 0.2 + rng.normal(scale=0.2, size=200), 0.01, 0.99)
+    return pd.DataFrame(
+        {
+            "id": np.arange(200),
+            "target": target,
+            "good": signal,
+            "noisy": np.clip(signal + rng.normal(scale=0.3, size=200), 0.01, 0.99),
+            "random": rng.uniform(0.01, 0.99, size=200),
+        },
+    )
+
+
+def _naive_selection(stack_matrix, cols, n_iterations):
+    chosen = []
+    scores = []
+    for _ in range(n_iterations):
+        candidate_scores = [log_loss(stack_matrix["target"], stack_matrix[[*chosen, col]].mean(axis=1)) for col in cols]
+        chosen.append(cols[int(np.argmin(candidate_scores))])
+        scores.append(min(candidate_scores))
+    return scores
+
+
+def test_greedy_selection_matches_naive_full_rescoring():
+    stack_matrix = _stack_matrix()
+
+    selection = greedy_ensemble_selection(stack_matrix, schema=SCHEMA, metric="log_loss", n_iterations=8)
+
+    expected_scores = _naive_selection(stack_matrix, ["good", "noisy", "random"], 8)
+    np.testing.assert_allclose(selection.scores, expected_scores)
+    assert selection.best_score == min(expected_scores)
+    assert "random" not in selection.cols
+    assert sum(selection.weights) == pytest.approx(1.0)
+
+
+def test_selection_blender_reproduces_best_blend_score():
+    stack_matrix = _stack_matrix()
+    selection = greedy_ensemble_selection(stack_matrix, schema=SCHEMA, metric="auc", n_iterations=5)
+
+    blended = selection.to_blender(out_col="blend").transform(stack_matrix)
+
+    assert selection.cols[0] == "good"
+    score = greedy_ensemble_selection(
+        blended,
+        schema=SCHEMA,
+        metric="auc",
+        cols=["blend"],
+        n_iterations=1,
+    ).best_score
+    assert score == pytest.approx(selection.best_score)
+
+
+def test_selection_minimizes_regression_metric_with_weights():
+    rng = np.random.default_rng(0)
+    target = rng.normal(size=100)
+    stack_matrix = pd.DataFrame(
+        {
+            "id": np.arange(100),
+            "target": target,
+            "weight": rng.uniform(0.5, 1.5, size=100),
+            "high": target + 0.5,
+            "low": target - 0.5,
+        },
+    )
+    schema = DatasetSchema(id_col="id", target_col="target", weight_col="weight")
+
+    selection = greedy_ensemble_selection(stack_matrix, schema=schema, metric="rmse", n_iterations=4)
+
+    assert selection.cols == ["high", "low"]
+    assert selection.weights == [0.5, 0.5]
+    assert selection.best_score == pytest.approx(rmse(target, target, sample_weight=stack_matrix["weight"]))
+
+
+def test_selection_encodes_targets_with_class_order():
+    stack_matrix = _stack_matrix()
+    stack_matrix["target"] = np.where(stack_matrix["target"] == 1, "yes", "no")
+
+    selection = greedy_ensemble_selection(
+        stack_matrix,
+        schema=SCHEMA,
+        metric="log_loss",
+        n_iterations=2,
+        class_order=["no", "yes"],
+    )
+
+    assert selection.cols[0] == "good"
+    with pytest.raises(ValueError, match="class_order"):
+        greedy_ensemble_selection(stack_matrix, schema=SCHEMA, metric="log_loss", class_order=["no"])
@@ -0,0 +1,129 @@
+import asyncio
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LinearRegression, LogisticRegression
+
+from mltools.artifacts import ArtifactLayout
+from mltools.data.schema import DatasetSchema, FittedTransformerSet, FoldDesignMatrix
+from mltools.io import write_file
+from mltools.models.arch import SklearnModel, Task
+from mltools.models.serving import MicroBatchServer
+
+
+def _fold() -> FoldDesignMatrix:
+    df = pd.DataFrame(
+        {
+            "id": list(range(8)),
+            "target": [0, 0, 0, 0, 1, 1, 1, 1],
+            "x1": [0.0, 0.1, 0.2, 0.3, 1.0, 1.1, 1.2, 1.3],
+            "x2": [1.0, 0.9, 0.8, 0.7, 0.0, 0.1, 0.2, 0.3],
+        },
+    )
+    return FoldDesignMatrix(
+        fold_id=0,
+        schema=DatasetSchema(id_col="id", target_col="target"),
+        train=df,
+        val=df,
+        fitted=FittedTransformerSet(),
+    )
+
+
+def _classifier(c: float) -> SklearnModel:
+    return SklearnModel(name="logreg", task=Task.CLASSIFICATION, estimator=LogisticRegression(C=c)).fit(_fold())
+
+
+def _records() -> list[dict[str, float]]:
+    return _fold().val.drop(columns=["target"]).to_dict(orient="records")
+
+
+def test_score_batch_averages_fold_models_with_stack_feature_names():
+    folds = [_classifier(1.0), _classifier(0.1)]
+    server = MicroBatchServer({"logreg": folds})
+
+    results = server.score_batch(_records())
+
+    expected = np.mean([model.predict(_fold().val)["score_1"] for model in folds], axis=0)
+    assert list(results[0]) == ["id", "logreg"]
+    assert [result["id"] for result in results] == list(range(8))
+    assert np.allclose([result["logreg"] for result in results], expected)
+
+
+def test_micro_batches_concurrent_requests():
+    async def run() -> tuple[list[dict[str, float]], MicroBatchServer]:
+        async with MicroBatchServer({"logreg": [_classifier(1.0)]}, max_wait_seconds=0.05) as server:
+            results = await asyncio.gather(*(server.predict(record) for record in _records()))
+        return results, server
+
+    results, server = asyncio.run(run())
+    stats = server.stats()
+
+    assert [result["id"] for result in results] == list(range(8))
+    assert stats.requests == 8
+    assert stats.batches == 1
+    assert stats.mean_batch_size == 8
+    assert stats.mean_latency_seconds > 0
+
+
+def test_stop_scores_batch_still_collecting():
+    async def run() -> tuple[dict[str, float], MicroBatchServer]:
+        server = MicroBatchServer({"logreg": [_classifier(1.0)]}, max_wait_seconds=1.0)
+        await server.start()
+        request = asyncio.ensure_future(server.predict(_records()[0]))
+        await asyncio.sleep(0.05)
+        await server.stop()
+        return await asyncio.wait_for(request, 0.5), server
+
+    result, server = asyncio.run(run())
+
+    assert result["id"] == 0
+    assert server.stats().requests == 1
+
+
+def test_predict_requires_started_server():
+    server = MicroBatchServer({"logreg": [_classifier(1.0)]})
+
+    with pytest.raises(RuntimeError, match="not running"):
+        asyncio.run(server.predict(_records()[0]))
+
+
+def test_from_layout_serves_stack_model_over_loopback(tmp_path):
+    layout = ArtifactLayout(root=tmp_path)
+    base = _classifier(1.0)
+    write_file(base, layout.model_path(model_name="logreg"))
+    stack_fold = FoldDesignMatrix(
+        fold_id=0,
+        schema=DatasetSchema(id_col="id", target_col="target"),
+        train=base.predict(_fold().val).rename(columns={"score_1": "logreg"}).assign(target=_fold().val["target"]),
+        val=base.predict(_fold().val).rename(columns={"score_1": "logreg"}).assign(target=_fold().val["target"]),
+        fitted=FittedTransformerSet(),
+    )
+    meta = SklearnModel(name="meta", task=Task.REGRESSION, estimator=LinearRegression()).fit(stack_fold)
+    write_file(meta, layout.stack_model_path(ensemble_name="stack"))
+
+    async def run() -> list[dict[str, float]]:
+        server = MicroBatchServer.from_layout(layout, model_names=["logreg"], ensemble_name="stack")
+        tcp_server = await server.serve()
+        host, port = tcp_server.sockets[0].getsockname()[:2]
+        reader, writer = await asyncio.open_connection(host, port)
+        for record in [*_records()[:2], {"id": 99}]:
+            writer.write(json.dumps(record).encode() + b"\n")
+        await writer.drain()
+        responses = [json.loads(await reader.readline()) for _ in range(3)]
+        writer.close()
+        tcp_server.close()
+        await tcp_server.wait_closed()
+        await server.stop()
+        return responses
+
+    responses = asyncio.run(run())
+
+    errors = [response for response in responses if "error" in response]
+    scored = sorted((response for response in responses if "error" not in response), key=lambda r: r["id"])
+    expected = meta.predict(stack_fold.val)["prediction"].tolist()[:2]
+    assert len(errors) == 1
+    assert "missing column" in errors[0]["error"]
+    assert [response["id"] for response in scored] == [0, 1]
+    assert np.allclose([response["prediction"] for response in scored], expected)
@@ -0,0 +1,135 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LogisticRegression
+from sklearn.tree import DecisionTreeClassifier
+
+from mltools.artifacts import ArtifactLayout
+from mltools.data.schema import DatasetSchema, FittedTransformerSet, FoldDesignMatrix
+from mltools.models.arch import SklearnModel, Task
+from mltools.models.ensemble import build_serving_stack_matrix
+from mltools.models.serving import MicroBatchServer
+from mltools.models.stacking import StackingModel
+
+
+def _data() -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    x1 = rng.normal(size=40)
+    x2 = rng.normal(size=40)
+    return pd.DataFrame({"id": np.arange(40), "target": (x1 + 0.5 * x2 > 0).astype(int), "x1": x1, "x2": x2})
+
+
+def _folds(df: pd.DataFrame) -> list[FoldDesignMatrix]:
+    schema = DatasetSchema(id_col="id", target_col="target")
+    fold_of_row = np.arange(len(df)) % 2
+    return [
+        FoldDesignMatrix(
+            fold_id=fold_id,
+            schema=schema,
+            train=df[fold_of_row != fold_id].reset_index(drop=True),
+            val=df[fold_of_row == fold_id].reset_index(drop=True),
+            fitted=FittedTransformerSet(),
+        )
+        for fold_id in (0, 1)
+    ]
+
+
+def _stacking_model() -> StackingModel:
+    return StackingModel(
+        "stack",
+        base_models={
+            "logreg": lambda: SklearnModel(name="logreg", task=Task.CLASSIFICATION, estimator=LogisticRegression()),
+            "tree": lambda: SklearnModel(
+                name="tree",
+                task=Task.CLASSIFICATION,
+                estimator=DecisionTreeClassifier(max_depth=2, random_state=0),
+            ),
+        },
+        meta_model=lambda: SklearnModel(name="meta", task=Task.CLASSIFICATION, estimator=LogisticRegression()),
+    )
+
+
+def test_fit_trains_meta_model_on_oof_stack_features():
+    df = _data()
+    model = _stacking_model().fit(_folds(df))
+
+    assert model.ensemble_ is not None
+    assert model.ensemble_.base_model_names == ["logreg", "tree"]
+    assert model.ensemble_.stack_feature_columns == ["logreg", "tree"]
+    assert model.ensemble_.class_order_by_model == {"logreg": [0, 1], "tree": [0, 1]}
+    assert [meta.feature_names_ for meta in model.meta_models_] == [["logreg", "tree"], ["logreg", "tree"]]
+
+
+def test_predict_matches_manual_stacking_pipeline():
+    df = _data()
+    model = _stacking_model().fit(_folds(df))
+    features = df.drop(columns=["target"])
+
+    averaged = {
+        name: pd.DataFrame(
+            {"id": features["id"], "score_1": np.mean([m.predict(features)["score_1"] for m in fold_models], axis=0)},
+        )
+        for name, fold_models in model.base_models_.items()
+    }
+    stack_matrix = build_serving_stack_matrix(schema=model.schema_, base_predictions=averaged)
+    expected = np.mean([meta.predict(stack_matrix)["score_1"] for meta in model.meta_models_], axis=0)
+
+    block = model.predict_stack_block(features)
+    predictions = model.predict(features)
+
+    np.testing.assert_allclose(block.matrix, stack_matrix[["logreg", "tree"]].to_numpy())
+    assert predictions.columns.tolist() == ["id", "score_1"]
+    assert predictions["id"].tolist() == features["id"].tolist()
+    np.testing.assert_allclose(predictions["score_1"], expected)
+
+
+def test_predict_with_process_pool_matches_threads():
+    df = _data()
+    model = _stacking_model().fit(_folds(df))
+    features = df.drop(columns=["target"])
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        predictions = model.predict(features, executor=executor)
+
+    pd.testing.assert_frame_equal(predictions, model.predict(features))
+
+
+def test_save_and_load_round_trip_through_artifact_layout(tmp_path):
+    df = _data()
+    layout = ArtifactLayout(root=tmp_path)
+    model = _stacking_model().fit(_folds(df))
+    features = df.drop(columns=["target"])
+
+    path = model.save(layout)
+    restored = StackingModel.load(layout, ensemble_name="stack")
+
+    assert path == layout.stack_model_path(ensemble_name="stack")
+    assert layout.model_path(model_name="tree", fold_id=1).exists()
+    pd.testing.assert_frame_equal(restored.predict(features), model.predict(features))
+    with pytest.raises(RuntimeError, match="cannot be refit"):
+        restored.fit(_folds(df))
+
+
+def test_saved_model_serves_through_micro_batch_server(tmp_path):
+    df = _data()
+    layout = ArtifactLayout(root=tmp_path)
+    model = _stacking_model().fit(_folds(df))
+    model.save(layout)
+    features = df.drop(columns=["target"])
+
+    server = MicroBatchServer.from_layout(
+        layout,
+        model_names=["logreg", "tree"],
+        fold_ids=[0, 1],
+        ensemble_name="stack",
+    )
+    results = server.score_batch(features.to_dict(orient="records"))
+
+    np.testing.assert_allclose([result["score_1"] for result in results], model.predict(features)["score_1"])
+
+
+def test_predict_requires_fit():
+    with pytest.raises(RuntimeError, match="must be fit"):
+        _stacking_model().predict(_data())
@@ -38,6 +38,17 @@ def test_artifact_layout_fold_id_defaults_to_zero(tmp_path):
     )
 
 
+def test_artifact_layout_prediction_path_supports_parquet_suffix(tmp_path):
+    layout = ArtifactLayout(root=tmp_path)
+
+    assert (
+        layout.prediction_path(model_name="lgbm", split="test", fold_id=1, suffix=".parquet")
+        == tmp_path / "models" / "lgbm" / "fold_1" / "preds" / "test.parquet"
+    )
+    with pytest.raises(ValueError, match="Unsupported prediction artifact suffix"):
+        layout.prediction_path(model_name="lgbm", split="test", suffix=".csv")
+
+
 def test_artifact_layout_methods_do_not_create_files(tmp_path):
     layout = ArtifactLayout(root=tmp_path / "artifacts")
 
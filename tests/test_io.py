@@ -1,9 +1,26 @@
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 import pytest
 
-from mltools.io import read_dataframe, read_file, write_dataframe, write_file
+import mltools.io
+from mltools.io import (
+    clear_read_cache,
+    disable_read_cache,
+    enable_read_cache,
+    iter_dataframe,
+    read_cache_stats,
+    read_dataframe,
+    read_file,
+    read_many,
+    write_dataframe,
+    write_file,
+    write_many,
+)
 
 
 def test_pickle_file_round_trip(tmp_path):
@@ -17,6 +34,66 @@ def test_pickle_file_round_trip(tmp_path):
     assert loaded == artifact
 
 
+@pytest.mark.parametrize("compression", [None, "zstd", "lz4"])
+def test_pickle5_round_trip_stores_buffers_out_of_band(tmp_path, compression):
+    arrays = {"weights": np.arange(100_000, dtype=np.float64), "codes": np.arange(10, dtype=np.int8)}
+    artifact = {"name": "encoder", "arrays": arrays, "frame": pd.DataFrame({"x": np.arange(5.0)})}
+    path = tmp_path / "encoder.pkl"
+
+    write_file(artifact, path, format="pickle5", compression=compression)
+    loaded = read_file(path)
+
+    assert path.read_bytes().startswith(b"MLTPKL5")
+    assert loaded["name"] == "encoder"
+    pd.testing.assert_frame_equal(loaded["frame"], artifact["frame"])
+    for name, array in arrays.items():
+        np.testing.assert_array_equal(loaded["arrays"][name], array)
+        assert loaded["arrays"][name].flags.writeable
+    if compression is None:
+        assert path.stat().st_size < 2 * arrays["weights"].nbytes
+    else:
+        assert path.stat().st_size < arrays["weights"].nbytes
+
+
+@pytest.mark.parametrize("compression", ["zstd", "lz4"])
+def test_pickle5_compression_streams_blobs_in_chunks(tmp_path, monkeypatch, compression):
+    monkeypatch.setattr(mltools.io, "_PICKLE5_CHUNK_SIZE", 1_000)
+    array = np.random.default_rng(0).integers(0, 10, size=10_000)
+    path = write_file({"array": array, "empty": np.empty(0)}, tmp_path / "stack.pkl5", compression=compression)
+
+    loaded = read_file(path)
+
+    np.testing.assert_array_equal(loaded["array"], array)
+    assert loaded["empty"].size == 0
+    assert path.stat().st_size < array.nbytes
+
+
+@pytest.mark.parametrize(("mmap_mode", "writeable"), [("r", False), ("c", True)])
+def test_pickle5_memory_mapped_read(tmp_path, mmap_mode, writeable):
+    array = np.arange(1_000, dtype=np.float32)
+    path = write_file({"array": array}, tmp_path / "stack.pkl5")
+
+    loaded = read_file(path, mmap_mode=mmap_mode)["array"]
+
+    np.testing.assert_array_equal(loaded, array)
+    assert loaded.flags.writeable == writeable
+    assert loaded.ctypes.data % loaded.dtype.alignment == 0
+
+
+def test_pickle5_rejects_mapping_compressed_artifacts(tmp_path):
+    path = write_file(np.arange(3), tmp_path / "array.pkl5", compression="zstd")
+
+    with pytest.raises(ValueError, match="Cannot memory-map compressed"):
+        read_file(path, mmap_mode="r")
+
+
+def test_compression_is_only_supported_for_pickle5(tmp_path):
+    with pytest.raises(ValueError, match="compression is only supported"):
+        write_file({"a": 1}, tmp_path / "artifact.pkl", compression="zstd")
+    with pytest.raises(ValueError, match="Unsupported pickle5 compression"):
+        write_file({"a": 1}, tmp_path / "artifact.pkl5", compression="bz2")
+
+
 def test_json_file_round_trip_is_deterministic(tmp_path):
     artifact = {"z": 2, "a": {"b": 1}}
     path = tmp_path / "metrics.json"
@@ -66,6 +143,187 @@ def test_csv_dataframe_round_trip(tmp_path):
     pd.testing.assert_frame_equal(loaded, df)
 
 
+@pytest.mark.parametrize("suffix", [".parquet", ".arrow"])
+def test_read_dataframe_columns_and_filters(tmp_path, suffix):
+    df = pd.DataFrame({"id": range(10), "score": [x / 10 for x in range(10)], "label": list("abcdeabcde")})
+    path = write_dataframe(df, tmp_path / f"frame{suffix}")
+
+    loaded = read_dataframe(path, columns=["id", "score"], filters=[("score", ">=", 0.7)])
+    expression = read_dataframe(path, columns=["id"], filters=ds.field("label") == "a")
+
+    expected = df.loc[df["score"] >= 0.7, ["id", "score"]].reset_index(drop=True)
+    pd.testing.assert_frame_equal(loaded, expected)
+    assert expression["id"].tolist() == [0, 5]
+
+
+def test_read_dataframe_csv_columns_and_rejects_filters(tmp_path):
+    df = pd.DataFrame({"id": [1, 2], "score": [0.1, 0.9]})
+    path = write_dataframe(df, tmp_path / "frame.csv")
+
+    pd.testing.assert_frame_equal(read_dataframe(path, columns=["score"]), df[["score"]])
+    with pytest.raises(ValueError, match="filters are not supported"):
+        read_dataframe(path, filters=[("id", "=", 1)])
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".parquet", ".arrow"])
+def test_read_dataframe_columns_follow_requested_order(tmp_path, suffix):
+    df = pd.DataFrame({"a": [1, 2], "b": [3, 4], "c": [5, 6]})
+    path = write_dataframe(df, tmp_path / f"frame{suffix}")
+
+    projected = read_dataframe(path, columns=["c", "a"])
+    batches = list(iter_dataframe(path, batch_rows=1, columns=["c", "a"]))
+
+    pd.testing.assert_frame_equal(projected, df[["c", "a"]])
+    pd.testing.assert_frame_equal(pd.concat(batches, ignore_index=True), df[["c", "a"]])
+
+
+@pytest.fixture
+def partitioned_dataset(tmp_path):
+    df = pd.DataFrame({"id": range(12), "score": [x / 12 for x in range(12)], "fold": [0, 1, 2] * 4})
+    for fold, part in df.groupby("fold"):
+        write_dataframe(part.drop(columns="fold"), tmp_path / "preds" / f"fold={fold}" / "part-0.parquet")
+    (tmp_path / "preds" / "_SUCCESS").write_text("")
+    return tmp_path / "preds", df
+
+
+def test_read_dataframe_directory_dataset_with_partition_filter(partitioned_dataset):
+    path, df = partitioned_dataset
+
+    loaded = read_dataframe(path, filters=[("fold", "=", 1)])
+
+    assert sorted(loaded["id"].tolist()) == df.loc[df["fold"] == 1, "id"].tolist()
+    assert set(loaded["fold"]) == {1}
+
+
+def test_read_dataframe_glob_dataset(partitioned_dataset):
+    path, df = partitioned_dataset
+
+    loaded = read_dataframe(path / "fold=*" / "*.parquet", columns=["id"])
+
+    assert sorted(loaded["id"].tolist()) == df["id"].tolist()
+
+
+@pytest.mark.parametrize("name", ["preds[v1].parquet", "preds?.parquet", "preds*.csv"])
+def test_existing_files_with_glob_characters_are_read_as_files(tmp_path, name):
+    df = pd.DataFrame({"id": [1, 2], "score": [0.1, 0.9]})
+    path = write_dataframe(df, tmp_path / name)
+    (tmp_path / "predsX.parquet").write_text("not a dataframe")
+
+    pd.testing.assert_frame_equal(read_dataframe(path), df)
+    pd.testing.assert_frame_equal(pd.concat(iter_dataframe(path, batch_rows=1), ignore_index=True), df)
+
+
+def test_read_dataframe_rejects_reader_kwargs_for_datasets(partitioned_dataset):
+    path, _ = partitioned_dataset
+
+    with pytest.raises(TypeError, match="engine"):
+        read_dataframe(path, engine="pyarrow")
+    with pytest.raises(TypeError, match="memory_map"):
+        read_dataframe(path / "fold=*" / "*.parquet", memory_map=False)
+
+
+def test_read_dataframe_glob_without_matches(tmp_path):
+    with pytest.raises(FileNotFoundError, match="No dataframe artifact files"):
+        read_dataframe(tmp_path / "*.parquet")
+
+
+def test_iter_dataframe_yields_fixed_size_batches(tmp_path):
+    df = pd.DataFrame({"id": range(25), "score": [x / 25 for x in range(25)]})
+    path = tmp_path / "frame.parquet"
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), path, row_group_size=7)
+
+    batches = list(iter_dataframe(path, batch_rows=10, columns=["id"]))
+
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+    assert all(batch.index.equals(pd.RangeIndex(len(batch))) for batch in batches)
+    assert pd.concat(batches, ignore_index=True)["id"].tolist() == list(range(25))
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".arrow"])
+def test_iter_dataframe_single_files(tmp_path, suffix):
+    df = pd.DataFrame({"id": range(5), "score": [0.1, 0.2, 0.3, 0.4, 0.5]})
+    path = write_dataframe(df, tmp_path / f"frame{suffix}")
+
+    batches = list(iter_dataframe(path, batch_rows=2))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    pd.testing.assert_frame_equal(pd.concat(batches, ignore_index=True), df)
+
+
+def test_iter_dataframe_filters_directory_dataset(partitioned_dataset):
+    path, df = partitioned_dataset
+
+    batches = list(iter_dataframe(path, batch_rows=3, columns=["id"], filters=[("fold", "in", [0, 2])]))
+
+    assert [len(batch) for batch in batches] == [3, 3, 2]
+    assert sorted(pd.concat(batches)["id"].tolist()) == df.loc[df["fold"] != 1, "id"].tolist()
+
+
+@pytest.mark.parametrize("suffix", [".arrow", ".feather"])
+def test_arrow_dataframe_round_trip_is_memory_mapped(tmp_path, suffix):
+    df = pd.DataFrame({"id": [1, 2], "score": [0.1, 0.9], "label": ["a", "b"]}, index=[5, 7])
+    path = tmp_path / "matrices" / f"train{suffix}"
+
+    written_path = write_dataframe(df, path, index=True)
+    loaded = read_dataframe(path)
+
+    assert written_path == path.resolve()
+    pd.testing.assert_frame_equal(loaded, df)
+    pd.testing.assert_frame_equal(
+        read_dataframe(path, columns=["score"], memory_map=False),
+        df[["score"]].reset_index(drop=True),
+    )
+
+
+def test_npy_round_trip_with_mmap(tmp_path):
+    array = np.arange(12, dtype=np.float32).reshape(3, 4)
+    path = tmp_path / "preds.npy"
+
+    write_file(array, path)
+    mapped = read_file(path, mmap_mode="r")
+
+    assert isinstance(mapped, np.memmap)
+    np.testing.assert_array_equal(read_file(path), array)
+    np.testing.assert_array_equal(mapped, array)
+
+
+@pytest.mark.parametrize("mmap_mode", [None, "r"])
+def test_npz_round_trip(tmp_path, mmap_mode):
+    arrays = {"oof": np.linspace(0.0, 1.0, 7), "fold": np.asfortranarray(np.arange(6, dtype=np.int16).reshape(2, 3))}
+    path = tmp_path / "stack.npz"
+
+    write_file(arrays, path)
+    loaded = read_file(path, mmap_mode=mmap_mode)
+
+    assert list(loaded) == ["oof", "fold"]
+    for name, array in arrays.items():
+        assert isinstance(loaded[name], np.memmap) == (mmap_mode is not None)
+        np.testing.assert_array_equal(loaded[name], array)
+
+
+@pytest.mark.parametrize("suffix", [".npy", ".npz", ".pkl5"])
+@pytest.mark.parametrize("mmap_mode", ["w+", "r+"])
+def test_writable_mmap_modes_are_rejected_without_touching_the_file(tmp_path, suffix, mmap_mode):
+    path = tmp_path / f"artifact{suffix}"
+    array = np.arange(10, dtype=np.float64)
+    write_file(array if suffix == ".npy" else {"a": array}, path)
+    content = path.read_bytes()
+
+    with pytest.raises(ValueError, match="mmap_mode"):
+        read_file(path, mmap_mode=mmap_mode)
+
+    assert path.read_bytes() == content
+    loaded = read_file(path)
+    np.testing.assert_array_equal(loaded if suffix == ".npy" else loaded["a"], array)
+
+
+def test_mmap_mode_rejected_for_non_numpy_formats(tmp_path):
+    write_file({"a": 1}, tmp_path / "artifact.pkl")
+
+    with pytest.raises(ValueError, match="mmap_mode"):
+        read_file(tmp_path / "artifact.pkl", mmap_mode="r")
+
+
 def test_dataframe_kwargs_are_passed_to_pandas(tmp_path):
     df = pd.DataFrame({"id": [1, 2], "score": [0.1, 0.9]})
     path = tmp_path / "indexed.csv"
@@ -103,3 +361,125 @@ def test_missing_dataframe_read_includes_path(tmp_path):
 
     with pytest.raises(FileNotFoundError, match=str(path)):
         read_dataframe(path)
+
+
+def test_write_many_and_read_many_round_trip(tmp_path):
+    df = pd.DataFrame({"id": [1, 2], "score": [0.1, 0.9]})
+    objects = {
+        tmp_path / "models" / "fold_0" / "mdl.pkl": {"weights": [1.0, 2.0]},
+        tmp_path / "models" / "fold_0" / "preds" / "val.parquet": df,
+        str(tmp_path / "metrics.json"): {"auc": 0.75},
+        tmp_path / "notes.txt": "hello",
+    }
+
+    written = write_many(objects, max_workers=2)
+    loaded = read_many(objects, max_workers=2)
+
+    assert written.results == {path: Path(path).resolve() for path in objects}
+    assert [timing.path for timing in written.timings] == [Path(path).resolve() for path in objects]
+    assert all(timing.seconds >= 0 for timing in loaded.timings)
+    assert list(loaded.results) == list(objects)
+    for path, obj in objects.items():
+        if isinstance(obj, pd.DataFrame):
+            pd.testing.assert_frame_equal(loaded.results[path], obj)
+        else:
+            assert loaded.results[path] == obj
+
+
+def test_write_many_rejects_duplicate_paths(tmp_path):
+    with pytest.raises(ValueError, match="same path"):
+        write_many({tmp_path / "a.pkl": 1, str(tmp_path / "a.pkl"): 2})
+
+
+def test_read_many_raises_for_missing_files(tmp_path):
+    write_file(1, tmp_path / "a.pkl")
+
+    with pytest.raises(FileNotFoundError, match=r"missing\.pkl"):
+        read_many([tmp_path / "a.pkl", tmp_path / "missing.pkl"])
+
+
+@pytest.fixture
+def read_cache():
+    enable_read_cache(max_bytes=10_000)
+    clear_read_cache()
+    yield
+    disable_read_cache()
+
+
+def test_read_cache_hits_until_file_is_written(tmp_path, read_cache):
+    path = tmp_path / "artifact.json"
+    write_file({"a": 1}, path)
+
+    first = read_file(path)
+    second = read_file(path)
+    write_file({"a": 2}, path)
+    third = read_file(path)
+
+    assert first is second
+    assert third == {"a": 2}
+    stats = read_cache_stats()
+    assert (stats.hits, stats.misses, stats.invalidations, stats.entries) == (1, 2, 1, 1)
+
+
+def test_read_cache_detects_external_changes(tmp_path, read_cache):
+    path = tmp_path / "notes.txt"
+    path.write_text("one")
+    assert read_file(path) == "one"
+
+    path.write_text("three")
+
+    assert read_file(path) == "three"
+    assert read_cache_stats().hits == 0
+
+
+def test_read_cache_returns_independent_dataframes(tmp_path, read_cache):
+    path = write_dataframe(pd.DataFrame({"id": [1, 2], "score": [0.1, 0.9]}), tmp_path / "frame.parquet")
+
+    first = read_dataframe(path)
+    first.loc[0, "score"] = 5.0
+    second = read_dataframe(path)
+    projected = read_dataframe(path, columns=["id"])
+
+    assert second["score"].tolist() == [0.1, 0.9]
+    assert projected.columns.tolist() == ["id"]
+    assert read_cache_stats().hits == 1
+
+
+def test_read_cache_returns_read_only_arrays(tmp_path, read_cache):
+    array_path = write_file(np.arange(3.0), tmp_path / "array.npy")
+    archive_path = write_file({"a": np.arange(3.0)}, tmp_path / "arrays.npz")
+
+    array = read_file(array_path)
+    archive = read_file(archive_path)
+    with pytest.raises(ValueError, match="read-only"):
+        array[0] = 99
+    with pytest.raises(ValueError, match="read-only"):
+        archive["a"][0] = 99
+    archive["a"] = np.zeros(3)
+
+    np.testing.assert_array_equal(read_file(array_path), np.arange(3.0))
+    np.testing.assert_array_equal(read_file(archive_path)["a"], np.arange(3.0))
+    assert read_cache_stats().hits == 2
+
+
+def test_read_cache_evicts_least_recently_used(tmp_path, read_cache):
+    paths = [tmp_path / f"array_{i}.npy" for i in range(3)]
+    for path in paths:
+        write_file(np.zeros(500), path)
+
+    read_file(paths[0])
+    read_file(paths[1])
+    read_file(paths[0])
+    read_file(paths[2])
+
+    stats = read_cache_stats()
+    assert (stats.entries, stats.evictions, stats.current_bytes) == (2, 1, 8_000)
+    read_file(paths[0])
+    assert read_cache_stats().hits == 2
+
+
+def test_read_cache_is_disabled_by_default(tmp_path):
+    path = write_file({"a": 1}, tmp_path / "artifact.json")
+
+    assert read_file(path) is not read_file(path)
+    assert read_cache_stats().entries == 0
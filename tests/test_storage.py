@@ -0,0 +1,260 @@
+import io
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from mltools.io import iter_dataframe, read_dataframe, read_file, read_many, write_dataframe, write_file, write_many
+from mltools.storage import (
+    LocalDirectoryStore,
+    RemoteFileSystem,
+    S3ObjectStore,
+    register_filesystem,
+    resolve_uri,
+    unregister_filesystem,
+)
+
+
+class RecordingStore(LocalDirectoryStore):
+    """Local store that records every request."""
+
+    def __init__(self, root):
+        super().__init__(root)
+        self.calls = []
+
+    def head(self, key):
+        self.calls.append(("head", key))
+        return super().head(key)
+
+    def get_range(self, key, start, end):
+        self.calls.append(("get_range", key, start, end))
+        return super().get_range(key, start, end)
+
+    def put(self, key, data):
+        self.calls.append(("put", key))
+        return super().put(key, data)
+
+    def upload_part(self, key, upload_id, part_number, data):
+        self.calls.append(("upload_part", key, part_number))
+        return super().upload_part(key, upload_id, part_number, data)
+
+    def calls_of(self, name):
+        return [call for call in self.calls if call[0] == name]
+
+
+class FakeS3Client:
+    """Minimal S3 client over a local store, with quoted ETags like S3."""
+
+    class NotFoundError(Exception):
+        """Error with the response shape of botocore client errors."""
+
+        def __init__(self):
+            super().__init__("Not Found")
+            self.response = {"Error": {"Code": "404"}}
+
+    def __init__(self, store):
+        self.store = store
+
+    def head_object(self, Bucket, Key):  # noqa: N803
+        try:
+            info = self.store.head(f"{Bucket}/{Key}")
+        except FileNotFoundError:
+            raise self.NotFoundError from None
+        return {"ContentLength": info.size, "ETag": f'"{info.etag}"'}
+
+    def get_object(self, Bucket, Key, Range):  # noqa: N803
+        start, end = Range.removeprefix("bytes=").split("-")
+        return {"Body": io.BytesIO(self.store.get_range(f"{Bucket}/{Key}", int(start), int(end) + 1))}
+
+    def put_object(self, Bucket, Key, Body):  # noqa: N803
+        return {"ETag": f'"{self.store.put(f"{Bucket}/{Key}", Body)}"'}
+
+    def create_multipart_upload(self, Bucket, Key):  # noqa: N803
+        return {"UploadId": self.store.create_multipart_upload(f"{Bucket}/{Key}")}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):  # noqa: N803
+        return {"ETag": f'"{self.store.upload_part(f"{Bucket}/{Key}", UploadId, PartNumber, Body)}"'}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):  # noqa: N803
+        parts = [(part["PartNumber"], part["ETag"]) for part in MultipartUpload["Parts"]]
+        return {"ETag": f'"{self.store.complete_multipart_upload(f"{Bucket}/{Key}", UploadId, parts)}"'}
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):  # noqa: N803
+        self.store.abort_multipart_upload(f"{Bucket}/{Key}", UploadId)
+
+    def list_objects_v2(self, Bucket, Prefix, ContinuationToken=None):  # noqa: N803
+        objects = self.store.list_objects(f"{Bucket}/{Prefix}")
+        start = int(ContinuationToken or 0)
+        page = objects[start : start + 1]
+        response = {
+            "Contents": [
+                {"Key": info.key.removeprefix(f"{Bucket}/"), "Size": info.size, "ETag": f'"{info.etag}"'}
+                for info in page
+            ],
+            "IsTruncated": start + 1 < len(objects),
+        }
+        if response["IsTruncated"]:
+            response["NextContinuationToken"] = str(start + 1)
+        return response
+
+
+@pytest.fixture
+def store(tmp_path):
+    return RecordingStore(tmp_path / "bucket")
+
+
+@pytest.fixture
+def remote(tmp_path, store):
+    filesystem = register_filesystem(
+        "mem://artifacts",
+        RemoteFileSystem(store, cache_dir=tmp_path / "cache", part_size=1_024, max_workers=4),
+    )
+    yield filesystem
+    unregister_filesystem("mem://artifacts")
+
+
+def test_remote_object_round_trip_uses_etag_cache(remote, store):
+    artifact = {"weights": list(range(10))}
+
+    written_path = write_file(artifact, "mem://artifacts/models/model.json")
+    etag = store.head("models/model.json").etag
+    store.calls.clear()
+    first = read_file("mem://artifacts/models/model.json")
+    second = read_file("mem://artifacts/models/model.json")
+
+    assert first == second == artifact
+    assert written_path == remote.cache_path("models/model.json", etag)
+    assert store.calls_of("get_range") == []
+    assert len(store.calls_of("head")) == 2
+
+
+def test_batched_remote_io_reports_timings_by_uri(tmp_path, remote):
+    objects = {"mem://artifacts/a.json": {"a": 1}, tmp_path / "b.json": {"b": 2}}
+
+    written = write_many(objects)
+    loaded = read_many(list(objects))
+
+    assert [timing.path for timing in written.timings] == ["mem://artifacts/a.json", (tmp_path / "b.json").resolve()]
+    assert [timing.path for timing in loaded.timings] == [timing.path for timing in written.timings]
+    assert loaded.results == objects
+
+
+def test_changed_remote_object_is_downloaded_in_parts(tmp_path, remote, store):
+    write_file("old", "mem://artifacts/notes.txt")
+    other = RemoteFileSystem(store, cache_dir=tmp_path / "other-cache", part_size=1_024)
+    other.upload(write_file("x" * 3_000, tmp_path / "notes.txt"), "notes.txt")
+    store.calls.clear()
+
+    assert read_file("mem://artifacts/notes.txt") == "x" * 3_000
+    assert [call[2:] for call in store.calls_of("get_range")] == [(0, 1_024), (1_024, 2_048), (2_048, 3_000)]
+    assert len(list((tmp_path / "cache" / "objects").glob("*/*"))) == 1
+
+
+def test_large_upload_is_multipart_with_s3_etag(tmp_path, remote, store):
+    array = np.arange(1_000, dtype=np.float64)
+
+    write_file(array, "mem://artifacts/array.npy")
+
+    parts = store.calls_of("upload_part")
+    assert [call[2] for call in sorted(parts)] == list(range(1, len(parts) + 1))
+    assert len(parts) > 1
+    assert store.calls_of("put") == []
+    assert store.head("array.npy").etag.endswith(f"-{len(parts)}")
+    np.testing.assert_array_equal(read_file("mem://artifacts/array.npy"), array)
+    assert not list((tmp_path / "bucket" / "uploads").iterdir())
+
+
+def test_failed_multipart_upload_is_aborted(tmp_path, store):
+    class FailingStore(RecordingStore):
+        def upload_part(self, key, upload_id, part_number, data):
+            if part_number == 2:
+                msg = "connection reset"
+                raise OSError(msg)
+            return super().upload_part(key, upload_id, part_number, data)
+
+    failing = FailingStore(tmp_path / "bucket")
+    local_path = tmp_path / "data.bin"
+    local_path.write_bytes(b"x" * 5_000)
+
+    with pytest.raises(OSError, match="connection reset"):
+        RemoteFileSystem(failing, cache_dir=tmp_path / "cache", part_size=1_024).upload(local_path, "data.bin")
+
+    assert not list((tmp_path / "bucket" / "uploads").iterdir())
+    with pytest.raises(FileNotFoundError):
+        failing.head("data.bin")
+
+
+def test_remote_parquet_projection_uses_ranged_reads(remote, store):
+    df = pd.DataFrame({f"c{i}": np.arange(20_000, dtype=np.float64) * i for i in range(8)})
+    write_dataframe(df, "mem://artifacts/table.parquet", row_group_size=5_000)
+    size = store.head("table.parquet").size
+    store.calls.clear()
+
+    projected = read_dataframe("mem://artifacts/table.parquet", columns=["c3"], filters=[("c1", "<", 5_000)])
+
+    pd.testing.assert_frame_equal(projected, df.loc[:4_999, ["c3"]])
+    fetched = sum(call[3] - call[2] for call in store.calls_of("get_range"))
+    assert 0 < fetched < size / 4
+    pd.testing.assert_frame_equal(read_dataframe("mem://artifacts/table.parquet"), df)
+
+
+def test_iter_remote_parquet(remote):
+    df = pd.DataFrame({"x": np.arange(25), "y": np.arange(25) % 3})
+    write_dataframe(df, "mem://artifacts/rows.parquet")
+
+    batches = list(iter_dataframe("mem://artifacts/rows.parquet", batch_rows=10, columns=["x"]))
+
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+    pd.testing.assert_frame_equal(pd.concat(batches, ignore_index=True), df[["x"]])
+
+
+def test_remote_parquet_directory_through_arrow_filesystem(tmp_path, remote):
+    for part in range(3):
+        write_dataframe(pd.DataFrame({"x": [part]}), f"mem://artifacts/parts/part={part}/data.parquet")
+
+    table = pq.read_table("parts", filesystem=remote.arrow_filesystem(), partitioning="hive")
+
+    assert sorted(table.column("x").to_pylist()) == [0, 1, 2]
+    with pytest.raises(NotImplementedError, match="read-only"):
+        remote.arrow_filesystem().delete_file("parts/part=0/data.parquet")
+
+
+def test_s3_object_store_with_compatible_client(tmp_path):
+    backing = LocalDirectoryStore(tmp_path / "s3")
+    s3 = S3ObjectStore(FakeS3Client(backing), "bucket")
+    filesystem = RemoteFileSystem(s3, cache_dir=tmp_path / "cache", part_size=1_024)
+    local_path = tmp_path / "data.bin"
+    local_path.write_bytes(bytes(range(256)) * 20)
+
+    info = filesystem.upload(local_path, "nested/data.bin")
+
+    assert s3.head("nested/data.bin") == info
+    assert info.etag.endswith("-5")
+    assert filesystem.download("nested/data.bin").read_bytes() == local_path.read_bytes()
+    assert s3.get_range("nested/data.bin", 10, 13) == bytes([10, 11, 12])
+    assert [obj.key for obj in s3.list_objects("nested/")] == ["nested/data.bin"]
+    with pytest.raises(FileNotFoundError):
+        s3.head("missing.bin")
+
+
+def test_ranged_object_file_reads_only_requested_bytes(store):
+    store.put("blob.bin", bytes(range(100)))
+    file = RemoteFileSystem(store).open("blob.bin")
+    store.calls.clear()
+
+    file.seek(-10, io.SEEK_END)
+    assert file.read(4) == bytes([90, 91, 92, 93])
+    assert file.read() == bytes([94, 95, 96, 97, 98, 99])
+    assert store.calls_of("get_range") == [("get_range", "blob.bin", 90, 94), ("get_range", "blob.bin", 94, 100)]
+
+
+def test_resolve_uri(remote):
+    assert resolve_uri(Path("mem://artifacts/x.pkl")) is None
+    assert resolve_uri("relative/x.pkl") is None
+    assert resolve_uri("mem://artifacts/a/x.pkl") == (remote, "a/x.pkl")
+    with pytest.raises(ValueError, match="No object store"):
+        resolve_uri("s3://unregistered/x.pkl")
+    with pytest.raises(ValueError, match="Invalid object key"):
+        write_file(1, "mem://artifacts/../escape.json")